@@ -0,0 +1,146 @@
+"""
+Headless benchmark of the cost of importing `abracatabra`.
+
+Each case runs in a fresh interpreter, so nothing is cached in `sys.modules`.
+Measures the time to import the package, and the time until the first window
+exists (which is when the QApplication and icons are created), and writes the
+results as JSON. A previous result file can be given as a baseline to flag
+regressions.
+
+Usage:
+    python benchmarks/bench_import.py --output import.json
+    python benchmarks/bench_import.py --repeat 5 --baseline import.json
+"""
+
+import os
+
+# must be set before Qt is imported (also inherited by the subprocesses)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+# code run in a fresh interpreter; prints the measured times as JSON
+CASES = {
+    "import": """
+import json, time
+start = time.perf_counter()
+import abracatabra
+elapsed = time.perf_counter() - start
+from matplotlib.backends.qt_compat import QtWidgets
+print(json.dumps({
+    "import_ms": elapsed * 1e3,
+    "app_created": QtWidgets.QApplication.instance() is not None,
+}))
+""",
+    "first_window": """
+import json, time
+start = time.perf_counter()
+import abracatabra
+imported = time.perf_counter()
+window = abracatabra.TabbedPlotWindow(open_window=False)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "import_ms": (imported - start) * 1e3,
+    "total_ms": elapsed * 1e3,
+}))
+""",
+}
+
+
+def run_case(code: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    result = {}
+    for key in runs[0]:
+        if isinstance(runs[0][key], bool):
+            result[key] = runs[0][key]
+        else:
+            result[key] = float(np.median([run[key] for run in runs]))
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints the change in import time relative to the baseline and returns the
+    names of the cases that got slower by more than `threshold` (fraction).
+    """
+    regressions = []
+    print(f"\n{'case':<16} {'base ms':>9} {'ms':>9} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base_ms = baseline[name]["import_ms"]
+        change = result["import_ms"] / base_ms - 1.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        import_ms = result["import_ms"]
+        print(f"{name:<16} {base_ms:9.1f} {import_ms:9.1f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fractional increase counted as a regression (default: 0.2)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in CASES.items():
+        results[name] = run_case(code, args.repeat)
+        times = ", ".join(
+            f"{key} {value:.1f}"
+            for key, value in results[name].items()
+            if not isinstance(value, bool)
+        )
+        print(f"{name:<16} {times}")
+        if results[name].get("app_created"):
+            print(f"{'':<16} importing created a QApplication")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than", end=" ")
+            print(f"{args.threshold:.0%}.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
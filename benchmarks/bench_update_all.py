@@ -0,0 +1,198 @@
+"""
+Headless benchmark of `TabbedPlotWindow.update_all()` throughput.
+
+Measures frames per second across a matrix of window layouts and tab contents
+and writes the results as JSON. A previous result file can be given as a
+baseline to flag regressions.
+
+Usage:
+    python benchmarks/bench_update_all.py --output bench.json
+    python benchmarks/bench_update_all.py --quick --baseline bench.json
+"""
+
+import os
+
+# must be set before Qt is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.qt_compat import QT_API, QtWidgets
+
+import abracatabra
+from abracatabra import TabbedPlotWindow
+
+
+FULL_MATRIX = {
+    "windows": [1, 4],
+    "grid": [(1, 1), (2, 2)],
+    "tabs": [1, 5],
+    "blit": [False, True],
+    "line_length": [1_000, 100_000],
+    "widget": ["figure", "custom"],
+}
+
+QUICK_MATRIX = {
+    "windows": [1, 2],
+    "grid": [(1, 1), (2, 1)],
+    "tabs": [1, 3],
+    "blit": [False, True],
+    "line_length": [1_000],
+    "widget": ["figure", "custom"],
+}
+
+
+def case_name(case: dict) -> str:
+    rows, cols = case["grid"]
+    blit = "blit" if case["blit"] else "noblit"
+    return (
+        f"w{case['windows']}_g{rows}x{cols}_t{case['tabs']}_{blit}"
+        f"_n{case['line_length']}_{case['widget']}"
+    )
+
+
+def iter_cases(matrix: dict):
+    """
+    Yields every combination of the matrix, skipping combinations that do not
+    apply to custom widgets (blitting and line length).
+    """
+    keys = list(matrix)
+    for values in itertools.product(*(matrix[k] for k in keys)):
+        case = dict(zip(keys, values))
+        if case["widget"] == "custom":
+            if case["blit"] or case["line_length"] != matrix["line_length"][0]:
+                continue
+        yield case
+
+
+def build_windows(case: dict) -> None:
+    rows, cols = case["grid"]
+    n = case["line_length"]
+    x = np.linspace(0, 10, n)
+    for w in range(case["windows"]):
+        window = TabbedPlotWindow(
+            window_id=f"bench {w}", nrows=rows, ncols=cols, size=(640, 480)
+        )
+        for r, c in itertools.product(range(rows), range(cols)):
+            for t in range(case["tabs"]):
+                tab_id = f"tab {t}"
+                if case["widget"] == "custom":
+                    label = QtWidgets.QLabel("0")
+                    window.add_custom_tab(label, tab_id, row=r, col=c)
+                    callback = lambda i, label=label: label.setText(str(i))
+                else:
+                    fig = window.add_figure_tab(tab_id, blit=case["blit"], row=r, col=c)
+                    ax = fig.add_subplot()
+                    ax.set_ylim(-1.1, 1.1)
+                    (line,) = ax.plot(x, np.sin(x))
+                    if case["blit"]:
+                        window.register_animated_artists([line], tab_id, r, c)
+                    callback = lambda i, line=line: line.set_ydata(np.sin(x + 0.1 * i))
+                window.register_animation_callback(callback, tab_id, r, c)
+
+
+def run_case(case: dict, frames: int, warmup: int) -> dict:
+    build_windows(case)
+    app = QtWidgets.QApplication.instance()
+    assert app is not None
+    app.processEvents()
+    for i in range(1, warmup + 1):
+        TabbedPlotWindow.update_all(0.0, i)
+    frame_times = []
+    start = time.perf_counter()
+    for i in range(warmup + 1, warmup + frames + 1):
+        frame_start = time.perf_counter()
+        TabbedPlotWindow.update_all(0.0, i)
+        frame_times.append(time.perf_counter() - frame_start)
+    elapsed = time.perf_counter() - start
+    TabbedPlotWindow.close_all_windows()
+    app.processEvents()
+    frame_ms = np.array(frame_times) * 1e3
+    return {
+        **case,
+        "grid": list(case["grid"]),
+        "fps": frames / elapsed,
+        "frame_ms_mean": float(frame_ms.mean()),
+        "frame_ms_p95": float(np.percentile(frame_ms, 95)),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints the change in fps relative to the baseline and returns the names of
+    the cases that regressed by more than `threshold` (fraction).
+    """
+    regressions = []
+    print(f"\n{'case':<44} {'base fps':>9} {'fps':>9} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base_fps = baseline[name]["fps"]
+        change = result["fps"] / base_fps - 1.0
+        flag = ""
+        if change < -threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<44} {base_fps:9.1f} {result['fps']:9.1f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fractional fps drop counted as a regression (default: 0.1)",
+    )
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--quick", action="store_true", help="use a smaller matrix")
+    args = parser.parse_args()
+
+    matrix = QUICK_MATRIX if args.quick else FULL_MATRIX
+    results = {}
+    for case in iter_cases(matrix):
+        name = case_name(case)
+        results[name] = run_case(case, args.frames, args.warmup)
+        print(f"{name:<44} {results[name]['fps']:9.1f} fps")
+
+    report = {
+        "meta": {
+            "abracatabra": abracatabra.__version__,
+            "matplotlib": matplotlib.__version__,
+            "qt_api": QT_API,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "frames": args.frames,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than", end=" ")
+            print(f"{args.threshold:.0%}.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,13 +14,41 @@ This package provides:
 - `update_all_windows`: Updates all open tabbed plot windows.
 - `animate_all_windows`: Animates all open tabbed plot windows based on
     registered callbacks.
+- `update_all_windows_async`, `animate_all_windows_async`: Awaitable versions
+    of `update_all_windows` and `animate_all_windows` for asyncio code.
+- `export_animation`: Renders the animation callbacks of all windows to a
+    video/GIF file or PNG sequence without showing the windows.
 - `abracatabra`: A fun function to display all open tabbed plot windows.
+- `AnimationResult`: Timing statistics returned by `animate_all_windows`.
+- `FrameScheduler`: Paces custom animation loops against a drift-corrected
+    clock while keeping the GUI responsive.
+- `FrameTimer`: Per-tab update timings, see
+    `TabbedPlotWindow.enable_frame_timing()`.
+- `FrameCache`: Rendered frames cache, see
+    `TabbedPlotWindow.enable_frame_cache()`.
+- `MemoryPolicy`: Frees the rendering memory of inactive tabs, see
+    `TabbedPlotWindow.set_memory_policy()`.
+- `DataQueue`: A thread-safe queue for pushing data to a tab from other
+    threads, see `TabbedPlotWindow.add_data_queue()`.
+- `StreamingLine`: A fixed-length line for live data, see
+    `TabbedPlotWindow.add_streaming_line()`.
+- `TabLocation`: The location of a tab, see `TabbedPlotWindow.tabs()`.
+- `TraceRecorder`: Records a timeline of frame updates as a Chrome trace.
 - `is_interactive`: Checks if the current environment is interactive
     (e.g., IPython or Jupyter).
 - `__version__`: The version of the abracatabra package.
 """
 
 from .tabbed_plot_window import TabbedPlotWindow, is_interactive
+from .animation_export import export_animation, render_window
+from .frame_scheduler import AnimationResult, FrameScheduler
+from .data_queue import DataQueue
+from .frame_cache import FrameCache
+from .frame_timing import FrameTimer
+from .frame_trace import TraceRecorder
+from .memory_policy import MemoryPolicy
+from .streaming import StreamingLine
+from .tab_index import TabLocation
 from .__about__ import __version__
 
 
@@ -54,8 +82,9 @@ def update_all_windows(delay_seconds: float = 0.0, callback_idx: int = 0) -> flo
 
     Args:
         delay_seconds (float): The minimum delay in seconds before returning. If
-            windows are updated faster than this, this function will block until
-            `delay_seconds` seconds have passed. If the windows take longer than
+            windows are updated faster than this, this function will process GUI
+            events until `delay_seconds` seconds have passed (keeping the
+            windows responsive). If the windows take longer than
             `delay_seconds` seconds to update, the function execution time will
             be greater than `delay_seconds`.
     Returns:
@@ -79,7 +108,10 @@ def animate_all_windows(
     print_timing: bool = False,
     use_player: bool = False,
     hold: bool = True,
-) -> None:
+    realtime: bool = False,
+    trace_file: str | None = None,
+    prefetch: int = 0,
+) -> AnimationResult:
     """
     Animates all created windows by repeatedly calling `update_all_windows()` in
     a loop for the given number of frames. This is a convenience function for
@@ -111,12 +143,101 @@ def animate_all_windows(
         hold (bool): Specify whether to keep the windows open (blocking code)
             at the last frame when the animation is complete. Essentially
             whether to call `show_all_windows()` at the end or not.
+        realtime (bool): If True, the frame to draw is computed from the
+            wall-clock time (`elapsed * speed_scale / ts`) and frames are
+            dropped whenever drawing falls behind, so the animation always
+            takes `frames * ts / speed_scale` seconds. Ignored when using the
+            animation player.
+        trace_file (str|None): If given, a timeline of the animation (spans per
+            frame, window, and tab callback/draw plus the requested vs. actual
+            frame deadlines) is written to this file in the Chrome trace-event
+            format, or as JSON lines if it ends with ".jsonl". Open it in
+            chrome://tracing or https://ui.perfetto.dev.
+        prefetch (int): When using the animation player, the number of frames
+            before and after the current frame to render in the background
+            while paused, so stepping through frames is instant. Enables the
+            frame cache if it is not enabled yet. Each prefetched frame calls
+            the animation callbacks twice (to render it and to restore the
+            displayed frame).
+    Returns:
+        result (AnimationResult): Timing statistics of the animation, e.g., how
+            many frames were drawn and dropped.
     See Also
     -----
     `update_all_windows()`: updates all open tabbed plot windows.
     """
-    TabbedPlotWindow.animate_all(
-        frames, ts, step, speed_scale, print_timing, use_player, hold
+    return TabbedPlotWindow.animate_all(
+        frames,
+        ts,
+        step,
+        speed_scale,
+        print_timing,
+        use_player,
+        hold,
+        realtime,
+        trace_file,
+        prefetch,
+    )
+
+
+async def update_all_windows_async(
+    delay_seconds: float = 0.0, callback_idx: int = 0
+) -> float:
+    """
+    Same as `update_all_windows()`, but awaits the delay instead of blocking,
+    so other asyncio tasks run while the windows stay responsive.
+
+    Args:
+        delay_seconds (float): The minimum delay in seconds before returning.
+        callback_idx (int): An index passed to the registered animation
+            callbacks.
+    Returns:
+        update_time (float): The amount of time (seconds) taken to update the
+            windows.
+    See Also
+    -----
+    `animate_all_windows_async()`: animates all windows from asyncio code.
+    """
+    return await TabbedPlotWindow.update_all_async(delay_seconds, callback_idx)
+
+
+async def animate_all_windows_async(
+    frames: int,
+    ts: float,
+    step: int = 1,
+    speed_scale: float = 1.0,
+    print_timing: bool = False,
+    hold: bool = False,
+    realtime: bool = False,
+    trace_file: str | None = None,
+) -> AnimationResult:
+    """
+    Same as `animate_all_windows()`, but awaits between frames instead of
+    blocking, so it can run as an asyncio task next to other coroutines.
+    Cancelling the task stops the animation. The animation player (and its
+    `prefetch` option) is not supported.
+
+    Args:
+        frames (int): The number of frames to animate.
+        ts (float): The time step between frames in seconds.
+        step (int): The step size between frames.
+        speed_scale (float): A scaling factor for the speed of the animation.
+        print_timing (bool): If True, prints timing information for each frame
+            and a summary at the end.
+        hold (bool): If True, keeps processing GUI events (awaiting) after the
+            last frame until all windows are closed.
+        realtime (bool): If True, frames are dropped whenever drawing falls
+            behind the wall clock.
+        trace_file (str|None): If given, a timeline of the animation is written
+            to this file.
+    Returns:
+        result (AnimationResult): Timing statistics of the animation.
+    See Also
+    -----
+    `update_all_windows_async()`: updates all windows from asyncio code.
+    """
+    return await TabbedPlotWindow.animate_all_async(
+        frames, ts, step, speed_scale, print_timing, hold, realtime, trace_file
     )
 
 
@@ -153,7 +274,20 @@ __all__ = [
     "show_all_windows",
     "update_all_windows",
     "animate_all_windows",
+    "update_all_windows_async",
+    "animate_all_windows_async",
+    "export_animation",
+    "render_window",
     "abracatabra",
     "is_interactive",
+    "AnimationResult",
+    "FrameScheduler",
+    "FrameTimer",
+    "FrameCache",
+    "DataQueue",
+    "TraceRecorder",
+    "StreamingLine",
+    "TabLocation",
+    "MemoryPolicy",
     "__version__",
 ]
@@ -0,0 +1,281 @@
+import os
+import subprocess
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterator
+import numpy as np
+import matplotlib
+import matplotlib.image
+
+from .tabbed_plot_window import TabbedPlotWindow
+
+
+def render_window(
+    window: TabbedPlotWindow, callback_idx: int | None = None
+) -> np.ndarray:
+    """
+    Renders the active tab of every tab group in the window and tiles the
+    images like the window layout. The window does not need to be shown, and
+    active lazy tabs that have not been shown yet are built first.
+
+    Args:
+        window (TabbedPlotWindow): The window to render.
+        callback_idx (int|None): If given, the animation callback of each
+            active tab is called with this index before rendering.
+    Returns:
+        pixels (np.ndarray): A (height, width, 4) uint8 RGBA array.
+    """
+    row_major = window.tab_groups.row_major
+    lines = []
+    for groups in window.tab_groups.nested:
+        images = []
+        for tabs in groups:
+            widget = tabs.active_tab()  # lazy tabs are built before rendering
+            if widget is not None:
+                images.append(widget.render_frame(callback_idx))
+        if images:
+            lines.append(_concat(images, axis=1 if row_major else 0))
+    if not lines:
+        raise ValueError(f"Window '{window.id}' does not have any tabs to render.")
+    return _concat(lines, axis=0 if row_major else 1)
+
+
+def export_animation(
+    path: str | os.PathLike,
+    frames: int,
+    ts: float,
+    step: int = 1,
+    fps: float | None = None,
+    speed_scale: float = 1.0,
+    window_id: str | int | None = None,
+    print_progress: bool = False,
+    workers: int = 1,
+    builder: Callable[[], None] | None = None,
+    chunk_size: int = 32,
+) -> int:
+    """
+    Exports an animation to a video/GIF file or a PNG sequence by calling the
+    registered animation callbacks frame by frame and rendering each window
+    off-screen. Frames are rendered as fast as possible (no real-time pacing)
+    and windows are never shown, so create them with `open_window=False` if
+    you don't want them to appear.
+
+    Args:
+        path (str|PathLike): The output file. If it contains a format field,
+            e.g., "frames/frame_{:05d}.png", a PNG is written per frame.
+            Otherwise, the frames are piped to ffmpeg, which picks the encoder
+            from the extension (e.g., ".mp4", ".gif"). The ffmpeg executable
+            is taken from `matplotlib.rcParams["animation.ffmpeg_path"]`.
+        frames (int): The number of frames in the animation.
+        ts (float): The time step between frames in seconds.
+        step (int): Only every `step`-th frame is rendered.
+        fps (float|None): The frame rate of the video. Defaults to real time,
+            i.e., `speed_scale / (ts * step)`.
+        speed_scale (float): The playback speed relative to real time. Only
+            used if `fps` is None.
+        window_id (str|int|None): The window to render. If None, all windows
+            are rendered side by side.
+        print_progress (bool): If True, prints the number of rendered frames.
+        workers (int): The number of processes used to render frames. If more
+            than 1, the frames are split into chunks that are rendered in
+            parallel and reassembled in order before encoding. Requires
+            `builder`.
+        builder (Callable[[], None] | None): A picklable function (defined at
+            the top level of a module) that creates the windows, figures, and
+            animation callbacks. It is called once in each worker process to
+            rebuild the same windows the frames are rendered from, so it must
+            not depend on state created at runtime in this process. If the
+            builder is defined in a script, guard the script's code with
+            `if __name__ == "__main__":`.
+        chunk_size (int): The number of frames rendered per task by a worker.
+    Returns:
+        count (int): The number of frames written.
+    """
+    if frames < 1 or step < 1:
+        raise ValueError("Frames and step must be positive integers.")
+    if ts <= 0 or speed_scale <= 0:
+        raise ValueError("Time step and speed scale must be positive values.")
+    if workers > 1 and builder is None:
+        raise ValueError("A `builder` is required to render with multiple workers.")
+    if fps is None:
+        fps = speed_scale / (ts * step)
+
+    indices = list(range(0, frames, step))
+    if indices[-1] != frames - 1:
+        indices.append(frames - 1)  # always include the final frame
+
+    if workers > 1:
+        assert builder is not None
+        images = _render_parallel(indices, window_id, builder, workers, chunk_size)
+    else:
+        windows = _get_windows(window_id)
+        images = (_render_frame(windows, idx) for idx in indices)
+
+    writer = _FrameWriter(os.fspath(path), fps)
+    try:
+        for count, image in enumerate(images, start=1):
+            writer.write(image)
+            if print_progress:
+                print(f"rendered frame {count}/{len(indices)}", end="\r")
+    finally:
+        writer.close()
+    if print_progress:
+        print()
+    return len(indices)
+
+
+def _render_frame(windows: list[TabbedPlotWindow], callback_idx: int) -> np.ndarray:
+    images = [render_window(window, callback_idx) for window in windows]
+    return _concat(images, axis=1)
+
+
+def _render_parallel(
+    indices: list[int],
+    window_id: str | int | None,
+    builder: Callable[[], None],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[np.ndarray]:
+    """
+    Renders the frames in chunks on a process pool and yields them in order.
+    Only a few chunks per worker are in flight at a time to bound memory.
+    """
+    chunks = [indices[i : i + chunk_size] for i in range(0, len(indices), chunk_size)]
+    # Qt is not fork-safe, so always start fresh interpreters
+    context = multiprocessing.get_context("spawn")
+    # workers never open windows or need a display
+    environ = {"QT_QPA_PLATFORM": "offscreen"}
+    with ProcessPoolExecutor(
+        workers, context, initializer=_init_worker, initargs=(builder, environ)
+    ) as pool:
+        pending: deque[Future] = deque()
+        next_chunk = 0
+        while next_chunk < len(chunks) or pending:
+            while next_chunk < len(chunks) and len(pending) < 2 * workers:
+                task = pool.submit(_render_chunk, chunks[next_chunk], window_id)
+                pending.append(task)
+                next_chunk += 1
+            yield from pending.popleft().result()
+
+
+def _init_worker(builder: Callable[[], None], environ: dict[str, str]) -> None:
+    """
+    Sets up a worker process: updates its environment (before the builder
+    creates the QApplication) and rebuilds the windows.
+    """
+    os.environ.update(environ)
+    builder()
+
+
+def _render_chunk(indices: list[int], window_id: str | int | None) -> list[np.ndarray]:
+    windows = _get_windows(window_id)
+    return [_render_frame(windows, idx) for idx in indices]
+
+
+def _get_windows(window_id: str | int | None) -> list[TabbedPlotWindow]:
+    if window_id is None:
+        windows = list(TabbedPlotWindow._registry.values())
+    elif str(window_id) in TabbedPlotWindow._registry:
+        windows = [TabbedPlotWindow._registry[str(window_id)]]
+    else:
+        raise ValueError(f"Window with id '{window_id}' does not exist.")
+    if not windows:
+        raise ValueError("There are no windows to export.")
+    return windows
+
+
+def _concat(images: list[np.ndarray], axis: int) -> np.ndarray:
+    """
+    Concatenates RGBA images along the given axis (0: vertically,
+    1: horizontally), padding the other dimension with white.
+    """
+    other = 1 - axis
+    size = max(image.shape[other] for image in images)
+    padded = []
+    for image in images:
+        pad = [(0, 0), (0, 0), (0, 0)]
+        pad[other] = (0, size - image.shape[other])
+        padded.append(np.pad(image, pad, constant_values=255))
+    return np.concatenate(padded, axis=axis)
+
+
+class _FrameWriter:
+    """
+    Writes RGBA frames either as a PNG sequence or to an ffmpeg subprocess.
+    Every frame is padded/cropped to the size of the first frame (rounded up to
+    even dimensions, which most video codecs require).
+    """
+
+    def __init__(self, path: str, fps: float):
+        self.path = path
+        self.fps = fps
+        self.count = 0
+        self.png_sequence = "{" in path
+        self._shape: tuple[int, int] | None = None
+        self._process: subprocess.Popen | None = None
+        if self.png_sequence:
+            directory = os.path.dirname(path.format(0))
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def write(self, image: np.ndarray) -> None:
+        if self._shape is None:
+            height, width = image.shape[:2]
+            self._shape = (height + height % 2, width + width % 2)
+            if not self.png_sequence:
+                self._process = self._start_ffmpeg(*self._shape)
+        image = self._fit(image)
+        if self.png_sequence:
+            matplotlib.image.imsave(self.path.format(self.count), image)
+        else:
+            assert self._process is not None and self._process.stdin is not None
+            try:
+                self._process.stdin.write(image.tobytes())
+            except BrokenPipeError:
+                self._raise_ffmpeg_error()
+        self.count += 1
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+        assert self._process.stdin is not None
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self._process.wait() != 0:
+            self._raise_ffmpeg_error()
+        self._process = None
+
+    def _fit(self, image: np.ndarray) -> np.ndarray:
+        assert self._shape is not None
+        height, width = self._shape
+        image = image[:height, :width]
+        pad = ((0, height - image.shape[0]), (0, width - image.shape[1]), (0, 0))
+        return np.ascontiguousarray(np.pad(image, pad, constant_values=255))
+
+    def _start_ffmpeg(self, height: int, width: int) -> subprocess.Popen:
+        ffmpeg = matplotlib.rcParams["animation.ffmpeg_path"]
+        command = [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo"]
+        command += ["-pix_fmt", "rgba", "-s", f"{width}x{height}"]
+        command += ["-r", str(self.fps), "-i", "-"]
+        if not self.path.lower().endswith(".gif"):
+            command += ["-pix_fmt", "yuv420p"]
+        command.append(self.path)
+        try:
+            return subprocess.Popen(
+                command, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Could not run '{ffmpeg}'. Install ffmpeg, set "
+                "matplotlib.rcParams['animation.ffmpeg_path'], or export a PNG "
+                "sequence instead, e.g., 'frames/frame_{:05d}.png'."
+            ) from None
+
+    def _raise_ffmpeg_error(self) -> None:
+        assert self._process is not None and self._process.stderr is not None
+        self._process.wait()
+        error = self._process.stderr.read().decode(errors="replace").strip()
+        raise RuntimeError(f"ffmpeg failed to write '{self.path}': {error}")
@@ -18,6 +18,11 @@ class AnimationPlayer(QtWidgets.QWidget):
     controls all windows within the application that have registered animation
     callbacks.
 
+    While paused, the player can prefetch the frames around the current frame
+    in idle event-loop time (see `setup`), one frame at a time, so that
+    stepping to a neighboring frame is instant. Prefetching stops as soon as
+    the frame changes or the animation is played.
+
     Methods:
         `setup`: Sets up the animation player with the given parameters.
         `step_frame`: Steps the animation forward by one step if not paused.
@@ -67,6 +72,15 @@ class AnimationPlayer(QtWidgets.QWidget):
         self.jump = 10
         self.update_callback = lambda i: None
 
+        # prefetching of neighboring frames while paused
+        self.prefetch_callback: Optional[Callable[[int], bool]] = None
+        self.prefetch_radius = 0
+        self.prefetch_delay_ms = 100
+        self._prefetch_queue: list[int] = []
+        self._prefetch_timer = QtCore.QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._prefetch_next)
+
         main_layout = QtWidgets.QVBoxLayout()
         self.setLayout(main_layout)
         self.std_icon = self.style().standardIcon
@@ -196,6 +210,7 @@ class AnimationPlayer(QtWidgets.QWidget):
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
+        self._cancel_prefetch()
         modifier = keys.ControlModifier
         match event.key():
             case (
@@ -238,6 +253,8 @@ class AnimationPlayer(QtWidgets.QWidget):
         ts: float,
         step: int,
         update_callback: Optional[Callable[[int], None]] = None,
+        prefetch_callback: Optional[Callable[[int], bool]] = None,
+        prefetch_radius: int = 0,
     ) -> None:
         """
         Sets up the animation player with the given parameters. This essentially
@@ -250,6 +267,13 @@ class AnimationPlayer(QtWidgets.QWidget):
             update_callback (Callable[[int], None] | None): A callback function
                 that is called whenever the frame is changed. The function should
                 take a single integer argument, which is the current frame index.
+            prefetch_callback (Callable[[int], bool] | None): A callback
+                function that renders the given frame in the background (e.g.,
+                into a frame cache) without changing the displayed frame. It
+                should return True if it did any work and False if the frame
+                was already available.
+            prefetch_radius (int): How many frames before and after the
+                current frame to prefetch while paused.
         """
         self.end_frame = frames - 1
         self.ts = ts
@@ -263,6 +287,8 @@ class AnimationPlayer(QtWidgets.QWidget):
         self.step = step
         self.jump = int(frames // 20)
         self.update_callback = update_callback or (lambda i: None)
+        self.prefetch_callback = prefetch_callback
+        self.prefetch_radius = prefetch_radius
 
         # relevant UI elements
         self.slider.setMaximum(frames - 1)
@@ -342,10 +368,12 @@ class AnimationPlayer(QtWidgets.QWidget):
         self.update_callback(self.current_frame)
 
     def _on_slider_changed(self, value: int):
+        self._cancel_prefetch()
         self.current_frame = value
         self.spin_box.setValue(self.current_frame)
         self._set_time_label()
         self.update_callback(self.current_frame)
+        self._schedule_prefetch()
 
     def _on_spinbox_changed(self):
         value = self.spin_box.value()
@@ -357,6 +385,41 @@ class AnimationPlayer(QtWidgets.QWidget):
         time = f"{time:>{self.t_digits}.{self.t_decimals}f}"
         self.time_label.setText(f"Sim Time: {time} / {self.end_time} s")
 
+    def _schedule_prefetch(self):
+        """
+        Queues the frames around the current frame, nearest first, and starts
+        prefetching them once the player has been idle for a short delay.
+        """
+        if not self.paused or self.prefetch_callback is None:
+            return
+        queue = []
+        for offset in range(1, self.prefetch_radius + 1):
+            for frame in (self.current_frame + offset, self.current_frame - offset):
+                if 0 <= frame <= self.end_frame:
+                    queue.append(frame)
+        self._prefetch_queue = queue
+        if queue:
+            self._prefetch_timer.start(self.prefetch_delay_ms)
+
+    def _prefetch_next(self):
+        """
+        Prefetches queued frames until one of them needs rendering, then
+        yields to the event loop so user input is handled before the next one.
+        """
+        if not self.paused or self.prefetch_callback is None:
+            self._prefetch_queue = []
+            return
+        while self._prefetch_queue:
+            frame = self._prefetch_queue.pop(0)
+            if self.prefetch_callback(frame):
+                break
+        if self._prefetch_queue:
+            self._prefetch_timer.start(0)
+
+    def _cancel_prefetch(self):
+        self._prefetch_timer.stop()
+        self._prefetch_queue = []
+
     def _pause(self):
         self.paused = True
         icon = self.std_icon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay)
@@ -366,8 +429,10 @@ class AnimationPlayer(QtWidgets.QWidget):
         self.prev_button.setEnabled(True)
         self.next_button.setEnabled(True)
         self.jump_forward_button.setEnabled(True)
+        self._schedule_prefetch()
 
     def _play(self):
+        self._cancel_prefetch()
         self.paused = False
         icon = self.std_icon(QtWidgets.QStyle.StandardPixmap.SP_MediaPause)
         self.play_button.setIcon(icon)
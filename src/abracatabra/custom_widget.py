@@ -1,7 +1,10 @@
-from matplotlib.backends.qt_compat import QtWidgets
+from matplotlib.backends.qt_compat import QtWidgets, QtGui
 from typing import Callable
+import time
+import numpy as np
 
 from .animation_player import AnimationPlayer
+from . import frame_hooks, frame_timing, update_tracker
 
 
 class CustomWidget(QtWidgets.QWidget):
@@ -14,6 +17,7 @@ class CustomWidget(QtWidgets.QWidget):
         `update_widget`: Updates the widget with the registered callback function.
         `register_animation_callback`: Registers a callback function for how to
             update the widget during an animation.
+        `render_frame`: Renders the widget to an RGBA array.
     """
 
     def __init__(
@@ -30,6 +34,10 @@ class CustomWidget(QtWidgets.QWidget):
             parent: The parent widget for this widget.
         """
         super().__init__(parent)
+        self.tab_id = ""  # set by the containing tab group
+        self.window_id = ""  # set by the containing window
+        self.row = 0  # set by the containing tab group
+        self.col = 0
         layout = QtWidgets.QVBoxLayout()
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -60,8 +68,19 @@ class CustomWidget(QtWidgets.QWidget):
         if self._callback_registered and callback_idx == self._latest_callback_idx:
             # print("Skipping custom widget update; same frame as last time.")
             return
+        timer = frame_timing.active_timer()
+        hooks = frame_hooks.enabled
+        if hooks:
+            ids = (self.window_id, self.tab_id, callback_idx, self.row, self.col)
+            frame_hooks.fire(frame_hooks.CALLBACK_START, *ids)
+        start = time.perf_counter() if timer is not None else 0.0
         self._animation_callback(callback_idx)
         self._latest_callback_idx = callback_idx
+        if timer is not None:
+            key = (self.window_id, self.row, self.col, self.tab_id)
+            timer.record(*key, time.perf_counter() - start)
+        if hooks:
+            frame_hooks.fire(frame_hooks.CALLBACK_END, *ids)
 
     def register_animation_callback(self, callback: Callable[[int], None]) -> None:
         """
@@ -77,3 +96,27 @@ class CustomWidget(QtWidgets.QWidget):
         """
         self._animation_callback = callback
         self._callback_registered = True
+        update_tracker.mark_animated(self.window_id)
+
+    def render_frame(self, callback_idx: int | None = None) -> np.ndarray:
+        """
+        Renders the widget off-screen and returns the pixels. The widget does
+        not need to be shown.
+
+        Args:
+            callback_idx (int|None): If given, the registered animation
+                callback is called with this index before rendering.
+        Returns:
+            pixels (np.ndarray): A (height, width, 4) uint8 RGBA array.
+        """
+        if callback_idx is not None and self._callback_registered:
+            self._animation_callback(callback_idx)
+            self._latest_callback_idx = callback_idx
+        image = self.grab().toImage()
+        image = image.convertToFormat(QtGui.QImage.Format.Format_RGBA8888)
+        width, height = image.width(), image.height()
+        bits = image.constBits()
+        if hasattr(bits, "setsize"):  # PyQt returns a sip.voidptr
+            bits.setsize(image.sizeInBytes())
+        rows = np.frombuffer(bits, np.uint8).reshape(height, image.bytesPerLine())
+        return rows[:, : width * 4].reshape(height, width, 4).copy()
@@ -0,0 +1,96 @@
+"""
+Thread-safe hand-off of data from background threads (e.g., a simulation or
+data acquisition loop) to the GUI thread, where plots can be updated safely.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable
+from matplotlib.backends.qt_compat import QtCore
+
+
+class DataQueue(QtCore.QObject):
+    """
+    A bounded queue that producer threads push payloads (e.g., NumPy arrays)
+    into and the GUI thread drains in batches. Pushing never blocks: when the
+    queue is full, the oldest payload is dropped, so a producer never waits
+    for rendering. The first payload pushed into an empty queue posts a
+    queued Qt signal, so the queue is drained once by the event loop of the
+    GUI thread (e.g., while `update_all()` waits or `show_all()` blocks) with
+    every payload that arrived in the meantime.
+
+    Payloads are passed by reference, so a producer must not modify a
+    payload after pushing it (push a copy if the buffer is reused).
+
+    Methods:
+        `put`: Pushes a payload (any thread).
+        `drain`: Passes all queued payloads to the handler (GUI thread).
+    Attributes:
+        `maxlen`: The maximum number of queued payloads.
+        `dropped`: The number of payloads dropped because the queue was full.
+    """
+
+    _ready = QtCore.Signal()
+
+    def __init__(
+        self,
+        handler: Callable[[list[Any]], None],
+        maxlen: int = 1000,
+        parent: QtCore.QObject | None = None,
+    ):
+        """
+        Initializes the DataQueue. Must be created in the GUI thread.
+
+        Args:
+            handler (Callable[[list[Any]], None]): Called in the GUI thread with
+                the queued payloads, oldest first, e.g., to append them to a
+                `StreamingLine` or set them on an artist.
+            maxlen (int): The maximum number of queued payloads.
+            parent (QObject|None): The Qt parent that owns the queue.
+        """
+        super().__init__(parent)
+        if maxlen < 1:
+            raise ValueError("The maximum length must be a positive integer.")
+        self.maxlen = maxlen
+        self.dropped = 0
+        self._handler = handler
+        self._items: deque[Any] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._posted = False
+        self._ready.connect(self.drain, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, payload: Any) -> None:
+        """
+        Pushes a payload, dropping the oldest queued payload if the queue is
+        full. Safe to call from any thread, and never blocks on rendering.
+
+        Args:
+            payload (Any): The data to pass to the handler.
+        """
+        with self._lock:
+            if len(self._items) == self.maxlen:
+                self.dropped += 1
+            self._items.append(payload)
+            post = not self._posted
+            self._posted = True
+        if post:
+            self._ready.emit()
+
+    def drain(self) -> int:
+        """
+        Passes all queued payloads to the handler in one batch. Called
+        automatically in the GUI thread after payloads are pushed.
+
+        Returns:
+            count (int): The number of payloads handled.
+        """
+        with self._lock:
+            batch = list(self._items)
+            self._items.clear()
+            self._posted = False
+        if batch:
+            self._handler(batch)
+        return len(batch)
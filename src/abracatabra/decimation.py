@@ -0,0 +1,270 @@
+"""
+Pixel-aware decimation of long line plots. A line is reduced to the minimum
+and maximum sample of each horizontal pixel, which looks the same as drawing
+every sample (the extrema and the shape are preserved) but is much faster to
+draw. A precomputed min/max pyramid keeps re-decimating after zooming or
+panning independent of the length of the line.
+"""
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, buckets: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a line to the minimum and maximum sample of each of `buckets`
+    equally wide x intervals, in the order they occur. The first and last
+    samples are always kept, so at most `2 * buckets + 2` samples are
+    returned. NaNs are ignored unless a whole interval is NaN, in which case
+    the line is still broken there.
+
+    Args:
+        x (np.ndarray): The x values, sorted in increasing order.
+        y (np.ndarray): The y values.
+        buckets (int): The number of intervals, e.g., the axes width in pixels.
+    Returns:
+        (x, y) (tuple[np.ndarray, np.ndarray]): The decimated samples.
+    """
+    keep = minmax_indices(x, y, buckets)
+    return x[keep], y[keep]
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Same as `minmax_decimate`, but returns the sorted indices of the samples
+    to keep.
+    """
+    n = len(x)
+    if n <= 2 * buckets + 2:
+        return np.arange(n)
+    edges = np.linspace(x[0], x[-1], buckets + 1)
+    starts = np.unique(np.searchsorted(x, edges[:-1], side="left"))
+    starts = starts[starts < n]
+    counts = np.diff(np.append(starts, n))
+    index = np.arange(n)
+    keep = [np.array([0, n - 1])]
+    for reduce in (np.fmin, np.fmax):
+        extrema = reduce.reduceat(y, starts)
+        is_extreme = y == np.repeat(extrema, counts)
+        first = np.minimum.reduceat(np.where(is_extreme, index, n), starts)
+        # intervals that are all NaN have no extremum; keep their first sample
+        keep.append(np.where(first == n, starts, first))
+    return np.unique(np.concatenate(keep))
+
+
+class MinMaxPyramid:
+    """
+    A multi-resolution index of the minimum and maximum of a series. Level 0
+    stores the index of the minimum and maximum sample of every block of
+    `block` samples, and each following level merges pairs of blocks of the
+    previous level. It is built once in O(n), after which the extrema of any
+    index range can be looked up at a resolution of about one block per
+    bucket in O(buckets), independent of the length of the range.
+
+    Methods:
+        `query`: Returns the indices of the extrema of a range of samples.
+    Attributes:
+        `block`: The number of samples per block at level 0.
+        `argmin`: The index of the minimum sample (NaNs are ignored).
+        `argmax`: The index of the maximum sample (NaNs are ignored).
+    """
+
+    def __init__(self, y: np.ndarray, block: int = 16):
+        """
+        Builds the pyramid.
+
+        Args:
+            y (np.ndarray): The values of the series.
+            block (int): The number of samples per block at level 0.
+        """
+        if block < 1:
+            raise ValueError("Block size must be a positive integer.")
+        self.block = block
+        n = len(y)
+        pad = (-n) % block
+        nan = np.isnan(y)
+        low = np.append(np.where(nan, np.inf, y), np.full(pad, np.inf))
+        high = np.append(np.where(nan, -np.inf, y), np.full(pad, -np.inf))
+        offsets = np.arange(0, n + pad, block)
+        rows = np.arange(len(offsets))
+        min_pos = low.reshape(-1, block).argmin(axis=1)
+        max_pos = high.reshape(-1, block).argmax(axis=1)
+        min_val = low.reshape(-1, block)[rows, min_pos]
+        max_val = high.reshape(-1, block)[rows, max_pos]
+        level = (min_val, offsets + min_pos, max_val, offsets + max_pos)
+        self._levels = [level]
+        while len(level[0]) > 1:
+            level = _merge_pairs(*level)
+            self._levels.append(level)
+        self.argmin = int(level[1][0])
+        self.argmax = int(level[3][0])
+
+    def query(self, start: int, stop: int, buckets: int) -> np.ndarray | None:
+        """
+        Returns the indices of the minimum and maximum sample of each block of
+        the coarsest level that still has at least `buckets` blocks within
+        `[start, stop)`, plus `start` and `stop - 1`. Blocks that overlap the
+        edges of the range are included in full.
+
+        Args:
+            start (int): The first index of the range.
+            stop (int): One past the last index of the range.
+            buckets (int): The minimum number of blocks in the range.
+        Returns:
+            indices (np.ndarray|None): The sorted indices, or None if the range
+                is shorter than `block * buckets` samples (i.e., finer than
+                level 0), in which case the raw samples should be used.
+        """
+        samples_per_bucket = (stop - start) / max(buckets, 1)
+        if samples_per_bucket < self.block:
+            return None
+        level = int(np.log2(samples_per_bucket / self.block))
+        level = min(level, len(self._levels) - 1)
+        size = self.block * 2**level
+        first, last = start // size, -(-stop // size)
+        _, min_idx, _, max_idx = self._levels[level]
+        edges = np.array([start, stop - 1])
+        indices = np.concatenate([min_idx[first:last], max_idx[first:last], edges])
+        return np.unique(indices)
+
+
+def _merge_pairs(
+    min_val: np.ndarray, min_idx: np.ndarray, max_val: np.ndarray, max_idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merges pairs of neighboring blocks of a pyramid level.
+    """
+    if len(min_val) % 2:
+        # duplicate the last block so every block has a pair
+        min_val = np.append(min_val, min_val[-1])
+        min_idx = np.append(min_idx, min_idx[-1])
+        max_val = np.append(max_val, max_val[-1])
+        max_idx = np.append(max_idx, max_idx[-1])
+    right_min = min_val[1::2] < min_val[0::2]
+    right_max = max_val[1::2] > max_val[0::2]
+    return (
+        np.where(right_min, min_val[1::2], min_val[0::2]),
+        np.where(right_min, min_idx[1::2], min_idx[0::2]),
+        np.where(right_max, max_val[1::2], max_val[0::2]),
+        np.where(right_max, max_idx[1::2], max_idx[0::2]),
+    )
+
+
+class DecimatedLine:
+    """
+    Keeps the full-resolution data of a matplotlib line and shows a min/max
+    decimated version of the visible part of it, with about 2 samples per
+    horizontal pixel of the axes. A `MinMaxPyramid` is built once per data
+    set, so after zooming or panning the visible samples are found with a
+    binary search and decimated in O(log n + pixels). The line is updated
+    whenever the x-limits or the width of the axes change, or new data is set
+    on the line (e.g., with `set_data` or `set_ydata` in an animation
+    callback).
+
+    A margin beyond the x-limits is included so that the line does not end
+    abruptly while panning, and the first/last samples and global extrema are
+    always kept so that the data limits (used for autoscaling) do not change.
+    Lines with x values that are not sorted (e.g., parametric curves) are
+    shown at full resolution.
+
+    Methods:
+        `sync`: Re-decimates the line if its data or the view changed.
+    Attributes:
+        `line`: The decimated matplotlib line.
+        `margin`: The fraction of the view width decimated on each side.
+        `x`: The full-resolution x values.
+        `y`: The full-resolution y values.
+    """
+
+    def __init__(self, line: Line2D, margin: float = 0.5):
+        """
+        Initializes the DecimatedLine.
+
+        Args:
+            line (Line2D): The line to decimate. Must belong to an axes.
+            margin (float): The fraction of the view width beyond each side of
+                the x-limits that is also decimated.
+        """
+        if line.axes is None:
+            raise ValueError("The line must belong to an axes.")
+        self.line = line
+        self.margin = margin
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._shown: tuple[object, object] = (None, None)
+        self._pyramid: MinMaxPyramid | None = None
+        self._view: tuple[float, float, int] | None = None
+
+    def sync(self) -> bool:
+        """
+        Re-decimates the line if its data, the x-limits, or the width of the
+        axes changed since the last call. This is called automatically before
+        the figure is drawn, when it is resized, and shortly after the x-limits
+        change (e.g., after zooming or panning).
+
+        Returns:
+            updated (bool): True if the data of the line was updated.
+        """
+        changed = self._capture_data()
+        axes = self.line.axes
+        view = (*axes.get_xlim(), max(int(axes.bbox.width), 1))
+        if not changed and view == self._view:
+            return False
+        self._view = view
+        if self._pyramid is None:
+            if not changed:
+                return False
+            self._show(self.x, self.y)
+        else:
+            keep = self._visible_indices(*view)
+            self._show(self.x[keep], self.y[keep])
+        return True
+
+    def _visible_indices(self, left: float, right: float, width: int) -> np.ndarray:
+        """
+        Returns the indices of the samples to show for the given view.
+        """
+        low, high = min(left, right), max(left, right)
+        pad = (high - low) * self.margin
+        start = int(np.searchsorted(self.x, low - pad, side="left")) - 1
+        stop = int(np.searchsorted(self.x, high + pad, side="right")) + 1
+        start, stop = max(start, 0), min(stop, len(self.x))
+        buckets = int(width * (1 + 2 * self.margin))
+        assert self._pyramid is not None
+        keep = self._pyramid.query(start, stop, buckets)
+        if keep is None:
+            xs, ys = self.x[start:stop], self.y[start:stop]
+            keep = start + minmax_indices(xs, ys, buckets)
+        pyramid = self._pyramid
+        fixed = [0, len(self.x) - 1, pyramid.argmin, pyramid.argmax]
+        return np.unique(np.concatenate([keep, fixed]))
+
+    def _capture_data(self) -> bool:
+        """
+        Stores the data of the line as the full-resolution data if it was
+        replaced since it was last decimated, and builds the pyramid.
+
+        Returns:
+            changed (bool): True if new data was set on the line.
+        """
+        xdata = self.line.get_xdata()
+        ydata = self.line.get_ydata()
+        if xdata is self._shown[0] and ydata is self._shown[1]:
+            return False
+        if xdata is self._shown[0] and len(ydata) == len(self.x):
+            # only y was set, e.g., by an animation callback
+            x = self.x
+        else:
+            x = np.asarray(xdata, dtype=float)
+        y = np.asarray(ydata, dtype=float)
+        self.x, self.y = x, y
+        self._pyramid = None
+        if len(x) > 2 and np.all(x[1:] >= x[:-1]):
+            self._pyramid = MinMaxPyramid(y)
+        return True
+
+    def _show(self, x: np.ndarray, y: np.ndarray) -> None:
+        self.line.set_data(x, y)
+        self._shown = (self.line.get_xdata(), self.line.get_ydata())
@@ -1,9 +1,19 @@
-from matplotlib.backends.qt_compat import QtWidgets, QtGui
+from matplotlib.backends.qt_compat import QtWidgets, QtGui, QtCore
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-from typing import Callable
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.figure import SubFigure
+from matplotlib.lines import Line2D
+from typing import Any, Callable, Iterable
+import time
+import numpy as np
 
 from .animation_player import AnimationPlayer
+from .data_queue import DataQueue
+from . import frame_cache, frame_hooks, frame_timing, update_tracker
+from .decimation import DecimatedLine
+from .streaming import StreamingLine
 from . import keys
 
 
@@ -17,6 +27,17 @@ class FigureWidget(QtWidgets.QWidget):
         `show_toolbar`: Show or hide the navigation toolbar.
         `register_animation_callback`: Registers a callback function for how to
             update the figure during an animation.
+        `register_animated_artists`: Registers artists to be redrawn with
+            managed blitting.
+        `add_streaming_line`: Adds a fixed-length line for live data.
+        `add_data_queue`: Adds a thread-safe queue for data from other threads.
+        `decimate_lines`: Draws long lines with about 2 samples per pixel.
+        `render_frame`: Renders the figure to an RGBA array with Agg.
+        `fit_to_size`: Lays out the widget at a size without showing it.
+        `prefetch_frame`: Renders a frame into the frame cache without
+            changing the displayed frame.
+        `release_renderer`: Frees the rendering memory of the canvas.
+        `renderer_nbytes`: Returns the rendering memory held by the canvas.
     """
 
     help_text = """Figure Controls:
@@ -53,6 +74,10 @@ class FigureWidget(QtWidgets.QWidget):
         """
         super().__init__(parent)
         self.blit = blit
+        self.tab_id = str(name)
+        self.window_id = ""  # set by the containing window
+        self.row = 0  # set by the containing tab group
+        self.col = 0
         layout = QtWidgets.QVBoxLayout()
         layout.setSpacing(0)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -65,6 +90,7 @@ class FigureWidget(QtWidgets.QWidget):
         self.canvas.get_default_filename = lambda: f"{name}.pdf"
 
         self.figure = self.canvas.figure
+        self.figure.stale_callback = self._on_stale
         # self.figure.set_layout_engine('tight') # slows down rendering ~2x
         # self.figure.tight_layout() # does not seem to do anything here
 
@@ -85,15 +111,39 @@ class FigureWidget(QtWidgets.QWidget):
         self._callback_registered = False
         self._latest_callback_idx = 0
 
+        # managed blitting state
+        self._animated_artists: list[Artist] = []
+        self._background = None
+        self._rendering_frame = False
+        self._prefetching = False
+        self._streaming_lines: list[StreamingLine] = []
+        self._decimated_lines: list[DecimatedLine] = []
+        self._decimated_axes: set[Axes] = set()
+        # re-decimate once zooming/panning pauses instead of on every event
+        self._decimation_timer = QtCore.QTimer(self)
+        self._decimation_timer.setSingleShot(True)
+        self._decimation_timer.setInterval(50)
+        self._decimation_timer.timeout.connect(self._redecimate)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+
+        # memory policy state (see `release_renderer`)
+        self.hidden_since = time.monotonic()
+        self._released = False
+        self._preview = QtWidgets.QLabel(self)
+        self._preview.setScaledContents(True)
+        self._preview.hide()
+
     def update_figure(self, callback_idx: int = 0) -> None:
         """
-        Updates the figure canvas if anything has changed. If blitting is
-        enabled, it will only redraw the parts of the figure that have changed.
-        If not, it will redraw the entire canvas. NOTE that blitting requires
-        the user to manage the background and artist updates manually, i.e., the
-        user must call `canvas.copy_from_bbox()` and `canvas.restore_region()`
-        at the appropriate times AND ensure that the artists are drawn before
-        calling this method.
+        Updates the figure canvas if anything has changed. If animated artists
+        have been registered (see `register_animated_artists`), the cached
+        background is restored and only those artists are redrawn. Otherwise,
+        if blitting is enabled, it will only blit the canvas, meaning the user
+        must manage the background and artist updates manually, i.e., call
+        `canvas.copy_from_bbox()` and `canvas.restore_region()` at the
+        appropriate times AND ensure that the artists are drawn before calling
+        this method. If not, it will redraw the entire canvas.
 
         Args:
             callback_idx (int): An index passed to the registered animation
@@ -105,15 +155,286 @@ class FigureWidget(QtWidgets.QWidget):
         if self._callback_registered and callback_idx == self._latest_callback_idx:
             # print("Skipping figure update; same frame as last time.")
             return
+        timer = frame_timing.active_timer()
+        cache = frame_cache.active_cache()
+        if timer is not None or frame_hooks.enabled or cache is not None:
+            self._update_figure_instrumented(callback_idx, timer, cache)
+            return
+        self._update_callback(callback_idx)
+        self._latest_callback_idx = callback_idx
+        if self._draw_canvas():
+            self.canvas.flush_events()
+
+    def _update_figure_instrumented(
+        self,
+        callback_idx: int,
+        timer: frame_timing.FrameTimer | None,
+        cache: frame_cache.FrameCache | None,
+    ) -> None:
+        """
+        Same as `update_figure`, but fires the frame hooks, records how long
+        each phase takes if timing is enabled, and reuses cached frames if
+        caching is enabled. The canvas is drawn the same way as without
+        instrumentation, i.e., a full redraw is scheduled with `draw_idle()`
+        and rendered while flushing events, so timing and hooks observe the
+        production draw path. Only frame caching draws synchronously, since it
+        copies the rendered pixels.
+        """
+        hooks = frame_hooks.enabled
+        ids = (self.window_id, self.tab_id, callback_idx, self.row, self.col)
+        if hooks:
+            frame_hooks.fire(frame_hooks.CALLBACK_START, *ids)
+        start = time.perf_counter()
         self._update_callback(callback_idx)
         self._latest_callback_idx = callback_idx
+        callback_end = time.perf_counter()
+        if hooks:
+            frame_hooks.fire(frame_hooks.CALLBACK_END, *ids)
+            frame_hooks.fire(frame_hooks.DRAW_START, *ids)
+        draw_start = time.perf_counter()
+        if cache is None:
+            drawn = self._draw_canvas()
+        else:
+            drawn = self._draw_cached(callback_idx, cache)
+        draw_end = time.perf_counter()
+        if drawn:
+            self.canvas.flush_events()
+        flush_end = time.perf_counter()
+        if hooks:
+            frame_hooks.fire(frame_hooks.DRAW_END, *ids)
+        if timer is not None:
+            timer.record(
+                self.window_id,
+                self.row,
+                self.col,
+                self.tab_id,
+                callback_end - start,
+                draw_end - draw_start,
+                flush_end - draw_end,
+            )
+
+    def _draw_canvas(self, sync: bool = False) -> bool:
+        """
+        Draws whatever has changed on the canvas.
+
+        Args:
+            sync (bool): If True, a full redraw happens immediately instead of
+                being scheduled with `draw_idle()`.
+        Returns:
+            drawn (bool): True if anything was drawn.
+        """
+        self._sync_lines()
+        if self._animated_artists:
+            # animated artists do not mark the figure as stale, so always blit
+            self._blit_animated_artists()
+            return True
         if not self.figure.stale:
-            return
+            return False
         if self.blit:
             self.canvas.blit()
+        elif sync:
+            self.canvas.draw()
         else:
             self.canvas.draw_idle()
-        self.canvas.flush_events()
+        return True
+
+    def _draw_cached(self, callback_idx: int, cache: frame_cache.FrameCache) -> bool:
+        """
+        Restores the frame from the cache if it has been rendered before at the
+        current canvas size and DPI. Otherwise, draws the canvas and caches the
+        rendered frame. The animation callback must already have been called,
+        so the artists match the frame even when the draw is skipped.
+
+        Returns:
+            drawn (bool): Always True.
+        """
+        key, nbytes = self._frame_key(callback_idx)
+        region = cache.get(key)
+        if region is not None:
+            self.canvas.restore_region(region)
+            self.canvas.blit(self.figure.bbox)
+            self.figure.stale = False
+            return True
+        self._rendering_frame = True
+        try:
+            self._draw_canvas(sync=True)
+        finally:
+            self._rendering_frame = False
+        cache.put(key, self.canvas.copy_from_bbox(self.figure.bbox), nbytes)
+        return True
+
+    def prefetch_frame(self, callback_idx: int) -> bool:
+        """
+        Renders a frame into the active frame cache (see
+        `TabbedPlotWindow.enable_frame_cache`) so that it can be shown
+        instantly later. The displayed frame is restored afterwards, so nothing
+        visibly changes. The artists are restored by calling the animation
+        callback again with the displayed index, so the callback runs twice
+        per prefetched frame and must only depend on the index it is given.
+
+        Args:
+            callback_idx (int): The index passed to the animation callback.
+        Returns:
+            rendered (bool): True if the frame was rendered, False if it was
+                already cached or can not be prefetched (no active cache or
+                callback, or the figure has pending changes).
+        """
+        cache = frame_cache.active_cache()
+        if cache is None or not self._callback_registered or self.figure.stale:
+            return False
+        key, nbytes = self._frame_key(callback_idx)
+        if key in cache:
+            return False
+        displayed = self.canvas.copy_from_bbox(self.figure.bbox)
+        # the figure is restored to the displayed frame, so the changes made
+        # while prefetching do not give the window anything new to draw
+        self._prefetching = True
+        try:
+            self._update_callback(callback_idx)
+            self._sync_lines()
+            self._rendering_frame = True
+            try:
+                self.canvas.draw()
+            finally:
+                self._rendering_frame = False
+            cache.put(key, self.canvas.copy_from_bbox(self.figure.bbox), nbytes)
+            self._update_callback(self._latest_callback_idx)
+            self._sync_lines()
+            self.canvas.restore_region(displayed)
+            self.figure.stale = False
+        finally:
+            self._prefetching = False
+        return True
+
+    def _frame_key(self, callback_idx: int) -> tuple[frame_cache.FrameKey, int]:
+        """
+        Returns the frame cache key of a frame at the current canvas size and
+        DPI, along with the size of the rendered frame in bytes.
+        """
+        width, height = self.canvas.get_width_height(physical=True)
+        dpi = self.figure.dpi
+        ids = (self.window_id, self.row, self.col, self.tab_id)
+        key = (*ids, callback_idx, width, height, dpi)
+        return key, width * height * 4
+
+    def render_frame(self, callback_idx: int | None = None) -> np.ndarray:
+        """
+        Renders the figure with Agg and returns the pixels, without needing
+        the widget to be shown or processing any GUI events.
+
+        Args:
+            callback_idx (int|None): If given, the registered animation
+                callback is called with this index before rendering.
+        Returns:
+            pixels (np.ndarray): A (height, width, 4) uint8 RGBA array.
+        """
+        if callback_idx is not None and self._callback_registered:
+            self._update_callback(callback_idx)
+            self._latest_callback_idx = callback_idx
+        self._sync_lines()
+        self.canvas.draw()
+        return np.array(self.canvas.buffer_rgba())
+
+    def renderer_nbytes(self) -> int:
+        """
+        Returns:
+            nbytes (int): The memory (bytes) held by the canvas for rendering,
+                i.e., the Agg buffer plus the cached blitting background.
+        """
+        if not hasattr(self.canvas, "renderer"):
+            return 0
+        width, height = self.canvas.get_width_height(physical=True)
+        buffers = 1 if self._background is None else 2
+        return buffers * width * height * 4
+
+    def release_renderer(self, preview_scale: float = 0.25) -> int:
+        """
+        Frees the rendering memory of the canvas (the Agg buffer and blitting
+        background). A downscaled snapshot of the figure is shown in its place
+        until the figure is drawn again, which happens as soon as the widget
+        is shown. The figure and its artists are kept, and the cached frames of
+        the tab (see `FrameCache`) are dropped. Figures that manage blitting
+        manually (`blit=True` without registered animated artists) are not
+        released, since their background would be lost.
+
+        Args:
+            preview_scale (float): The scale of the snapshot relative to the
+                canvas size.
+        Returns:
+            nbytes (int): The number of bytes released.
+        """
+        nbytes = self.renderer_nbytes()
+        if nbytes == 0 or (self.blit and not self._animated_artists):
+            return 0
+        # FigureCanvasAgg has no public API to free its renderer. As of
+        # matplotlib 3.11, it is cached in `renderer` and reused while
+        # `_lastKey` (size and DPI) matches, so clearing both makes the next
+        # draw allocate a new one. If a future release changes this, the
+        # renderer is kept rather than risking a broken canvas.
+        if not hasattr(self.canvas, "_lastKey"):
+            return 0
+        width, height = self.canvas.get_width_height(physical=True)
+        pixels = np.asarray(self.canvas.buffer_rgba())
+        image = QtGui.QImage(
+            pixels.tobytes(), width, height, QtGui.QImage.Format.Format_RGBA8888
+        )
+        size = QtCore.QSize(
+            max(int(width * preview_scale), 1), max(int(height * preview_scale), 1)
+        )
+        mode = QtCore.Qt.TransformationMode.SmoothTransformation
+        self._preview.setPixmap(QtGui.QPixmap.fromImage(image.scaled(size, mode=mode)))
+        del self.canvas.renderer
+        self.canvas._lastKey = None
+        self._background = None
+        self._released = True
+        cache = frame_cache.active_cache()
+        if cache is not None:
+            cache.invalidate(self.window_id, self.tab_id, self.row, self.col)
+        if self.isVisible():
+            self._show_preview()
+        return nbytes
+
+    def fit_to_size(self, size: QtCore.QSize) -> None:
+        """
+        Lays out the widget at the given size and resizes the figure to match
+        its canvas, without showing or drawing it. This lets figures in
+        inactive tabs be laid out (e.g., with `figure.tight_layout()`) at the
+        size they will have once shown. The canvas is drawn when it is shown.
+
+        Args:
+            size (QSize): The size of the widget, e.g., of the active tab.
+        """
+        self.resize(size)
+        layout = self.layout()
+        assert layout is not None
+        layout.activate()
+        ratio = self.canvas.device_pixel_ratio
+        width = self.canvas.width() * ratio / self.figure.dpi
+        height = self.canvas.height() * ratio / self.figure.dpi
+        if width > 0 and height > 0:
+            self.figure.set_size_inches(width, height, forward=False)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        if self._released:
+            self._show_preview()
+        elif self.figure.stale:
+            self._sync_lines()  # changed while hidden, e.g., by a queue
+            self.canvas.draw_idle()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        super().hideEvent(event)
+        self.hidden_since = time.monotonic()
+
+    def _show_preview(self) -> None:
+        """
+        Shows the snapshot over the canvas and schedules a redraw, after which
+        the snapshot is removed (see `_on_draw`).
+        """
+        self._preview.setGeometry(self.canvas.geometry())
+        self._preview.show()
+        self._preview.raise_()
+        self.canvas.draw_idle()
 
     def show_toolbar(self, show: bool = True) -> None:
         """
@@ -140,6 +461,198 @@ class FigureWidget(QtWidgets.QWidget):
         """
         self._update_callback = callback
         self._callback_registered = True
+        update_tracker.mark_animated(self.window_id)
+
+    def register_animated_artists(self, artists: Iterable[Artist]) -> None:
+        """
+        Registers artists that change every frame so that the widget can manage
+        blitting for you. The widget caches a snapshot of everything else in the
+        figure (the background) and only redraws the animated artists on each
+        update. The background is recaptured automatically whenever the full
+        figure is redrawn, e.g., after a resize, zoom/pan, or DPI change.
+        Registering artists enables blitting for this figure.
+
+        Args:
+            artists (Iterable[Artist]): The matplotlib artists (lines, patches,
+                text, etc.) to redraw on each update. The artists must belong
+                to the figure in this widget or one of its subfigures.
+        """
+        for artist in artists:
+            if not self._owns(artist):
+                raise ValueError("Animated artists must belong to this figure.")
+            if artist in self._animated_artists:
+                continue
+            artist.set_animated(True)
+            self._animated_artists.append(artist)
+        self._animated_artists.sort(key=lambda a: a.get_zorder())
+        self.blit = True
+        self._background = None
+        if not self._callback_registered:
+            # changes to animated artists do not mark the figure as stale
+            update_tracker.mark_always(self.window_id)
+
+    def add_streaming_line(
+        self, ax: Axes, capacity: int, autoscroll: bool = True, **line_kwargs
+    ) -> StreamingLine:
+        """
+        Adds a line for live data that keeps only the most recent `capacity`
+        samples in a preallocated ring buffer, so memory and draw time stay
+        constant while streaming. Append samples with `append`/`extend` on the
+        returned object; the line is updated whenever the figure is updated.
+
+        Args:
+            ax (Axes): The axes to add the line to. Must belong to this figure.
+            capacity (int): The maximum number of samples kept (and drawn).
+            autoscroll (bool): If True, the x-axis follows the buffered samples.
+            **line_kwargs: Keyword arguments passed to `ax.plot()`, e.g.,
+                color or label.
+        Returns:
+            stream (StreamingLine): The streaming line to append samples to.
+        """
+        if not self._owns(ax):
+            raise ValueError("The axes must belong to this figure.")
+        (line,) = ax.plot([], [], **line_kwargs)
+        stream = StreamingLine(line, capacity, autoscroll)
+        self._streaming_lines.append(stream)
+        return stream
+
+    def add_data_queue(
+        self, handler: Callable[[list[Any]], None], maxlen: int = 1000
+    ) -> DataQueue:
+        """
+        Adds a queue that other threads (e.g., a simulation) push data into
+        without blocking. The GUI thread drains it in batches with `handler`,
+        which should update the artists of this figure (e.g., extend a
+        `StreamingLine`), and the figure is redrawn if it is shown, so plots
+        stay live without calling `update_all()`. When full, the oldest data
+        is dropped.
+
+        Args:
+            handler (Callable[[list[Any]], None]): Called in the GUI thread
+                with the queued payloads, oldest first.
+            maxlen (int): The maximum number of queued payloads.
+        Returns:
+            queue (DataQueue): The queue to `put` payloads into.
+        """
+
+        def handle(batch: list[Any]) -> None:
+            handler(batch)
+            if self.isVisible() and self.figure.stale:
+                self._sync_lines()  # e.g., put new samples on streaming lines
+                self.canvas.draw_idle()
+
+        return DataQueue(handle, maxlen, parent=self)
+
+    def decimate_lines(self, *lines: Line2D) -> None:
+        """
+        Draws long lines with only the minimum and maximum sample of each
+        horizontal pixel of their axes, which looks the same as drawing every
+        sample but is much faster. The full-resolution data is kept, and the
+        lines are re-decimated when the figure is resized, new data is set on
+        them (e.g., in an animation callback), or shortly after the x-limits
+        stop changing (e.g., after zooming or while panning).
+
+        Args:
+            *lines (Line2D): The lines to decimate. If none are given, every
+                line currently in the figure is decimated.
+        """
+        if not lines:
+            lines = tuple(line for ax in self.figure.axes for line in ax.get_lines())
+        decimated = {d.line for d in self._decimated_lines}
+        for line in lines:
+            if not self._owns(line):
+                raise ValueError("Decimated lines must belong to this figure.")
+            if line not in decimated:
+                self._decimated_lines.append(DecimatedLine(line))
+            if line.axes not in self._decimated_axes:
+                self._decimated_axes.add(line.axes)
+                line.axes.callbacks.connect("xlim_changed", self._on_xlim_changed)
+        self._sync_lines()
+
+    def _owns(self, artist: Artist) -> bool:
+        """
+        Returns True if the artist belongs to the figure in this widget, either
+        directly or through (nested) subfigures.
+        """
+        figure = artist.figure
+        while isinstance(figure, SubFigure):
+            figure = figure.figure
+        return figure is self.figure
+
+    def _on_stale(self, figure, stale: bool) -> None:
+        """
+        Matplotlib stale callback of the figure. Lets `update_all` know that the
+        window has something new to draw.
+        """
+        if stale and not self._prefetching:
+            update_tracker.mark_dirty(self.window_id)
+
+    def _on_xlim_changed(self, ax: Axes) -> None:
+        self._decimation_timer.start()
+
+    def _redecimate(self) -> None:
+        """
+        Re-decimates lines for the current view and redraws if any changed.
+        """
+        updated = [line.sync() for line in self._decimated_lines]
+        if any(updated):
+            self.canvas.draw_idle()
+
+    def _sync_lines(self) -> None:
+        """
+        Updates streaming and decimated lines before the figure is drawn.
+        """
+        for stream in self._streaming_lines:
+            stream.sync()
+        for line in self._decimated_lines:
+            line.sync()
+
+    def _blit_animated_artists(self) -> None:
+        """
+        Restores the cached background and draws the animated artists on top of
+        it. A full draw is done instead if there is no valid background or a
+        non-animated artist has changed.
+        """
+        if self._background is None or self.figure.stale:
+            # `_on_draw` captures the background and draws the animated artists
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated_artists()
+        self.canvas.blit(self.figure.bbox)
+
+    def _draw_animated_artists(self) -> None:
+        for artist in self._animated_artists:
+            self.figure.draw_artist(artist)
+
+    def _on_draw(self, event) -> None:
+        """
+        Matplotlib `draw_event` callback. Invalidates cached frames if the
+        figure was redrawn for another reason than rendering a frame (e.g.,
+        zoom/pan). Captures the background after every full draw of the figure
+        and then draws the animated artists on top. Removes the snapshot shown
+        after the renderer was released.
+        """
+        if self._released:
+            self._released = False
+            self._preview.hide()
+            self._preview.clear()
+        cache = frame_cache.active_cache()
+        if cache is not None and not self._rendering_frame:
+            cache.invalidate(self.window_id, self.tab_id, self.row, self.col)
+        if not self._animated_artists:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated_artists()
+
+    def _on_resize(self, event) -> None:
+        """
+        Matplotlib `resize_event` callback. Invalidates the cached background
+        and re-decimates lines for the new width.
+        """
+        self._background = None
+        for line in self._decimated_lines:
+            line.sync()
 
     def _handle_keypress(self, event: QtGui.QKeyEvent) -> bool:
         """
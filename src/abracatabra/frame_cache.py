@@ -0,0 +1,194 @@
+"""
+Opt-in cache of rendered figure frames, so revisiting a frame (e.g., scrubbing
+the animation player back and forth) copies pixels instead of redrawing the
+figure. Frames are only cached while a `FrameCache` is enabled.
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+
+FrameKey = tuple[str, int, int, str, int, int, int, float]
+
+
+class FrameCache:
+    """
+    A least-recently-used cache of rendered canvas buffers with a memory
+    budget. Frames are keyed by `(window_id, row, col, tab_id, frame index,
+    width, height, dpi)`, where row and col locate the tab group (tab IDs are
+    only unique within a group), so a resized or rescaled canvas never reuses
+    stale pixels.
+    The frames of a tab are invalidated whenever the figure is redrawn for any
+    other reason than rendering a frame, e.g., after zooming or panning.
+
+    Cached frames assume the figure only depends on the frame index passed to
+    the animation callback.
+
+    Methods:
+        `get`: Returns a cached frame, marking it as recently used.
+        `put`: Adds a frame, evicting the least recently used frames if needed.
+        `invalidate`: Removes the cached frames of a window or tab.
+        `clear`: Removes all cached frames.
+        `set_budget`: Changes the memory budget.
+    Attributes:
+        `max_bytes`: The memory budget in bytes.
+        `nbytes`: The memory used by the cached frames in bytes.
+        `hits`: The number of successful lookups.
+        `misses`: The number of failed lookups.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initializes the FrameCache.
+
+        Args:
+            max_bytes (int): The memory budget in bytes.
+        """
+        if max_bytes <= 0:
+            raise ValueError("The memory budget must be positive.")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[FrameKey, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key: FrameKey) -> bool:
+        return key in self._frames
+
+    def get(self, key: FrameKey) -> Any | None:
+        """
+        Returns the cached frame for the key and marks it as recently used.
+
+        Args:
+            key (FrameKey): `(window_id, row, col, tab_id, frame index, width,
+                height, dpi)`.
+        Returns:
+            frame (Any|None): The cached frame, or None if it is not cached.
+        """
+        entry = self._frames.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._frames.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: FrameKey, frame: Any, nbytes: int) -> None:
+        """
+        Adds a frame to the cache, evicting the least recently used frames
+        until it fits within the budget. Frames larger than the whole budget
+        are not cached.
+
+        Args:
+            key (FrameKey): `(window_id, row, col, tab_id, frame index, width,
+                height, dpi)`.
+            frame (Any): The rendered frame.
+            nbytes (int): The memory used by the frame in bytes.
+        """
+        self._remove(key)
+        if nbytes > self.max_bytes:
+            return
+        self._frames[key] = (frame, nbytes)
+        self.nbytes += nbytes
+        self._evict()
+
+    def invalidate(
+        self,
+        window_id: str,
+        tab_id: str | None = None,
+        row: int | None = None,
+        col: int | None = None,
+    ) -> None:
+        """
+        Removes the cached frames of a window, or of a single tab.
+
+        Args:
+            window_id (str): The ID of the window.
+            tab_id (str|None): The ID of the tab. If None, the frames of every
+                tab in the window are removed.
+            row (int|None): The row of the tab group. If None, tabs in every
+                row match.
+            col (int|None): The column of the tab group. If None, tabs in every
+                column match.
+        """
+        for key in list(self._frames):
+            if (
+                key[0] == window_id
+                and (row is None or key[1] == row)
+                and (col is None or key[2] == col)
+                and (tab_id is None or key[3] == tab_id)
+            ):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Removes all cached frames.
+        """
+        self._frames.clear()
+        self.nbytes = 0
+
+    def set_budget(self, max_bytes: int) -> None:
+        """
+        Changes the memory budget, evicting frames if needed.
+
+        Args:
+            max_bytes (int): The memory budget in bytes.
+        """
+        if max_bytes <= 0:
+            raise ValueError("The memory budget must be positive.")
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes:
+            _, (_, nbytes) = self._frames.popitem(last=False)
+            self.nbytes -= nbytes
+
+    def _remove(self, key: FrameKey) -> None:
+        entry = self._frames.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+
+_active_cache: FrameCache | None = None
+
+
+def enable(max_megabytes: float = 256) -> FrameCache:
+    """
+    Enables caching of rendered frames. If caching is already enabled, the
+    active cache is returned with the new budget.
+
+    Args:
+        max_megabytes (float): The memory budget in megabytes.
+    Returns:
+        cache (FrameCache): The active cache.
+    """
+    global _active_cache
+    max_bytes = int(max_megabytes * 1024**2)
+    if _active_cache is None:
+        _active_cache = FrameCache(max_bytes)
+    else:
+        _active_cache.set_budget(max_bytes)
+    return _active_cache
+
+
+def disable() -> None:
+    """
+    Disables caching of rendered frames and releases the cached frames.
+    """
+    global _active_cache
+    if _active_cache is not None:
+        _active_cache.clear()
+    _active_cache = None
+
+
+def active_cache() -> FrameCache | None:
+    """
+    Returns:
+        cache (FrameCache | None): The active cache, or None if caching is
+            disabled.
+    """
+    return _active_cache
@@ -0,0 +1,115 @@
+"""
+Hooks that are called at each stage of a frame update, e.g., to attach a
+profiler or tracer only around the hot path. When no hooks are registered,
+the only cost is checking the module-level `enabled` flag.
+
+Every hook is called as `hook(window_id, tab_id, callback_idx, row, col)`,
+where `row` and `col` locate the tab group of the tab, since tab IDs are only
+unique within a group. The IDs are None when the stage does not belong to a
+specific window or tab:
+- "frame_start"/"frame_end": `(None, None, idx, None, None)` around
+    `update_all()`, or `(window_id, None, idx, None, None)` around
+    `TabbedPlotWindow.update()`.
+- "window_start"/"window_end": `(window_id, None, idx, None, None)` around the
+    update of each window. Windows with nothing new to draw, or that are
+    minimized or not exposed, are skipped and fire no events.
+- "callback_start"/"callback_end": `(window_id, tab_id, idx, row, col)` around
+    the animation callback of each active tab that is updated.
+- "draw_start"/"draw_end": `(window_id, tab_id, idx, row, col)` around drawing
+    each active figure tab, including flushing GUI events, which is when a
+    redraw scheduled with `draw_idle()` is rendered. Custom widget tabs do not
+    draw.
+
+For one frame of `update_all()`, the events are fired in the order:
+frame_start, then for each window: window_start, then for each active tab:
+callback_start, callback_end, draw_start, draw_end; then window_end; and
+finally frame_end. Registering hooks does not change how tabs are drawn.
+"""
+
+from typing import Callable
+
+
+FRAME_START = "frame_start"
+FRAME_END = "frame_end"
+WINDOW_START = "window_start"
+WINDOW_END = "window_end"
+CALLBACK_START = "callback_start"
+CALLBACK_END = "callback_end"
+DRAW_START = "draw_start"
+DRAW_END = "draw_end"
+EVENTS = (
+    FRAME_START,
+    FRAME_END,
+    WINDOW_START,
+    WINDOW_END,
+    CALLBACK_START,
+    CALLBACK_END,
+    DRAW_START,
+    DRAW_END,
+)
+
+FrameHook = Callable[[str | None, str | None, int, int | None, int | None], None]
+
+_hooks: dict[str, list[FrameHook]] = {event: [] for event in EVENTS}
+enabled = False
+
+
+def register_hook(event: str, hook: FrameHook) -> None:
+    """
+    Registers a hook to be called at the given stage of every frame update.
+
+    Args:
+        event (str): One of "frame_start", "frame_end", "window_start",
+            "window_end", "callback_start", "callback_end", "draw_start", or
+            "draw_end".
+        hook (Callable[[str|None, str|None, int, int|None, int|None], None]):
+            The function to call. It receives the window ID, tab ID, callback
+            index, and the row and column of the tab group.
+    """
+    global enabled
+    if event not in _hooks:
+        raise ValueError(f"Unknown frame event '{event}'. Must be one of {EVENTS}.")
+    _hooks[event].append(hook)
+    enabled = True
+
+
+def remove_hook(event: str, hook: FrameHook) -> None:
+    """
+    Removes a previously registered hook.
+
+    Args:
+        event (str): The event the hook was registered for.
+        hook (Callable[..., None]): The hook to remove.
+    """
+    global enabled
+    if event not in _hooks:
+        raise ValueError(f"Unknown frame event '{event}'. Must be one of {EVENTS}.")
+    if hook in _hooks[event]:
+        _hooks[event].remove(hook)
+    enabled = any(_hooks.values())
+
+
+def clear_hooks() -> None:
+    """
+    Removes all registered hooks.
+    """
+    global enabled
+    for hooks in _hooks.values():
+        hooks.clear()
+    enabled = False
+
+
+def fire(
+    event: str,
+    window_id: str | None,
+    tab_id: str | None,
+    callback_idx: int,
+    row: int | None = None,
+    col: int | None = None,
+) -> None:
+    """
+    Calls every hook registered for the given event. Callers should check
+    `enabled` first to avoid the call overhead when no hooks are registered.
+    """
+    for hook in _hooks[event]:
+        hook(window_id, tab_id, callback_idx, row, col)
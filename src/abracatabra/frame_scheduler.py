@@ -0,0 +1,322 @@
+import time
+from dataclasses import dataclass
+from typing import Callable
+from matplotlib.backends.qt_compat import QtCore, QtWidgets
+
+from . import frame_trace
+
+
+def wait_until(deadline: float, poll_interval: float = 0.001) -> float:
+    """
+    Processes Qt events until the given deadline instead of sleeping, so the
+    GUI stays responsive (resize, pan/zoom, key presses) while waiting.
+
+    Args:
+        deadline (float): The time to wait until, in seconds, on the
+            `time.perf_counter()` clock.
+        poll_interval (float): The maximum time (seconds) to sleep between
+            processing events. Smaller values are more precise and responsive,
+            but use more CPU.
+    Returns:
+        lateness (float): How late (seconds) the function returned relative to
+            the deadline. Negative values mean it returned early.
+    """
+    app = QtWidgets.QApplication.instance()
+    remaining = deadline - time.perf_counter()
+    while remaining > 0:
+        if app is not None:
+            app.processEvents()
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(min(remaining, poll_interval))
+            remaining = deadline - time.perf_counter()
+    return -remaining
+
+
+async def wait_until_async(deadline: float, poll_interval: float = 0.001) -> float:
+    """
+    Same as `wait_until`, but awaits between processing Qt events, so other
+    asyncio tasks run while waiting. Always yields to the event loop at least
+    once, even if the deadline has passed. Cancelling the awaiting task stops
+    the wait.
+
+    Args:
+        deadline (float): The time to wait until, in seconds, on the
+            `time.perf_counter()` clock.
+        poll_interval (float): The maximum time (seconds) to await between
+            processing Qt events.
+    Returns:
+        lateness (float): How late (seconds) the function returned relative to
+            the deadline. Negative values mean it returned early.
+    """
+    import asyncio  # not imported with the package; it is slow to import
+
+    app = QtWidgets.QApplication.instance()
+    while True:
+        if app is not None:
+            app.processEvents()
+        remaining = deadline - time.perf_counter()
+        await asyncio.sleep(max(min(remaining, poll_interval), 0.0))
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return -remaining
+
+
+class FrameScheduler:
+    """
+    Paces a loop of frames at a fixed period. Frame deadlines follow a target
+    clock (start + k * period) rather than being measured from the end of the
+    previous frame, so small delays in one frame are made up in the next and
+    timing errors do not accumulate. If a frame runs more than one period
+    late, the clock is resynchronized instead of rushing frames to catch up,
+    unless `resync` is False, in which case the caller is expected to drop
+    frames with `skip()`. The Qt event loop keeps running while waiting for
+    each deadline.
+
+    Attributes:
+        `period`: The time (seconds) between frames.
+        `lateness`: How late (seconds) the most recent frame was.
+        `max_lateness`: The largest lateness of any frame so far.
+        `late_frames`: The number of frames that missed their deadline.
+        `frame_count`: The number of frames waited on so far.
+    Methods:
+        `start`: Starts (or restarts) the target clock.
+        `wait`: Waits until the deadline of the current frame.
+        `wait_async`: Awaits the deadline of the current frame (asyncio).
+        `skip`: Skips frames by advancing the deadline.
+    """
+
+    def __init__(
+        self, period: float, late_tolerance: float = 0.001, resync: bool = True
+    ):
+        """
+        Initializes the FrameScheduler. The clock starts on the first call to
+        `wait()` unless `start()` is called explicitly.
+
+        Args:
+            period (float): The time (seconds) between frames.
+            late_tolerance (float): How late (seconds) a frame can be without
+                being counted as late.
+            resync (bool): If True, the clock is resynchronized when a frame is
+                more than one period late. If False, the clock is never reset,
+                so the deadlines stay tied to wall-clock time since `start()`.
+        """
+        if period < 0:
+            raise ValueError("Frame period must not be negative.")
+        self.period = period
+        self.late_tolerance = late_tolerance
+        self.resync = resync
+        self.lateness = 0.0
+        self.max_lateness = 0.0
+        self.late_frames = 0
+        self.frame_count = 0
+        self._deadline: float | None = None
+
+    def start(self) -> None:
+        """
+        Starts (or restarts) the target clock. The first deadline is one period
+        from now.
+        """
+        self._deadline = time.perf_counter() + self.period
+
+    def wait(self) -> float:
+        """
+        Processes Qt events until the deadline of the current frame and then
+        advances the deadline by one period.
+
+        Returns:
+            lateness (float): How late (seconds) this frame was relative to its
+                deadline. Negative values mean it returned early.
+        """
+        if self._deadline is None:
+            self.start()
+        assert self._deadline is not None
+        return self._advance(wait_until(self._deadline))
+
+    async def wait_async(self) -> float:
+        """
+        Same as `wait`, but awaits the deadline so that other asyncio tasks
+        run while waiting (see `wait_until_async`).
+
+        Returns:
+            lateness (float): How late (seconds) this frame was relative to its
+                deadline. Negative values mean it returned early.
+        """
+        if self._deadline is None:
+            self.start()
+        assert self._deadline is not None
+        return self._advance(await wait_until_async(self._deadline))
+
+    def _advance(self, lateness: float) -> float:
+        """
+        Records the lateness of the current frame and advances the deadline.
+        """
+        assert self._deadline is not None
+        recorder = frame_trace.active_recorder()
+        if recorder is not None:
+            recorder.add_deadline(self._deadline, self._deadline + lateness)
+        self.frame_count += 1
+        self.lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        if lateness > self.late_tolerance:
+            self.late_frames += 1
+        if self.resync and lateness > self.period:
+            # too far behind to catch up; resync the clock
+            self._deadline = time.perf_counter() + self.period
+        else:
+            self._deadline += self.period
+        return lateness
+
+    def skip(self, num_frames: int) -> None:
+        """
+        Skips frames by advancing the current deadline by `num_frames` periods.
+        Useful to drop frames when running behind with `resync=False`.
+
+        Args:
+            num_frames (int): The number of frames to skip.
+        """
+        if self._deadline is not None and num_frames > 0:
+            self._deadline += num_frames * self.period
+
+
+class UpdateCoalescer(QtCore.QObject):
+    """
+    Merges update requests that arrive faster than a maximum frame rate. A
+    request is rendered right away if the previous render was at least one
+    refresh interval ago. Otherwise, only its callback index is stored and the
+    request returns immediately; the latest stored index is rendered by the
+    next request that is due, or by a timer at the end of the interval (when
+    the Qt event loop runs), so the last update is never lost.
+
+    Methods:
+        `request`: Requests an update with a callback index.
+        `flush`: Renders the pending request right away.
+        `cancel`: Discards the pending request without rendering it.
+    Attributes:
+        `interval`: The minimum time (seconds) between renders.
+        `rendered`: The number of renders.
+        `coalesced`: The number of requests merged into a later render.
+    """
+
+    def __init__(
+        self,
+        max_fps: float,
+        render: Callable[[int], None],
+        parent: QtCore.QObject | None = None,
+    ):
+        """
+        Initializes the UpdateCoalescer.
+
+        Args:
+            max_fps (float): The maximum number of renders per second, e.g.,
+                the refresh rate of the monitor.
+            render (Callable[[int], None]): Renders an update with the given
+                callback index.
+            parent (QObject|None): The Qt parent that owns the coalescer.
+        """
+        super().__init__(parent)
+        self._render = render
+        self.interval = 0.0
+        self.set_max_fps(max_fps)
+        self.rendered = 0
+        self.coalesced = 0
+        self._pending: int | None = None
+        self._last_render = -float("inf")
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def set_max_fps(self, max_fps: float) -> None:
+        """
+        Changes the maximum number of renders per second.
+
+        Args:
+            max_fps (float): The maximum number of renders per second.
+        """
+        if max_fps <= 0:
+            raise ValueError("The maximum frame rate must be positive.")
+        self.interval = 1.0 / max_fps
+
+    def request(self, callback_idx: int) -> bool:
+        """
+        Requests an update. Renders it now if a refresh interval has passed
+        since the previous render, otherwise replaces any pending request.
+
+        Args:
+            callback_idx (int): The callback index to render.
+        Returns:
+            rendered (bool): True if the update was rendered right away.
+        """
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = callback_idx
+        remaining = self._last_render + self.interval - time.perf_counter()
+        if remaining <= 0:
+            self.flush()
+            return True
+        if not self._timer.isActive():
+            self._timer.start(max(int(remaining * 1000), 1))
+        return False
+
+    def flush(self) -> None:
+        """
+        Renders the pending request, if any, right away.
+        """
+        self._timer.stop()
+        callback_idx = self._pending
+        if callback_idx is None:
+            return
+        self._pending = None
+        self._last_render = time.perf_counter()
+        self.rendered += 1
+        self._render(callback_idx)
+
+    def cancel(self) -> None:
+        """
+        Discards the pending request, if any, without rendering it.
+        """
+        self._timer.stop()
+        self._pending = None
+
+
+@dataclass
+class AnimationResult:
+    """
+    Timing statistics of an animation returned by `animate_all`.
+
+    Attributes:
+        `frames_drawn`: The number of frames that were drawn. With `step > 1`,
+            each draw advances `step` frame indices but counts as one frame.
+        `frames_dropped`: The number of draws skipped to keep up with real
+            time (only in real-time mode), counted like `frames_drawn`, i.e.,
+            each skipped draw covers `step` frame indices. Together, they add
+            up to the number of draws the animation would take without
+            dropping, `ceil(frames / step)`.
+        `sim_time`: The duration (seconds) of the animated data.
+        `real_time`: The wall-clock duration (seconds) of the animation.
+        `late_frames`: The number of frames that missed their deadline.
+        `max_lateness`: The largest lateness (seconds) of any frame.
+    Properties:
+        `actual_speed_scale`: The achieved speed relative to real time.
+        `drop_ratio`: The fraction of frames that were dropped.
+    """
+
+    frames_drawn: int = 0
+    frames_dropped: int = 0
+    sim_time: float = 0.0
+    real_time: float = 0.0
+    late_frames: int = 0
+    max_lateness: float = 0.0
+
+    @property
+    def actual_speed_scale(self) -> float:
+        if self.real_time <= 0:
+            return 0.0
+        return self.sim_time / self.real_time
+
+    @property
+    def drop_ratio(self) -> float:
+        total = self.frames_drawn + self.frames_dropped
+        if total == 0:
+            return 0.0
+        return self.frames_dropped / total
@@ -0,0 +1,208 @@
+"""
+Opt-in instrumentation of how long each tab takes to update. Timing is only
+recorded while a `FrameTimer` is enabled, so there is no cost otherwise.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+import numpy as np
+
+
+PHASES = ("callback", "draw", "flush", "total")
+
+TabKey = tuple[str, int, int, str]  # (window_id, row, col, tab_id)
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """
+    Summary statistics (seconds) of one update phase.
+
+    Attributes:
+        `mean`: The mean duration.
+        `p95`: The 95th percentile duration.
+        `max`: The maximum duration.
+        `count`: The number of samples.
+    """
+
+    mean: float
+    p95: float
+    max: float
+    count: int
+
+
+class FrameTimer:
+    """
+    Records how long each tab spends in each phase of an update, i.e., the
+    animation callback, drawing the canvas, and flushing GUI events. Samples
+    are stored per tab in bounded ring buffers, so only the most recent
+    `capacity` updates of each tab are kept. Tabs are identified by their
+    window, tab group (row and column), and ID, since tab IDs are only unique
+    within a tab group.
+
+    Timing does not change how tabs are drawn. A full redraw is scheduled with
+    `draw_idle()` and rendered while flushing GUI events, so for figures that
+    are not blitted the rendering time is part of the "flush" phase, while the
+    "draw" phase covers blitting (and the synchronous draw when frames are
+    cached, see `FrameCache`).
+
+    Methods:
+        `record`: Records the phase durations of one tab update.
+        `tab_summary`: Returns summary statistics per tab.
+        `window_summary`: Returns summary statistics per window.
+        `report`: Returns a table of the tabs sorted by mean total time.
+        `clear`: Removes all recorded samples.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initializes the FrameTimer.
+
+        Args:
+            capacity (int): The maximum number of updates kept per tab.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+        self.capacity = capacity
+        self._samples: dict[TabKey, deque[tuple[float, float, float]]] = {}
+
+    def record(
+        self,
+        window_id: str,
+        row: int,
+        col: int,
+        tab_id: str,
+        callback: float,
+        draw: float = 0.0,
+        flush: float = 0.0,
+    ) -> None:
+        """
+        Records the phase durations (seconds) of one tab update.
+
+        Args:
+            window_id (str): The ID of the window containing the tab.
+            row (int): The row of the tab group containing the tab.
+            col (int): The column of the tab group containing the tab.
+            tab_id (str): The ID of the tab.
+            callback (float): Time spent in the animation callback.
+            draw (float): Time spent drawing the canvas.
+            flush (float): Time spent flushing GUI events.
+        """
+        key = (window_id, row, col, tab_id)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = deque(maxlen=self.capacity)
+            self._samples[key] = samples
+        samples.append((callback, draw, flush))
+
+    def tab_summary(
+        self, window_id: str | None = None
+    ) -> dict[str, dict[str, PhaseStats]]:
+        """
+        Returns summary statistics of every phase for each tab.
+
+        Args:
+            window_id (str|None): If given, only tabs in this window are
+                included.
+        Returns:
+            summary (dict[str, dict[str, PhaseStats]]): Maps the qualified
+                tab name "window_id/row/col/tab_id" to a dict mapping each
+                phase ("callback", "draw", "flush", "total") to its statistics.
+        """
+        summary = {}
+        for (win_id, row, col, tab_id), samples in self._samples.items():
+            if window_id is not None and win_id != str(window_id):
+                continue
+            name = f"{win_id}/{row}/{col}/{tab_id}"
+            summary[name] = _summarize(np.array(samples))
+        return summary
+
+    def window_summary(self) -> dict[str, dict[str, PhaseStats]]:
+        """
+        Returns summary statistics of every phase for each window, combining
+        the updates of all tabs in the window.
+
+        Returns:
+            summary (dict[str, dict[str, PhaseStats]]): Maps the window ID to a
+                dict mapping each phase ("callback", "draw", "flush", "total")
+                to its statistics.
+        """
+        grouped: dict[str, list[tuple[float, float, float]]] = {}
+        for (win_id, *_), samples in self._samples.items():
+            grouped.setdefault(win_id, []).extend(samples)
+        return {win_id: _summarize(np.array(s)) for win_id, s in grouped.items()}
+
+    def report(self) -> str:
+        """
+        Returns a table of the tabs sorted by their mean total update time, so
+        the most expensive tabs are listed first. Times are in milliseconds.
+        """
+        summary = self.tab_summary()
+        rows = sorted(summary.items(), key=lambda kv: kv[1]["total"].mean, reverse=True)
+        width = max([len(name) for name in summary] + [3])
+        lines = [
+            f"{'tab':<{width}}  {'count':>6}  "
+            + "  ".join(f"{phase + ' mean/p95':>17}" for phase in PHASES)
+        ]
+        for name, stats in rows:
+            cols = "  ".join(
+                f"{stats[p].mean*1e3:8.2f}/{stats[p].p95*1e3:8.2f}" for p in PHASES
+            )
+            lines.append(f"{name:<{width}}  {stats['total'].count:>6}  {cols}")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """
+        Removes all recorded samples.
+        """
+        self._samples.clear()
+
+
+def _summarize(samples: np.ndarray) -> dict[str, PhaseStats]:
+    samples = np.column_stack([samples, samples.sum(axis=1)])
+    stats = {}
+    for i, phase in enumerate(PHASES):
+        column = samples[:, i]
+        stats[phase] = PhaseStats(
+            mean=float(column.mean()),
+            p95=float(np.percentile(column, 95)),
+            max=float(column.max()),
+            count=len(column),
+        )
+    return stats
+
+
+_active_timer: FrameTimer | None = None
+
+
+def enable(capacity: int = 1000) -> FrameTimer:
+    """
+    Enables timing of tab updates. If timing is already enabled, the active
+    timer is returned (its capacity is not changed).
+
+    Args:
+        capacity (int): The maximum number of updates kept per tab.
+    Returns:
+        timer (FrameTimer): The active timer holding the recorded samples.
+    """
+    global _active_timer
+    if _active_timer is None:
+        _active_timer = FrameTimer(capacity)
+    return _active_timer
+
+
+def disable() -> None:
+    """
+    Disables timing of tab updates.
+    """
+    global _active_timer
+    _active_timer = None
+
+
+def active_timer() -> FrameTimer | None:
+    """
+    Returns:
+        timer (FrameTimer | None): The active timer, or None if timing is
+            disabled.
+    """
+    return _active_timer
@@ -0,0 +1,277 @@
+"""
+Timeline export of frame updates in the Chrome trace-event format (viewable in
+chrome://tracing or https://ui.perfetto.dev) or as compact JSON lines.
+"""
+
+import gc
+import json
+import os
+import time
+from typing import IO, Any
+
+from . import frame_hooks
+
+
+_SPANS = {
+    frame_hooks.FRAME_START: ("frame", True),
+    frame_hooks.FRAME_END: ("frame", False),
+    frame_hooks.WINDOW_START: ("window", True),
+    frame_hooks.WINDOW_END: ("window", False),
+    frame_hooks.CALLBACK_START: ("callback", True),
+    frame_hooks.CALLBACK_END: ("callback", False),
+    frame_hooks.DRAW_START: ("draw", True),
+    frame_hooks.DRAW_END: ("draw", False),
+}
+
+
+class TraceRecorder:
+    """
+    Records a timeline of frame updates using the frame hooks: one span per
+    frame, per window update, and per tab callback/draw, plus the requested vs.
+    actual frame deadlines and garbage collection pauses. The timeline is
+    written as Chrome trace events, or as JSON lines (one event per line,
+    written as they happen) if the file ends with ".jsonl".
+
+    Windows are shown as processes and tabs as threads in a trace viewer.
+    Frames, deadlines, and garbage collection are shown in a separate
+    "abracatabra" process.
+
+    Can be used as a context manager:
+    ```python
+    with TraceRecorder("trace.json"):
+        for i in range(100):
+            update_all_windows(0.05, i)
+    ```
+
+    Methods:
+        `start`: Starts recording.
+        `stop`: Stops recording and writes the file.
+        `add_deadline`: Records the requested and actual time of a deadline.
+    """
+
+    def __init__(self, path: str | os.PathLike, fmt: str | None = None):
+        """
+        Initializes the TraceRecorder.
+
+        Args:
+            path (str|PathLike): The file to write the trace to.
+            fmt (str|None): Either "chrome" or "jsonl". If None, "jsonl" is used
+                if the file name ends with ".jsonl" and "chrome" otherwise.
+        """
+        self.path = os.fspath(path)
+        if fmt is None:
+            fmt = "jsonl" if self.path.endswith(".jsonl") else "chrome"
+        if fmt not in ("chrome", "jsonl"):
+            raise ValueError(f"Unknown trace format '{fmt}'.")
+        self.fmt = fmt
+        self._events: list[dict[str, Any]] = []
+        self._file: IO[str] | None = None
+        self._open_spans: dict[tuple, float] = {}
+        self._pids: dict[str | None, int] = {None: 0}
+        self._tids: dict[tuple, int] = {}
+        self._gc_start = 0.0
+        self._t0 = 0.0
+        self._recording = False
+        self._hooks: dict[str, frame_hooks.FrameHook] = {}
+        for event, (name, is_start) in _SPANS.items():
+            if is_start:
+                self._hooks[event] = self._make_start_hook(name)
+            else:
+                self._hooks[event] = self._make_end_hook(name)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts recording. Registers the frame hooks and a garbage collection
+        callback.
+        """
+        global _active_recorder
+        if self._recording:
+            return
+        self._recording = True
+        self._t0 = time.perf_counter()
+        if self.fmt == "jsonl":
+            self._file = open(self.path, "w")
+        self._emit(_metadata("process_name", 0, 0, "abracatabra"))
+        self._emit(_metadata("thread_name", 0, 0, "frames"))
+        self._emit(_metadata("thread_name", 0, 1, "garbage collection"))
+        for event in _SPANS:
+            frame_hooks.register_hook(event, self._hooks[event])
+        gc.callbacks.append(self._on_gc)
+        _active_recorder = self
+
+    def stop(self) -> None:
+        """
+        Stops recording and writes the trace file.
+        """
+        global _active_recorder
+        if not self._recording:
+            return
+        self._recording = False
+        for event in _SPANS:
+            frame_hooks.remove_hook(event, self._hooks[event])
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if _active_recorder is self:
+            _active_recorder = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        else:
+            with open(self.path, "w") as f:
+                json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, f)
+            self._events = []
+
+    def add_deadline(self, requested: float, actual: float) -> None:
+        """
+        Records a frame deadline as an instant event at the actual time, along
+        with a counter of the lateness.
+
+        Args:
+            requested (float): The requested deadline on the
+                `time.perf_counter()` clock.
+            actual (float): The time the deadline was actually reached.
+        """
+        lateness_ms = (actual - requested) * 1e3
+        ts = self._us(actual)
+        self._emit(
+            {
+                "name": "deadline",
+                "ph": "i",
+                "s": "p",
+                "ts": ts,
+                "pid": 0,
+                "tid": 0,
+                "args": {
+                    "requested_us": self._us(requested),
+                    "actual_us": ts,
+                    "lateness_ms": lateness_ms,
+                },
+            }
+        )
+        self._emit(
+            {
+                "name": "lateness_ms",
+                "ph": "C",
+                "ts": ts,
+                "pid": 0,
+                "args": {"lateness_ms": lateness_ms},
+            }
+        )
+
+    def _make_start_hook(self, name: str) -> frame_hooks.FrameHook:
+        def hook(
+            window_id: str | None,
+            tab_id: str | None,
+            callback_idx: int,
+            row: int | None,
+            col: int | None,
+        ):
+            key = (name, window_id, row, col, tab_id)
+            self._open_spans[key] = time.perf_counter()
+
+        return hook
+
+    def _make_end_hook(self, name: str) -> frame_hooks.FrameHook:
+        def hook(
+            window_id: str | None,
+            tab_id: str | None,
+            callback_idx: int,
+            row: int | None,
+            col: int | None,
+        ):
+            end = time.perf_counter()
+            start = self._open_spans.pop((name, window_id, row, col, tab_id), None)
+            if start is None:
+                return
+            pid, tid = self._ids(window_id, tab_id, row, col)
+            span = {
+                "name": name if tab_id is None else f"{name} {tab_id}",
+                "cat": name,
+                "ph": "X",
+                "ts": self._us(start),
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {"callback_idx": callback_idx},
+            }
+            self._emit(span)
+
+        return hook
+
+    def _ids(
+        self,
+        window_id: str | None,
+        tab_id: str | None,
+        row: int | None = None,
+        col: int | None = None,
+    ) -> tuple[int, int]:
+        """
+        Maps window and tab IDs to trace process and thread IDs, emitting name
+        metadata the first time an ID is seen. Tabs are keyed by their tab
+        group as well, since tab IDs are only unique within a group.
+        """
+        pid = self._pids.get(window_id)
+        if pid is None:
+            pid = len(self._pids)
+            self._pids[window_id] = pid
+            self._emit(_metadata("process_name", pid, 0, f"window {window_id}"))
+            self._emit(_metadata("thread_name", pid, 0, "window"))
+        key = (pid, row, col, tab_id)
+        tid = self._tids.get(key)
+        if tid is None:
+            tid = 0 if tab_id is None else len(self._tids) + 1
+            self._tids[key] = tid
+            if tab_id is not None:
+                label = f"tab {row}/{col}/{tab_id}"
+                self._emit(_metadata("thread_name", pid, tid, label))
+        return pid, tid
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        end = time.perf_counter()
+        self._emit(
+            {
+                "name": f"gc gen{info.get('generation')}",
+                "cat": "gc",
+                "ph": "X",
+                "ts": self._us(self._gc_start),
+                "dur": (end - self._gc_start) * 1e6,
+                "pid": 0,
+                "tid": 1,
+                "args": {"collected": info.get("collected")},
+            }
+        )
+
+    def _us(self, t: float) -> float:
+        return (t - self._t0) * 1e6
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self._file is not None:
+            self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        else:
+            self._events.append(event)
+
+
+def _metadata(name: str, pid: int, tid: int, value: str) -> dict[str, Any]:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": {"name": value}}
+
+
+_active_recorder: TraceRecorder | None = None
+
+
+def active_recorder() -> TraceRecorder | None:
+    """
+    Returns:
+        recorder (TraceRecorder | None): The recorder that is currently
+            recording, or None.
+    """
+    return _active_recorder
@@ -0,0 +1,94 @@
+"""
+Optional release of the rendering memory of figure tabs that are not shown,
+for long-running sessions with many tabs.
+"""
+
+import time
+from typing import Callable, Iterable
+from matplotlib.backends.qt_compat import QtCore
+
+from .figure_widget import FigureWidget
+
+
+class MemoryPolicy(QtCore.QObject):
+    """
+    Periodically frees the renderer buffers of figure tabs that are hidden
+    (inactive tabs or hidden windows), either once they have been hidden for
+    longer than `max_idle_seconds`, or, starting with the tabs hidden the
+    longest, until the rendering memory of all tabs is within `max_megabytes`.
+    Released tabs show a downscaled snapshot and are redrawn when shown again.
+    Their frames in the frame cache (if enabled) are dropped as well.
+
+    Methods:
+        `apply`: Releases memory according to the policy right away.
+        `stop`: Stops checking the policy periodically.
+    Attributes:
+        `max_idle_seconds`: How long a tab can be hidden before it is released.
+        `max_bytes`: The rendering memory budget in bytes.
+    """
+
+    def __init__(
+        self,
+        widgets: Callable[[], Iterable[FigureWidget]],
+        max_idle_seconds: float | None = None,
+        max_megabytes: float | None = None,
+        check_interval: float = 5.0,
+        parent: QtCore.QObject | None = None,
+    ):
+        """
+        Initializes the MemoryPolicy and starts checking it periodically.
+
+        Args:
+            widgets (Callable[[], Iterable[FigureWidget]]): A function that
+                returns the figure widgets the policy applies to.
+            max_idle_seconds (float|None): Release tabs that have been hidden
+                for longer than this. If None, tabs are not released based on
+                how long they have been hidden.
+            max_megabytes (float|None): The rendering memory budget of all tabs
+                in megabytes. If None, there is no budget.
+            check_interval (float): How often (seconds) the policy is applied.
+            parent (QObject|None): The Qt parent that owns the policy.
+        """
+        super().__init__(parent)
+        if check_interval <= 0:
+            raise ValueError("The check interval must be positive.")
+        self._widgets = widgets
+        self.max_idle_seconds = max_idle_seconds
+        self.max_bytes = None
+        if max_megabytes is not None:
+            self.max_bytes = int(max_megabytes * 1024**2)
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.apply)
+        self._timer.start(int(check_interval * 1000))
+
+    def apply(self) -> int:
+        """
+        Releases the renderer buffers of hidden tabs according to the policy.
+
+        Returns:
+            nbytes (int): The number of bytes released.
+        """
+        widgets = list(self._widgets())
+        hidden = [w for w in widgets if not w.isVisible() and w.renderer_nbytes()]
+        hidden.sort(key=lambda w: w.hidden_since)  # hidden the longest first
+        released = 0
+        if self.max_idle_seconds is not None:
+            now = time.monotonic()
+            for widget in hidden:
+                if now - widget.hidden_since > self.max_idle_seconds:
+                    released += widget.release_renderer()
+        if self.max_bytes is not None:
+            total = sum(w.renderer_nbytes() for w in widgets)
+            for widget in hidden:
+                if total <= self.max_bytes:
+                    break
+                nbytes = widget.release_renderer()
+                total -= nbytes
+                released += nbytes
+        return released
+
+    def stop(self) -> None:
+        """
+        Stops checking the policy periodically.
+        """
+        self._timer.stop()
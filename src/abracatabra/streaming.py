@@ -0,0 +1,145 @@
+"""
+Fixed-length line series for live data, e.g., sensor telemetry, so that memory
+and draw time stay constant no matter how long data is streamed.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+from matplotlib.lines import Line2D
+
+
+class StreamingLine:
+    """
+    A matplotlib line backed by a preallocated ring buffer that keeps only the
+    most recent `capacity` samples. Appending a sample or a batch of samples
+    never reallocates, and the buffered samples are always available as a
+    contiguous (zero-copy) view: every sample is written twice, `capacity`
+    elements apart, so the window of valid samples never wraps around.
+
+    The line is updated with the buffered samples right before its figure is
+    drawn (e.g., by `update_all_windows()`), and only if new samples arrived.
+
+    Methods:
+        `append`: Appends a single sample.
+        `extend`: Appends a batch of samples.
+        `clear`: Removes all samples.
+        `sync`: Updates the line with the buffered samples.
+    Attributes:
+        `line`: The matplotlib line showing the samples.
+        `capacity`: The maximum number of samples kept.
+        `autoscroll`: Whether the x-axis follows the buffered samples.
+        `x`: A view of the buffered x values, oldest first.
+        `y`: A view of the buffered y values, oldest first.
+    """
+
+    def __init__(self, line: Line2D, capacity: int, autoscroll: bool = True):
+        """
+        Initializes the StreamingLine.
+
+        Args:
+            line (Line2D): The line to show the samples with.
+            capacity (int): The maximum number of samples kept (and drawn).
+            autoscroll (bool): If True, the x-limits of the axes are set to the
+                range of the buffered samples whenever the line is updated.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+        self.line = line
+        self.capacity = capacity
+        self.autoscroll = autoscroll
+        self._data = np.zeros((2, 2 * capacity))
+        self._end = 0
+        self._count = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._view()[0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._view()[1]
+
+    def append(self, x: float, y: float) -> None:
+        """
+        Appends a single sample, dropping the oldest sample if the buffer is
+        full.
+
+        Args:
+            x (float): The x value of the sample, e.g., a timestamp.
+            y (float): The y value of the sample.
+        """
+        i = self._end
+        self._data[0, i] = self._data[0, i + self.capacity] = x
+        self._data[1, i] = self._data[1, i + self.capacity] = y
+        self._end = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._mark_dirty()
+
+    def extend(self, x: ArrayLike, y: ArrayLike) -> None:
+        """
+        Appends a batch of samples, dropping the oldest samples if the buffer
+        is full. Only the last `capacity` samples of a batch are kept.
+
+        Args:
+            x (ArrayLike): The x values of the samples.
+            y (ArrayLike): The y values of the samples.
+        """
+        x = np.ravel(x)
+        y = np.ravel(y)
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same number of samples.")
+        n = min(len(x), self.capacity)
+        if n == 0:
+            return
+        x, y = x[-n:], y[-n:]
+        start = self._end
+        first = min(n, self.capacity - start)  # samples before wrapping around
+        for offset in (0, self.capacity):
+            self._data[0, start + offset : start + offset + first] = x[:first]
+            self._data[1, start + offset : start + offset + first] = y[:first]
+            self._data[0, offset : offset + n - first] = x[first:]
+            self._data[1, offset : offset + n - first] = y[first:]
+        self._end = (start + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        """
+        Removes all samples.
+        """
+        self._end = 0
+        self._count = 0
+        self._mark_dirty()
+
+    def sync(self) -> bool:
+        """
+        Updates the line with the buffered samples if new samples arrived since
+        the last update, and scrolls the x-axis if `autoscroll` is enabled.
+        This is called automatically before the figure is drawn.
+
+        Returns:
+            updated (bool): True if the line was updated.
+        """
+        if not self._dirty:
+            return False
+        self._dirty = False
+        x, y = self._view()
+        self.line.set_data(x, y)
+        if self.autoscroll and self._count > 1 and x[0] < x[-1]:
+            self.line.axes.set_xlim(x[0], x[-1])
+        return True
+
+    def _mark_dirty(self) -> None:
+        if not self._dirty:
+            self._dirty = True
+            self.line.stale = True  # so the figure knows there is something new
+
+    def _view(self) -> np.ndarray:
+        start = self._end - self._count
+        if start < 0:
+            start += self.capacity
+        return self._data[:, start : start + self._count]
@@ -38,6 +38,18 @@ class TabGroupContainer:
             col, row = index
         return self._tab_groups[row][col]
 
+    @property
+    def nested(self) -> list[list[TabbedFigureWidget]]:
+        """
+        The tab groups as nested lists in the order they are laid out. The
+        inner lists are rows if `row_major` is True, otherwise columns.
+        """
+        return self._tab_groups
+
+    @property
+    def row_major(self) -> bool:
+        return self._row_major
+
     def __iter__(self):
         """
         Iterates over every tab group in the container.
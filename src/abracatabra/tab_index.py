@@ -0,0 +1,119 @@
+"""
+Global index of the tabs in every window, so a tab can be looked up by its ID
+or by its qualified name "window/row/col/tab" without scanning every window
+and tab group. Tabs are added to the index when they are created and removed
+when their window is closed.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .custom_widget import CustomWidget
+    from .figure_widget import FigureWidget
+    from .tabbed_figure_widget import TabbedFigureWidget
+
+
+@dataclass(frozen=True)
+class TabLocation:
+    """
+    The location of a tab.
+
+    Attributes:
+        `window_id`: The ID of the window containing the tab.
+        `row`: The row index of the tab group containing the tab.
+        `col`: The column index of the tab group containing the tab.
+        `tab_id`: The ID of the tab.
+        `group`: The tab group containing the tab.
+        `key`: The qualified name of the tab, "window/row/col/tab".
+        `widget`: The widget of the tab (builds lazy tabs).
+    """
+
+    window_id: str
+    row: int
+    col: int
+    tab_id: str
+    group: "TabbedFigureWidget"
+
+    @property
+    def key(self) -> str:
+        return f"{self.window_id}/{self.row}/{self.col}/{self.tab_id}"
+
+    @property
+    def widget(self) -> "FigureWidget | CustomWidget":
+        return self.group.get_tab(self.tab_id)
+
+
+_by_key: dict[str, TabLocation] = {}
+_by_id: dict[str, dict[str, TabLocation]] = {}  # tab ID -> key -> location
+_by_window: dict[str, list[str]] = {}  # window ID -> keys
+
+
+def add(location: TabLocation) -> None:
+    """
+    Adds a tab to the index.
+
+    Args:
+        location (TabLocation): The location of the tab.
+    """
+    key = location.key
+    if key in _by_key:
+        return
+    _by_key[key] = location
+    _by_id.setdefault(location.tab_id, {})[key] = location
+    _by_window.setdefault(location.window_id, []).append(key)
+
+
+def remove_window(window_id: str) -> None:
+    """
+    Removes every tab of a window from the index.
+
+    Args:
+        window_id (str): The ID of the window.
+    """
+    for key in _by_window.pop(window_id, []):
+        location = _by_key.pop(key)
+        same_id = _by_id[location.tab_id]
+        del same_id[key]
+        if not same_id:
+            del _by_id[location.tab_id]
+
+
+def find(name: str, window_id: str | None = None) -> TabLocation:
+    """
+    Returns the location of a tab.
+
+    Args:
+        name (str): The qualified name of the tab ("window/row/col/tab"), or
+            its ID if that is unique (within the window, if given).
+        window_id (str|None): Only look for the tab in this window.
+    Returns:
+        location (TabLocation): The location of the tab.
+    """
+    location = _by_key.get(name)
+    if location is not None and window_id in (None, location.window_id):
+        return location
+    matches = _by_id.get(name, {}).values()
+    if window_id is not None:
+        matches = [m for m in matches if m.window_id == window_id]
+    if len(matches) == 1:
+        return next(iter(matches))
+    if not matches:
+        raise ValueError(f"Tab '{name}' does not exist.")
+    keys = ", ".join(f"'{m.key}'" for m in matches)
+    raise ValueError(f"Tab ID '{name}' is ambiguous, use one of: {keys}.")
+
+
+def tabs(tab_id: str | None = None) -> list[TabLocation]:
+    """
+    Returns the locations of all tabs, or of the tabs with a given ID, in the
+    order they were created.
+
+    Args:
+        tab_id (str|None): Only return tabs with this ID.
+    Returns:
+        locations (list[TabLocation]): The locations of the tabs.
+    """
+    if tab_id is None:
+        return list(_by_key.values())
+    return list(_by_id.get(tab_id, {}).values())
@@ -1,14 +1,42 @@
 import os
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
 from matplotlib.figure import Figure
 from matplotlib.backends.qt_compat import QtWidgets, QtCore, QtGui
 
 from .figure_widget import FigureWidget
 from .custom_widget import CustomWidget
+from .memory_policy import MemoryPolicy
+from . import tab_index, update_tracker
 
 
 # Suppress atspi accessibility warnings from Qt (started happening after using slots)
 os.environ["QT_LOGGING_RULES"] = "qt.accessibility.atspi=false"
 
+FigureBuilder = Callable[[Figure], Callable[[int], None] | None]
+# a tab ID, or keyword arguments for `add_figure_tab`
+FigureTabSpec = str | int | dict[str, Any]
+
+
+class _LazyFigureTab(QtWidgets.QWidget):
+    """
+    An empty placeholder for a figure tab that is built the first time it
+    becomes the current tab.
+    """
+
+    def __init__(
+        self,
+        tab_id: str | int,
+        builder: FigureBuilder,
+        blit: bool,
+        include_toolbar: bool,
+        add_animation_player: bool,
+    ):
+        super().__init__()
+        self.tab_id = tab_id
+        self.builder = builder
+        self.options = (blit, include_toolbar, add_animation_player)
+
 
 class TabbedFigureWidget(QtWidgets.QTabWidget):
     """
@@ -17,14 +45,33 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
 
     Methods:
         `update_active_tab`: Updates the currently active tab's widget.
+        `active_tab`: Returns the widget of the active tab, building lazy tabs.
+        `set_latest_callback_idx`: Sets the frame drawn when switching tabs,
+            without updating.
+        `prefetch_active_tab`: Renders a frame of the active tab into the frame
+            cache.
         `add_figure_tab`: Adds a new tab with a matplotlib Figure.
+        `add_figure_tabs`: Adds many tabs with matplotlib Figures at once.
+        `batch`: Suspends repaints and tab change signals while adding tabs.
+        `add_lazy_figure_tab`: Adds a tab whose Figure is built the first time
+            the tab is shown.
         `add_custom_tab`: Adds a new tab with a custom Qt widget.
         `get_tab`: Returns the widget associated with a given tab ID.
         `set_tab_position`: Sets the position of the tab bar.
         `set_tab_fontsize`: Sets the font size of the tab bar.
+        `set_memory_policy`: Frees the rendering memory of inactive tabs.
+        `apply_tight_layout`: Applies a tight layout to the figure in each tab.
     """
 
-    def __init__(self, autohide: bool, position: str = "top", fontsize: int = 8):
+    def __init__(
+        self,
+        autohide: bool,
+        position: str = "top",
+        fontsize: int = 8,
+        window_id: str = "",
+        row: int = 0,
+        col: int = 0,
+    ):
         """
         Initializes the TabbedFigureWidget.
 
@@ -35,8 +82,14 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
                 'left', or 'right' as well as 'north', 'south', 'east', or
                 'west' (only first character is checked).
             fontsize (int): The font size of the tab labels.
+            window_id (str): The ID of the window containing this tab group.
+            row (int): The row index of this tab group in the window.
+            col (int): The column index of this tab group in the window.
         """
         super().__init__()
+        self.window_id = window_id
+        self.row = row
+        self.col = col
         tabbar = self.tabBar()
         assert isinstance(tabbar, QtWidgets.QTabBar)
         tabbar.setAutoHide(autohide)
@@ -45,7 +98,10 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
         self.set_tab_fontsize(fontsize)
         self._figure_widgets: dict[str, FigureWidget] = {}
         self._custom_widgets: dict[str, CustomWidget] = {}
+        self._lazy_tabs: dict[str, _LazyFigureTab] = {}
+        self._memory_policy: MemoryPolicy | None = None
         self._latest_callback_idx = 0
+        self._batching = False
         self.currentChanged.connect(self._on_tab_changed)
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
 
@@ -80,12 +136,56 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
                 to draw.
         """
         self._latest_callback_idx = callback_idx
-        active_widget = self.currentWidget()
+        active_widget = self.active_tab()
         if isinstance(active_widget, FigureWidget):
             active_widget.update_figure(callback_idx)
         elif isinstance(active_widget, CustomWidget):
             active_widget.update_widget(callback_idx)
 
+    def active_tab(self) -> FigureWidget | CustomWidget | None:
+        """
+        Returns the widget of the currently active tab, building it first if
+        it is a lazy tab that has not been shown yet.
+
+        Returns:
+            widget (FigureWidget | CustomWidget | None): The widget of the
+                active tab, or None if there are no tabs.
+        """
+        active_widget = self.currentWidget()
+        if isinstance(active_widget, _LazyFigureTab):
+            active_widget = self._build_lazy_tab(active_widget)
+        if isinstance(active_widget, (FigureWidget, CustomWidget)):
+            return active_widget
+        return None
+
+    def set_latest_callback_idx(self, callback_idx: int) -> None:
+        """
+        Records the latest callback index without updating the active tab, so
+        a tab that becomes active later is drawn at this frame, e.g., while
+        the window is minimized and updates are skipped.
+
+        Args:
+            callback_idx (int): The latest index passed to the animation
+                callbacks.
+        """
+        self._latest_callback_idx = callback_idx
+
+    def prefetch_active_tab(self, callback_idx: int) -> bool:
+        """
+        Renders a frame of the currently active tab into the frame cache
+        without changing the displayed frame. Only figure tabs are prefetched.
+
+        Args:
+            callback_idx (int): An index passed to the registered animation
+                callback function.
+        Returns:
+            rendered (bool): True if a frame was rendered.
+        """
+        active_widget = self.currentWidget()
+        if isinstance(active_widget, FigureWidget):
+            return active_widget.prefetch_frame(callback_idx)
+        return False
+
     def add_figure_tab(
         self,
         tab_id: str | int,
@@ -110,16 +210,125 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
                 callbacks are registered.
         """
         id_ = str(tab_id)
+        if id_ in self._lazy_tabs:
+            self._build_lazy_tab(self._lazy_tabs[id_])
         if id_ in self._figure_widgets:
             return self._figure_widgets[id_].figure
         new_tab = FigureWidget(tab_id, blit, include_toolbar, add_animation_player)
+        self._adopt(new_tab)
         self._figure_widgets[id_] = new_tab
-        idx = self.currentIndex()
         super().addTab(new_tab, id_)
-        self.setCurrentWidget(new_tab)  # activate tab to auto size figure
-        self.setCurrentIndex(idx)  # switch back to original tab
+        self._index_tab(id_)
+        current = self.currentWidget()
+        if not self._batching and current is not new_tab and current is not None:
+            new_tab.fit_to_size(current.size())  # auto size figure
         return new_tab.figure
 
+    def add_figure_tabs(self, specs: Iterable[FigureTabSpec]) -> list[Figure]:
+        """
+        Adds many figure tabs at once (see `batch`), which is much faster than
+        adding them one at a time.
+
+        Args:
+            specs (Iterable[str|int|dict]): A tab ID per tab, or a dictionary
+                of keyword arguments for `add_figure_tab`, e.g.,
+                `{"tab_id": "speed", "blit": True}`.
+        Returns:
+            figures (list[Figure]): The matplotlib Figure of each tab.
+        """
+        figures = []
+        with self.batch():
+            for spec in specs:
+                if isinstance(spec, dict):
+                    figures.append(self.add_figure_tab(**spec))
+                else:
+                    figures.append(self.add_figure_tab(spec))
+        return figures
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        A context manager for adding many tabs. Repaints and tab change
+        signals are suspended while inside the context, and new figures are
+        sized in a single layout pass when it exits, instead of once per tab.
+        Nested calls only take effect for the outermost context.
+
+        Example:
+        ```python
+        with tabs.batch():
+            for name in names:
+                tabs.add_figure_tab(name)
+        ```
+        """
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        index = self.currentIndex()
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        blocked = self.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.blockSignals(blocked)
+            self.setUpdatesEnabled(updates)
+            self._batching = False
+            self._fit_tabs()
+            if self.currentIndex() != index and not blocked:
+                self.currentChanged.emit(self.currentIndex())  # once, not per tab
+
+    def _fit_tabs(self) -> None:
+        """
+        Processes pending layout requests, then sizes the figures of inactive
+        tabs to the size of the active tab.
+        """
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.LayoutRequest)
+        current = self.currentWidget()
+        if current is None:
+            return
+        for widget in self._figure_widgets.values():
+            if widget is not current:
+                widget.fit_to_size(current.size())
+
+    def add_lazy_figure_tab(
+        self,
+        tab_id: str | int,
+        builder: FigureBuilder,
+        blit: bool = False,
+        include_toolbar: bool = True,
+        add_animation_player: bool = False,
+    ) -> None:
+        """
+        Adds a new tab whose Figure (and canvas, toolbar, etc.) is only created
+        the first time the tab becomes the current tab. Until then, the tab is
+        an empty placeholder, so registering many tabs that are rarely opened
+        stays cheap. Accessing the tab with `get_tab` also builds it.
+
+        Args:
+            tab_id (str|int): The title/ID of the tab.
+            builder (Callable[[Figure], Callable[[int], None] | None]): A
+                function that draws the contents of the Figure it is given,
+                e.g., adds axes and plots data. If it returns a function, that
+                function is registered as the animation callback of the tab.
+            blit (bool): If True, enables blitting for faster rendering on the
+                Figure in this tab.
+            include_toolbar (bool): If True, includes a navigation toolbar
+                with the Figure in this tab.
+            add_animation_player (bool): Whether to include an animation player
+                widget in this tab (play, pause, etc.). Only works if animation
+                callbacks are registered.
+        """
+        id_ = str(tab_id)
+        if id_ in self._figure_widgets | self._custom_widgets | self._lazy_tabs:
+            raise ValueError(f"Tab with id '{id_}' already exists.")
+        placeholder = _LazyFigureTab(
+            tab_id, builder, blit, include_toolbar, add_animation_player
+        )
+        self._lazy_tabs[id_] = placeholder
+        super().addTab(placeholder, id_)
+        self._index_tab(id_)
+
     def add_custom_tab(
         self,
         widget: QtWidgets.QWidget,
@@ -139,12 +348,14 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
                 callbacks are registered.
         """
         id_ = str(tab_id)
-        if id_ in self._figure_widgets | self._custom_widgets:
+        if id_ in self._figure_widgets | self._custom_widgets | self._lazy_tabs:
             raise ValueError(f"Tab with id '{id_}' already exists.")
         new_tab = CustomWidget(widget, add_animation_player)
+        new_tab.tab_id = id_
+        self._adopt(new_tab)
         self._custom_widgets[id_] = new_tab
         super().addTab(new_tab, id_)
-        return
+        self._index_tab(id_)
 
     def get_tab(self, tab_id: str | int) -> FigureWidget | CustomWidget:
         """
@@ -158,6 +369,8 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
                 given tab ID.
         """
         id_ = str(tab_id)
+        if id_ in self._lazy_tabs:
+            return self._build_lazy_tab(self._lazy_tabs[id_])
         if id_ in self._figure_widgets:
             return self._figure_widgets[id_]
         elif id_ in self._custom_widgets:
@@ -197,15 +410,118 @@ class TabbedFigureWidget(QtWidgets.QTabWidget):
         font.setPointSize(fontsize)
         tabbar.setFont(font)
 
+    def set_memory_policy(
+        self,
+        max_idle_seconds: float | None = None,
+        max_megabytes: float | None = None,
+        check_interval: float = 5.0,
+    ) -> MemoryPolicy | None:
+        """
+        Frees the rendering memory of inactive figure tabs in this tab group,
+        either once they have been inactive for longer than `max_idle_seconds`
+        or, starting with the tabs inactive the longest, whenever all tabs
+        together use more than `max_megabytes`. Released tabs show a
+        downscaled snapshot until they are redrawn when activated. Call with
+        no limits to disable the policy.
+
+        Args:
+            max_idle_seconds (float|None): Release tabs inactive for longer than
+                this many seconds.
+            max_megabytes (float|None): The rendering memory budget of the tabs.
+            check_interval (float): How often (seconds) the policy is applied.
+        Returns:
+            policy (MemoryPolicy|None): The policy, or None if disabled.
+        """
+        if self._memory_policy is not None:
+            self._memory_policy.stop()
+            self._memory_policy.deleteLater()
+            self._memory_policy = None
+        if max_idle_seconds is None and max_megabytes is None:
+            return None
+        self._memory_policy = MemoryPolicy(
+            lambda: self._figure_widgets.values(),
+            max_idle_seconds,
+            max_megabytes,
+            check_interval,
+            parent=self,
+        )
+        return self._memory_policy
+
+    def apply_tight_layout(self) -> None:
+        """
+        Applies a tight layout to the figure in each tab without switching
+        tabs. Figures in inactive tabs are first resized to the size they will
+        have when shown (the size of the active tab) and are only drawn once
+        their tab is shown. Tabs that have not been built yet are skipped.
+        """
+        current = self.currentWidget()
+        for i in range(self.count()):
+            tab = self.widget(i)
+            if not isinstance(tab, FigureWidget):
+                continue
+            if tab is not current and current is not None:
+                tab.fit_to_size(current.size())
+            tab.figure.tight_layout()
+            if tab is current:
+                tab.canvas.draw_idle()
+
+    def _adopt(self, tab: FigureWidget | CustomWidget) -> None:
+        """
+        Tells a new tab where it is, i.e., the window and tab group position.
+        """
+        tab.window_id = self.window_id
+        tab.row = self.row
+        tab.col = self.col
+
+    def _index_tab(self, tab_id: str) -> None:
+        """
+        Adds a tab to the global tab index (see `TabbedPlotWindow.find_tab`).
+        """
+        location = tab_index.TabLocation(
+            self.window_id, self.row, self.col, tab_id, self
+        )
+        tab_index.add(location)
+        update_tracker.mark_dirty(self.window_id)
+
+    def _build_lazy_tab(self, placeholder: _LazyFigureTab) -> FigureWidget:
+        """
+        Creates the FigureWidget of a lazy tab, calls its builder, and replaces
+        the placeholder with it (keeping the position and current tab).
+        """
+        id_ = str(placeholder.tab_id)
+        del self._lazy_tabs[id_]
+        new_tab = FigureWidget(placeholder.tab_id, *placeholder.options)
+        self._adopt(new_tab)
+        self._figure_widgets[id_] = new_tab
+        callback = placeholder.builder(new_tab.figure)
+        if callback is not None:
+            new_tab.register_animation_callback(callback)
+        index = self.indexOf(placeholder)
+        was_current = self.currentIndex() == index
+        blocked = self.blockSignals(True)  # swapping tabs is not a tab change
+        try:
+            self.insertTab(index, new_tab, id_)
+            self.removeTab(index + 1)
+            if was_current:
+                self.setCurrentIndex(index)
+        finally:
+            self.blockSignals(blocked)
+        placeholder.deleteLater()
+        return new_tab
+
     @QtCore.Slot(int)
     def _on_tab_changed(self, index: int) -> None:
         """
-        Slot called when the current tab is changed. This is used to make sure
-        the animation callback is called for the newly active tab.
+        Slot called when the current tab is changed. This is used to build
+        lazy tabs when they are first shown and to make sure the animation
+        callback is called for the newly active tab.
 
         Args:
             index (int): The index of the newly selected tab.
         """
+        widget = self.widget(index)
+        if isinstance(widget, _LazyFigureTab):
+            self._build_lazy_tab(widget)
         if self._latest_callback_idx > 0:
             # print(f"TabbedFigureWidget: switched to tab index {index}")
             self.update_active_tab(self._latest_callback_idx)
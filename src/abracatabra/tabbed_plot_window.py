@@ -4,7 +4,8 @@ import sys
 import os
 import time
 import random
-from typing import Callable
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Iterable, Iterator
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -12,59 +13,222 @@ else:
     from typing import Self
 
 from matplotlib.figure import Figure
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 from matplotlib.backends.qt_compat import QtWidgets, QtCore, QtGui
 
-# Fix plot font types to work in paper sumbissions (Don't use type 3 fonts)
 import matplotlib
 
-matplotlib.rcParams["pdf.fonttype"] = 42
-matplotlib.rcParams["ps.fonttype"] = 42
-
 from .animation_player import AnimationPlayer
+from .frame_scheduler import (
+    AnimationResult,
+    FrameScheduler,
+    UpdateCoalescer,
+    wait_until,
+    wait_until_async,
+)
+from . import frame_cache, frame_hooks, frame_timing, tab_index, update_tracker
+from .custom_widget import CustomWidget
+from .data_queue import DataQueue
+from .frame_trace import TraceRecorder, active_recorder
+from .memory_policy import MemoryPolicy
 from .figure_widget import FigureWidget
-from .tabbed_figure_widget import TabbedFigureWidget
+from .streaming import StreamingLine
+from .tabbed_figure_widget import FigureBuilder, FigureTabSpec, TabbedFigureWidget
 from .tab_group_container import TabGroupContainer
 from . import keys
 
-# if sys.modules.get('IPython') is not None:
-try:
-    from IPython.core.getipython import get_ipython
 
-    _ipython = get_ipython()
-except ImportError:
-    _ipython = None
+def _get_ipython():
+    """
+    Returns the running IPython shell, or None. IPython is only imported if it
+    was already imported, since otherwise there cannot be a running shell.
+    """
+    if sys.modules.get("IPython") is None:
+        return None
+    try:
+        from IPython.core.getipython import get_ipython
+    except ImportError:
+        return None
+    return get_ipython()
 
-if _ipython is not None:
-    from IPython.utils.capture import capture_output
 
-    with capture_output() as captured:  # suppress output
-        # register IPython event loop to Qt - prevents need to call app.exec()
-        _ipython.run_line_magic("gui", "qt")
+def _setup_environment() -> None:
+    """
+    Configures the process for showing windows. Called once, when the first
+    window (or other Qt object) is created rather than on import.
+    """
+    # Fix plot font types to work in paper sumbissions (Don't use type 3 fonts)
+    matplotlib.rcParams["pdf.fonttype"] = 42
+    matplotlib.rcParams["ps.fonttype"] = 42
 
-    # SIGINT handles ctrl+c. The following lines allow it to kill without errors.
-    # Using sys.exit(0) in IPython stops script execution, but not the kernel.
-    signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(0))
-else:
-    # Use SIG_DFL (default) rather than letting Qt handle ctrl+c.
-    # Qt throws a KeyboardInterrupt exception, but only when the mouse hovers
-    # over the window or some other Qt action causes events to process.
-    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    ipython = _get_ipython()
+    if ipython is not None:
+        from IPython.utils.capture import capture_output
+
+        with capture_output() as captured:  # suppress output
+            # register IPython event loop to Qt - prevents need to call app.exec()
+            ipython.run_line_magic("gui", "qt")
+
+        # SIGINT handles ctrl+c. The following lines allow it to kill without
+        # errors. Using sys.exit(0) in IPython stops script execution, but not
+        # the kernel.
+        signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(0))
+    else:
+        # Use SIG_DFL (default) rather than letting Qt handle ctrl+c.
+        # Qt throws a KeyboardInterrupt exception, but only when the mouse hovers
+        # over the window or some other Qt action causes events to process.
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
 
 
 def is_interactive() -> bool:
     """
     Check if the current environment is interactive (e.g., IPython or Jupyter).
+    Only a running IPython shell counts, and IPython is only looked up if it
+    has already been imported (as it is in IPython and Jupyter), so calling
+    this function never imports IPython.
 
     Returns:
         out (bool): True if the environment is interactive, False otherwise.
     """
-    return bool(_ipython)
+    return _get_ipython() is not None
 
 
 icon_dir = os.path.join(os.path.dirname(__file__), "icons")
-# icon_files = ['tabplot.svg'] + [f'abracatabra{i}.svg' for i in range(1, 4)]
-icon_files = ["tabplot.svg", f"abracatabra{random.choice([1, 2, 3])}.svg"]
-icon_paths = [os.path.join(icon_dir, icon) for icon in icon_files]
+
+
+class _ExposeWatcher(QtCore.QObject):
+    """
+    Calls a function (from the event loop) whenever a native window is
+    exposed, e.g., after being restored from minimized or uncovered.
+    """
+
+    def __init__(self, window: QtGui.QWindow, callback: Callable[[], None]):
+        super().__init__(window)
+        self._callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.Type.Expose:
+            assert isinstance(watched, QtGui.QWindow)
+            if watched.isExposed():
+                # not while handling the event, since updating flushes events
+                QtCore.QTimer.singleShot(0, self._callback)
+        return False
+
+
+class _AnimationLoop:
+    """
+    The frame loop of `animate_all()` without the waiting, so the blocking and
+    asyncio versions only differ in how they wait for each frame deadline.
+    Each iteration draws a frame with `draw_next()`, waits for the deadline of
+    `scheduler`, and passes the lateness to `catch_up()`.
+    """
+
+    def __init__(
+        self,
+        frames: int,
+        ts: float,
+        step: int,
+        speed_scale: float,
+        realtime: bool,
+        print_timing: bool,
+    ):
+        self.frames = frames
+        self.ts = ts
+        self.step = step
+        self.speed_scale = speed_scale
+        self.realtime = realtime
+        self.print_timing = print_timing
+        self.delay = ts * step / speed_scale
+        self.result = AnimationResult(sim_time=frames * ts)
+        self.scheduler = FrameScheduler(self.delay, resync=not realtime)
+        self._idx = 0
+        self._start = time.perf_counter()
+        self.scheduler.start()
+
+    def draw_next(self) -> bool:
+        """
+        Draws the next frame.
+
+        Returns:
+            drawn (bool): False if all frames have been drawn.
+        """
+        if self._idx >= self.frames:
+            return False
+        TabbedPlotWindow.update_all(0.0, self._idx)
+        self.result.frames_drawn += 1
+        self._idx += self.step
+        return True
+
+    def catch_up(self, lateness: float) -> None:
+        """
+        In real-time mode, drops the frames that are already past if the frame
+        deadline was missed by more than one frame period.
+        """
+        if self.realtime and lateness > self.delay:
+            # behind the wall clock; jump to the frame that should be showing
+            # now (elapsed * speed_scale / ts)
+            skipped = int(lateness // self.delay)
+            self.scheduler.skip(skipped)
+            remaining = -(-(self.frames - self._idx) // self.step)  # ceil
+            self.result.frames_dropped += max(min(skipped, remaining), 0)
+            self._idx += skipped * self.step
+
+    def print_progress(self) -> None:
+        if not self.print_timing:
+            return
+        elapsed = time.perf_counter() - self._start
+        print(
+            f"animation time: {min(self._idx, self.frames - 1)*self.ts:.2f}s",
+            f"real time: {elapsed:.2f}s",
+            f"late: {max(self.scheduler.lateness, 0.0)*1000:5.1f}ms",
+            sep=" | ",
+            end="\r",
+        )
+
+    def finish(self) -> AnimationResult:
+        """
+        Draws the final frame and prints a summary (and hints if the animation
+        ran slower than requested).
+        """
+        TabbedPlotWindow.update_all(0.0, self.frames - 1)
+        result = self.result
+        scheduler = self.scheduler
+        result.real_time = time.perf_counter() - self._start
+        result.late_frames = scheduler.late_frames
+        result.max_lateness = scheduler.max_lateness
+
+        if self.print_timing:
+            print()  # newline after final frame printout
+            if result.late_frames > 0:
+                print(
+                    f"{result.late_frames} of {scheduler.frame_count} frames",
+                    "missed their deadline",
+                    f"(max {result.max_lateness*1000:.1f}ms late).",
+                )
+            if result.frames_dropped > 0:
+                total = result.frames_drawn + result.frames_dropped
+                print(
+                    f"Dropped {result.frames_dropped} of {total} frames",
+                    "to keep up with real time.",
+                )
+
+        speed_scale = self.speed_scale
+        actual_speed_scale = result.actual_speed_scale
+        buffer_percent = 10.0
+        percent_error = (speed_scale - actual_speed_scale) / speed_scale * 100.0
+        if percent_error > buffer_percent:
+            print("Your computer is not keeping up with the requested speeds!")
+            print(f"Tried to run at {speed_scale:.1f}x speed,", end=" ")
+            print(f"but actual speed was {actual_speed_scale:.1f}x.")
+            if speed_scale > 1.0:
+                print("Try decreasing 'speed_scale' or increasing 'step'", end="")
+            else:
+                print("Try increasing 'step'", end="")
+            print(" or set 'realtime=True' to drop frames.")
+        return result
 
 
 class TabbedPlotWindow:
@@ -81,9 +245,21 @@ class TabbedPlotWindow:
             tab group in the first row and first column.
     Methods:
         `add_figure_tab`: Method to add a new figure tab to the window.
+        `add_figure_tabs`: Method to add many figure tabs to the window at once.
+        `batch`: Suspends repaints and tab change signals while adding tabs.
+        `add_lazy_figure_tab`: Method to add a new figure tab that is only built
+            the first time it is shown.
         `add_custom_tab`: Method to add a new custom widget tab to the window.
         `register_animation_callback`: Method to register a callback function for
             how to update the figure or custom widget in a tab.
+        `register_animated_artists`: Method to register artists in a figure tab
+            that are redrawn with managed blitting.
+        `add_streaming_line`: Method to add a fixed-length line for live data
+            to a figure tab.
+        `add_data_queue`: Method to add a thread-safe queue for pushing data to
+            a tab from other threads.
+        `decimate_lines`: Method to draw long lines in a figure tab with about
+            2 samples per pixel.
         `update`: Method to update the figure on the active tab.
         `get_keyboard_shortcuts_str`: Returns a string with the keyboard shortcuts
             for the window.
@@ -95,21 +271,58 @@ class TabbedPlotWindow:
         `enable_tab_autohide`: Enables auto-hiding of tabs in the window.
         `set_tab_position`: Sets the position of the tab bar in the window.
         `set_tab_fontsize`: Sets the font size of the tab labels in the window.
+        `set_memory_policy`: Frees the rendering memory of inactive tabs.
     Static Methods:
         `show_all`: Shows all created windows.
         `update_all`: Updates all created windows.
         `animate_all`: Animates all created windows.
         `close_all_windows`: Closes all created windows.
+        `register_frame_hook`: Registers a hook called at a stage of every frame.
+        `remove_frame_hook`: Removes a registered frame hook.
+        `enable_frame_timing`: Starts recording per-tab update timings.
+        `disable_frame_timing`: Stops recording per-tab update timings.
+        `enable_frame_cache`: Starts caching rendered frames of figure tabs.
+        `disable_frame_cache`: Stops caching rendered frames.
         `get_screen_size`: Returns the size of the screen in pixels.
+        `set_update_coalescing`: Merges updates faster than a maximum frame rate.
+        `find_tab`: Returns the widget of a tab in any window by name.
+        `tabs`: Returns the locations of the tabs in all windows.
     """
 
-    _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    # the QApplication and icons are created with the first window
+    _app: QtWidgets.QApplication | None = None
     _registry: dict[str, Self] = {}
     _latest_id = None
     _count = 0
-    # _icons = [QtGui.QIcon(icon) for icon in icon_paths]
-    _icon1 = QtGui.QIcon(icon_paths[0])
-    _icon2 = QtGui.QIcon(icon_paths[1])
+    _max_update_fps: float | None = None  # see `set_update_coalescing`
+    _update_all_coalescer: UpdateCoalescer | None = None
+    _latest_update_all_idx = 0  # the callback index of the last `update_all`
+    _icon1: QtGui.QIcon | None = None
+    _icon2: QtGui.QIcon | None = None
+
+    @staticmethod
+    def _ensure_app() -> QtWidgets.QApplication:
+        """
+        Returns the QApplication, creating it (and the window icons) and
+        configuring the process on first use. This is deferred until a window
+        is created so that importing the package stays cheap and works without
+        a display.
+
+        Returns:
+            app (QApplication): The application instance.
+        """
+        if TabbedPlotWindow._app is None:
+            app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(
+                sys.argv
+            )
+            assert isinstance(app, QtWidgets.QApplication)
+            _setup_environment()
+            icon_files = ["tabplot.svg", f"abracatabra{random.choice([1, 2, 3])}.svg"]
+            icon_paths = [os.path.join(icon_dir, icon) for icon in icon_files]
+            TabbedPlotWindow._icon1 = QtGui.QIcon(icon_paths[0])
+            TabbedPlotWindow._icon2 = QtGui.QIcon(icon_paths[1])
+            TabbedPlotWindow._app = app
+        return TabbedPlotWindow._app
 
     def __new__(
         cls,
@@ -185,6 +398,7 @@ class TabbedPlotWindow:
         if hasattr(self, "id"):
             return
         # super().__init__()
+        TabbedPlotWindow._ensure_app()
         self.qt = QtWidgets.QMainWindow()
         self.id = str(self._latest_id)
         self.qt.setWindowTitle(f"Plot Window: {self.id}")
@@ -208,7 +422,7 @@ class TabbedPlotWindow:
                 for c in range(ncols):
                     main_layout.setColumnStretch(c, 1)
                     widget = TabbedFigureWidget(
-                        autohide_tabs, tab_position, tab_fontsize
+                        autohide_tabs, tab_position, tab_fontsize, self.id, r, c
                     )
                     row.append(widget)
                     main_layout.addWidget(widget, r, c)
@@ -218,7 +432,7 @@ class TabbedPlotWindow:
             if isinstance(nrows, list):
                 raise ValueError("Either nrows or ncols can be a list, not both.")
             main_layout = QtWidgets.QVBoxLayout(main_widget)
-            for r in ncols:
+            for i, r in enumerate(ncols):
                 if r < 1:
                     raise ValueError(f"Can not have {r} columns. Must be at least 1.")
                 widget_row = QtWidgets.QWidget()
@@ -227,7 +441,7 @@ class TabbedPlotWindow:
                 row = []
                 for c in range(r):
                     widget = TabbedFigureWidget(
-                        autohide_tabs, tab_position, tab_fontsize
+                        autohide_tabs, tab_position, tab_fontsize, self.id, i, c
                     )
                     row.append(widget)
                     hlayout.addWidget(widget)
@@ -239,7 +453,7 @@ class TabbedPlotWindow:
                 raise ValueError("Either nrows or ncols can be a list, not both.")
             row_major = False
             main_layout = QtWidgets.QHBoxLayout(main_widget)
-            for c in nrows:
+            for j, c in enumerate(nrows):
                 if c < 1:
                     raise ValueError(f"Can not have {c} columns. Must be at least 1.")
                 widget_col = QtWidgets.QWidget()
@@ -248,7 +462,7 @@ class TabbedPlotWindow:
                 col = []
                 for r in range(c):
                     widget = TabbedFigureWidget(
-                        autohide_tabs, tab_position, tab_fontsize
+                        autohide_tabs, tab_position, tab_fontsize, self.id, r, j
                     )
                     col.append(widget)
                     vlayout.addWidget(widget)
@@ -258,9 +472,14 @@ class TabbedPlotWindow:
             raise ValueError("Invalid values for `nrows` and `ncols`")
         main_layout.setContentsMargins(0, 0, 0, 0)
         self.tab_groups = TabGroupContainer(tab_groups, row_major)
+        self._memory_policy: MemoryPolicy | None = None
+        self._pending_callback_idx: int | None = None  # see `_is_obscured`
+        self._expose_watcher: _ExposeWatcher | None = None
+        self._update_coalescer: UpdateCoalescer | None = None
 
         # Register close event handler
         self.qt.closeEvent = self.close_event
+        update_tracker.mark_dirty(self.id)  # shown by the next update
 
         if open_window:
             self.qt.show()
@@ -282,8 +501,9 @@ class TabbedPlotWindow:
         Args:
             tab_id (str): The ID of the tab.
             blit (bool): Whether blitting will be used with the Figure in this
-                tab. If True, you are responsible for managing the background
-                and updating individual artists.
+                tab. If True, either register the artists that change with
+                `register_animated_artists` so the background is managed for
+                you, or manage the background and artist updates yourself.
             include_toolbar (bool): Whether to display a matplotlib toolbar with
                 the Figure in this tab.
             add_animation_player (bool): Whether to include an animation player
@@ -308,6 +528,103 @@ class TabbedPlotWindow:
         )
         return figure
 
+    def add_figure_tabs(self, specs: Iterable[FigureTabSpec]) -> list[Figure]:
+        """
+        Adds many figure tabs at once (see `batch`), which is much faster than
+        calling `add_figure_tab` for each tab.
+
+        Args:
+            specs (Iterable[str|int|dict]): A tab ID per tab (added to the tab
+                group at row 0, column 0), or a dictionary of keyword arguments
+                for `add_figure_tab`, e.g.,
+                `{"tab_id": "speed", "row": 1, "col": 0, "blit": True}`.
+        Returns:
+            figures (list[Figure]): The matplotlib Figure of each tab.
+        """
+        figures = []
+        with self.batch():
+            for spec in specs:
+                if isinstance(spec, dict):
+                    figures.append(self.add_figure_tab(**spec))
+                else:
+                    figures.append(self.add_figure_tab(str(spec)))
+        return figures
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        A context manager for building a window with many tabs. Repaints of
+        the window and tab change signals of every tab group are suspended
+        while inside the context, and a single layout and sizing pass is done
+        when it exits, instead of one per added tab.
+
+        Example:
+        ```python
+        window = TabbedPlotWindow(nrows=4, ncols=3)
+        with window.batch():
+            for i, name in enumerate(names):
+                fig = window.add_figure_tab(name, row=i % 4, col=i % 3)
+                fig.add_subplot().plot(data[name])
+        ```
+        """
+        updates = self.qt.updatesEnabled()
+        self.qt.setUpdatesEnabled(False)
+        try:
+            with ExitStack() as stack:
+                for tabs in self.tab_groups:
+                    stack.enter_context(tabs.batch())
+                yield
+        finally:
+            self.qt.setUpdatesEnabled(updates)
+
+    def add_lazy_figure_tab(
+        self,
+        tab_id: str,
+        builder: FigureBuilder,
+        blit: bool = False,
+        include_toolbar: bool = True,
+        add_animation_player: bool = False,
+        row: int = 0,
+        col: int = 0,
+    ) -> None:
+        """
+        Adds a new tab to the window whose Figure is only created (and drawn by
+        `builder`) the first time the tab becomes the current tab. This keeps
+        the startup time and memory of windows with many tabs proportional to
+        the tabs that are actually shown.
+
+        Args:
+            tab_id (str): The ID of the tab.
+            builder (Callable[[Figure], Callable[[int], None] | None]): A
+                function that draws the contents of the Figure it is given. If
+                it returns a function, that function is registered as the
+                animation callback of the tab.
+            blit (bool): Whether blitting will be used with the Figure in this
+                tab.
+            include_toolbar (bool): Whether to display a matplotlib toolbar with
+                the Figure in this tab.
+            add_animation_player (bool): Whether to include an animation player
+                widget in this tab (play, pause, etc.). Only works if animation
+                callbacks are registered.
+            row (int): The row index of the tab group to add the tab to.
+            col (int): The column index of the tab group to add the tab to.
+        Notes
+        -----
+        Accessing the tab (e.g., with `register_animation_callback`) builds it,
+        so return the animation callback from the builder instead:
+        ```python
+        def build_speed(fig):
+            ax = fig.add_subplot()
+            (line,) = ax.plot(t, speed)
+            return lambda i: line.set_data(t[:i], speed[:i])
+
+        window.add_lazy_figure_tab("speed", build_speed)
+        ```
+        """
+        self.tab_groups[row, col].add_lazy_figure_tab(
+            tab_id, builder, blit, include_toolbar, add_animation_player
+        )
+
     def add_custom_tab(
         self,
         widget: QtWidgets.QWidget,
@@ -362,17 +679,217 @@ class TabbedPlotWindow:
         tab_widget.register_animation_callback(callback)
         return
 
+    def register_animated_artists(
+        self, artists: Iterable[Artist], tab_id: str, row: int = 0, col: int = 0
+    ) -> None:
+        """
+        Registers artists in the figure of the specified tab that change every
+        frame. The tab will then manage blitting: the background is cached (and
+        recaptured after resizes, zoom/pan, etc.) and only these artists are
+        redrawn on each update.
+
+        Args:
+            artists (Iterable[Artist]): The matplotlib artists to animate.
+            tab_id (str): The ID/title of the tab.
+            row (int): The row index of the tab group containing the tab.
+            col (int): The column index of the tab group containing the tab.
+        """
+        tab_widget = self.tab_groups[row, col][tab_id]
+        if not isinstance(tab_widget, FigureWidget):
+            raise ValueError(f"Tab '{tab_id}' does not contain a matplotlib Figure.")
+        tab_widget.register_animated_artists(artists)
+        return
+
+    def add_streaming_line(
+        self,
+        ax: Axes,
+        tab_id: str,
+        capacity: int,
+        row: int = 0,
+        col: int = 0,
+        autoscroll: bool = True,
+        **line_kwargs,
+    ) -> StreamingLine:
+        """
+        Adds a line for live data to an axes in the specified tab. The line
+        keeps only the most recent `capacity` samples in a preallocated ring
+        buffer, so memory and draw time stay constant while streaming. Append
+        samples to the returned object and call `update()`/`update_all()` to
+        draw them.
+
+        Args:
+            ax (Axes): The axes to add the line to.
+            tab_id (str): The ID/title of the tab containing the axes.
+            capacity (int): The maximum number of samples kept (and drawn).
+            row (int): The row index of the tab group containing the tab.
+            col (int): The column index of the tab group containing the tab.
+            autoscroll (bool): If True, the x-axis follows the buffered samples.
+            **line_kwargs: Keyword arguments passed to `ax.plot()`.
+        Returns:
+            stream (StreamingLine): The streaming line to append samples to.
+        """
+        tab_widget = self.tab_groups[row, col][tab_id]
+        if not isinstance(tab_widget, FigureWidget):
+            raise ValueError(f"Tab '{tab_id}' does not contain a matplotlib Figure.")
+        return tab_widget.add_streaming_line(ax, capacity, autoscroll, **line_kwargs)
+
+    def add_data_queue(
+        self,
+        tab_id: str,
+        handler: Callable[[list], None],
+        maxlen: int = 1000,
+        row: int = 0,
+        col: int = 0,
+    ) -> DataQueue:
+        """
+        Adds a bounded, thread-safe queue to the specified tab. Producer
+        threads `put` payloads (e.g., NumPy arrays) into the queue without
+        ever waiting for rendering; if the queue is full, the oldest payload
+        is dropped. The GUI thread drains the queue in batches through a
+        queued Qt signal, calling `handler` with the payloads, and figure tabs
+        are redrawn afterwards if they are shown.
+
+        Args:
+            tab_id (str): The ID/title of the tab the data is for.
+            handler (Callable[[list], None]): Called in the GUI thread with the
+                queued payloads, oldest first, to update the tab.
+            maxlen (int): The maximum number of queued payloads.
+            row (int): The row index of the tab group containing the tab.
+            col (int): The column index of the tab group containing the tab.
+        Returns:
+            queue (DataQueue): The queue to push payloads into.
+        Notes
+        -----
+        ```python
+        stream = window.add_streaming_line(ax, "imu", capacity=5000)
+        queue = window.add_data_queue(
+            "imu", lambda batch: [stream.extend(t, y) for t, y in batch]
+        )
+        # in a worker thread:
+        queue.put((t, y))
+        ```
+        """
+        tab_widget = self.tab_groups[row, col][tab_id]
+        if isinstance(tab_widget, FigureWidget):
+            return tab_widget.add_data_queue(handler, maxlen)
+        return DataQueue(handler, maxlen, parent=tab_widget)
+
+    def decimate_lines(
+        self,
+        tab_id: str,
+        lines: Iterable[Line2D] | None = None,
+        row: int = 0,
+        col: int = 0,
+    ) -> None:
+        """
+        Draws long lines in the specified tab with only the minimum and maximum
+        sample of each horizontal pixel, which looks the same as drawing every
+        sample but makes redraws (updates, tab switches, resizes) much faster.
+        The full-resolution data is kept, and the lines are re-decimated when
+        the figure is resized or new data is set on them.
+
+        Args:
+            tab_id (str): The ID/title of the tab.
+            lines (Iterable[Line2D]|None): The lines to decimate. If None,
+                every line currently in the figure is decimated.
+            row (int): The row index of the tab group containing the tab.
+            col (int): The column index of the tab group containing the tab.
+        """
+        tab_widget = self.tab_groups[row, col][tab_id]
+        if not isinstance(tab_widget, FigureWidget):
+            raise ValueError(f"Tab '{tab_id}' does not contain a matplotlib Figure.")
+        tab_widget.decimate_lines(*(lines or ()))
+
     def update(self, callback_idx: int = 0) -> None:
         """
         This will update the figure on the active (visible) tabs. Similar to
         pyplot.pause(), but for the current tab on this window. No additional
         time delay is added to the function, so it will return immediately after
-        updating the figure.
+        updating the figure. If update coalescing is enabled (see
+        `set_update_coalescing`), updates faster than the maximum frame rate
+        are merged and only the latest `callback_idx` is rendered.
+        """
+        max_fps = TabbedPlotWindow._max_update_fps
+        if max_fps is None:
+            self._render_update(callback_idx)
+            return
+        if self._update_coalescer is None:
+            self._update_coalescer = UpdateCoalescer(
+                max_fps, self._render_update, parent=self.qt
+            )
+        else:
+            self._update_coalescer.set_max_fps(max_fps)
+        self._update_coalescer.request(callback_idx)
+
+    def _render_update(self, callback_idx: int) -> None:
+        """
+        Updates the active tabs, firing the frame start/end hooks. Does nothing
+        if the window has been closed.
+        """
+        if TabbedPlotWindow._registry.get(self.id) is not self:
+            return
+        if frame_hooks.enabled:
+            frame_hooks.fire(frame_hooks.FRAME_START, self.id, None, callback_idx)
+            self._update(callback_idx)
+            frame_hooks.fire(frame_hooks.FRAME_END, self.id, None, callback_idx)
+        else:
+            self._update(callback_idx)
+
+    def _update(self, callback_idx: int) -> None:
+        """
+        Updates the active tabs without firing the frame start/end hooks.
+        Windows that are minimized or not exposed (e.g., fully covered or on
+        another virtual desktop) are skipped, and updated with the latest
+        callback index once they are exposed again.
         """
+        if self._is_obscured():
+            self._pending_callback_idx = callback_idx
+            self._set_latest_callback_idx(callback_idx)
+            return
+        self._pending_callback_idx = None
+        hooks = frame_hooks.enabled
+        if hooks:
+            frame_hooks.fire(frame_hooks.WINDOW_START, self.id, None, callback_idx)
         if not self.qt.isVisible():
             self.qt.show()
         for tabs in self.tab_groups:
             tabs.update_active_tab(callback_idx)
+        update_tracker.updated(self.id, callback_idx)
+        if hooks:
+            frame_hooks.fire(frame_hooks.WINDOW_END, self.id, None, callback_idx)
+
+    def _set_latest_callback_idx(self, callback_idx: int) -> None:
+        """
+        Records the callback index in every tab group without updating, so a
+        tab that is switched to later is drawn at this frame.
+        """
+        for tabs in self.tab_groups:
+            tabs.set_latest_callback_idx(callback_idx)
+
+    def _is_obscured(self) -> bool:
+        """
+        Returns True if the window is shown but can not be seen, i.e., it is
+        minimized or its native window is not exposed. Starts watching the
+        native window for being exposed again.
+        """
+        if not self.qt.isVisible():
+            return False  # hidden windows are shown by the update
+        handle = self.qt.windowHandle()
+        if handle is None:
+            return False
+        if self._expose_watcher is None:
+            self._expose_watcher = _ExposeWatcher(handle, self._catch_up)
+        return self.qt.isMinimized() or not handle.isExposed()
+
+    def _catch_up(self) -> None:
+        """
+        Updates the window with the latest callback index of the updates that
+        were skipped while it was obscured.
+        """
+        idx = self._pending_callback_idx
+        if idx is None or TabbedPlotWindow._registry.get(self.id) is not self:
+            return
+        self._update(idx)
 
     def _key_press_event(self, event: QtGui.QKeyEvent):
         """
@@ -438,6 +955,12 @@ class TabbedPlotWindow:
         event.accept()
         # self.qt.closeEvent(event)
         del TabbedPlotWindow._registry[self.id]
+        tab_index.remove_window(self.id)
+        update_tracker.forget(self.id)
+        if self._update_coalescer is not None:
+            self._update_coalescer.cancel()  # do not reopen the window later
+            self._update_coalescer.deleteLater()
+            self._update_coalescer = None
         TabbedPlotWindow._count -= 1
         # if TabbedPlotWindow._count == 0:
         #     self._app.quit()
@@ -473,18 +996,12 @@ class TabbedPlotWindow:
         """
         Applies a tight layout to the figure in each tab of the window, even if
         they are not the active Figure. Same as calling figure.tight_layout()
-        directly on each Figure.
+        directly on each Figure, but inactive tabs are laid out at the size
+        they will have when shown, without switching to them, and are only
+        drawn once shown.
         """
         for tabs in self.tab_groups:
-            current_index = tabs.currentIndex()
-            for i in range(tabs.count()):
-                tab = tabs.widget(i)
-                if not isinstance(tab, FigureWidget):
-                    continue
-                tabs.setCurrentIndex(i)  # tab has to be active to apply tight layout
-                tab.figure.tight_layout()
-                tab.update_figure()
-            tabs.setCurrentIndex(current_index)
+            tabs.apply_tight_layout()
 
     def enable_tab_autohide(self, enable: bool = True) -> None:
         """
@@ -497,6 +1014,50 @@ class TabbedPlotWindow:
         for tabs in self.tab_groups:
             tabs.setTabBarAutoHide(enable)
 
+    def set_memory_policy(
+        self,
+        max_idle_seconds: float | None = None,
+        max_megabytes: float | None = None,
+        check_interval: float = 5.0,
+    ) -> MemoryPolicy | None:
+        """
+        Frees the rendering memory (several MB per figure at high resolutions)
+        of figure tabs that are not shown, either once they have been hidden
+        for longer than `max_idle_seconds` or, starting with the tabs hidden
+        the longest, whenever all tabs in the window together use more than
+        `max_megabytes`. Released tabs show a downscaled snapshot until they
+        are redrawn when activated. The figures and their artists are kept.
+        Call with no limits to disable the policy.
+
+        Args:
+            max_idle_seconds (float|None): Release tabs hidden for longer than
+                this many seconds.
+            max_megabytes (float|None): The rendering memory budget of all
+                figure tabs in the window.
+            check_interval (float): How often (seconds) the policy is applied.
+        Returns:
+            policy (MemoryPolicy|None): The policy, or None if disabled.
+        """
+        if self._memory_policy is not None:
+            self._memory_policy.stop()
+            self._memory_policy.deleteLater()
+            self._memory_policy = None
+        if max_idle_seconds is None and max_megabytes is None:
+            return None
+
+        def figure_widgets():
+            for tabs in self.tab_groups:
+                yield from tabs._figure_widgets.values()
+
+        self._memory_policy = MemoryPolicy(
+            figure_widgets,
+            max_idle_seconds,
+            max_megabytes,
+            check_interval,
+            parent=self.qt,
+        )
+        return self._memory_policy
+
     def set_tab_position(self, position: str) -> None:
         """
         Sets the position of the tab bar in the window.
@@ -539,7 +1100,9 @@ class TabbedPlotWindow:
             window = TabbedPlotWindow._registry[key]
             if not window.qt.isVisible():
                 window.qt.show()
-            if tight_layout:
+        if tight_layout:
+            # lay out every window once all of them are shown and sized
+            for window in list(TabbedPlotWindow._registry.values()):
                 window.apply_tight_layout()
         if block is None:
             block = not is_interactive()
@@ -562,24 +1125,147 @@ class TabbedPlotWindow:
         Args:
             delay_seconds (float): The minimum delay in seconds before returning.
                 If windows are updated faster than this, this function will
-                block until `delay_seconds` seconds have passed. If the windows
+                process GUI events until `delay_seconds` seconds have passed,
+                so the windows stay responsive while waiting. If the windows
                 take longer than `delay_seconds` seconds to update, the function
                 execution time will be greater than `delay_seconds`.
+            callback_idx (int): An index passed to the registered animation
+                callbacks. If update coalescing is enabled (see
+                `set_update_coalescing`), updates faster than the maximum frame
+                rate only store the index and return without rendering; the
+                latest index is rendered at the next refresh.
         Returns:
             update_time (float): The amount of time (seconds) taken to update
                 the windows.
         """
         start = time.perf_counter()
-        for key in list(TabbedPlotWindow._registry.keys()):
+        update_time = TabbedPlotWindow._request_update(callback_idx)
+        if TabbedPlotWindow._count > 0:
+            lateness = wait_until(start + delay_seconds)
+            TabbedPlotWindow._record_deadline(start, delay_seconds, lateness)
+        return update_time
+
+    @staticmethod
+    async def update_all_async(
+        delay_seconds: float = 0.0, callback_idx: int = 0
+    ) -> float:
+        """
+        Same as `update_all()`, but awaits the delay instead of blocking, for
+        use in asyncio code (e.g., a loop that also awaits network or device
+        I/O). Qt events are processed between awaits, so the windows stay
+        responsive, and control is yielded to other asyncio tasks at least
+        once, even if `delay_seconds` is 0. Cancelling the awaiting task stops
+        the wait; the windows have already been updated at that point.
+
+        Args:
+            delay_seconds (float): The minimum delay in seconds before returning.
+            callback_idx (int): An index passed to the registered animation
+                callbacks (see `update_all()`).
+        Returns:
+            update_time (float): The amount of time (seconds) taken to update
+                the windows.
+        """
+        start = time.perf_counter()
+        update_time = TabbedPlotWindow._request_update(callback_idx)
+        if TabbedPlotWindow._count > 0:
+            lateness = await wait_until_async(start + delay_seconds)
+            TabbedPlotWindow._record_deadline(start, delay_seconds, lateness)
+        else:
+            await wait_until_async(start)  # yield to other tasks
+        return update_time
+
+    @staticmethod
+    def _request_update(callback_idx: int) -> float:
+        """
+        Updates the windows, or passes the request to the update coalescer if
+        coalescing is enabled (see `set_update_coalescing`).
+
+        Returns:
+            update_time (float): The time (seconds) taken to update.
+        """
+        start = time.perf_counter()
+        coalescer = TabbedPlotWindow._update_all_coalescer
+        if coalescer is None:
+            TabbedPlotWindow._update_windows(callback_idx)
+        else:
+            coalescer.request(callback_idx)
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _record_deadline(
+        start: float, delay_seconds: float, lateness: float
+    ) -> None:
+        """
+        Adds the requested vs. actual end of an update's delay to the active
+        trace recorder, if any.
+        """
+        recorder = active_recorder()
+        if recorder is not None and delay_seconds > 0:
+            deadline = start + delay_seconds
+            recorder.add_deadline(deadline, deadline + lateness)
+
+    @staticmethod
+    def _update_windows(callback_idx: int) -> None:
+        """
+        Updates the windows that have something new to draw (see
+        `update_tracker`), firing the frame start/end hooks. The other windows
+        only record the callback index, so a tab switched to later is drawn
+        at the current frame.
+        """
+        hooks = frame_hooks.enabled
+        if hooks:
+            frame_hooks.fire(frame_hooks.FRAME_START, None, None, callback_idx)
+        work = update_tracker.work_list(callback_idx)
+        for key in work:
             if not key in TabbedPlotWindow._registry:
                 continue  # in case window was closed during iteration
             window = TabbedPlotWindow._registry[key]
-            window.update(callback_idx)
-        update_time = time.perf_counter() - start
-        if TabbedPlotWindow._count > 0:
-            remaining_delay = max(delay_seconds - update_time, 0.0)
-            time.sleep(remaining_delay)
-        return update_time
+            window._update(callback_idx)
+        if callback_idx != TabbedPlotWindow._latest_update_all_idx:
+            TabbedPlotWindow._latest_update_all_idx = callback_idx
+            updated = set(work)
+            for key, window in list(TabbedPlotWindow._registry.items()):
+                if key not in updated:
+                    window._set_latest_callback_idx(callback_idx)
+        if hooks:
+            frame_hooks.fire(frame_hooks.FRAME_END, None, None, callback_idx)
+
+    @staticmethod
+    def set_update_coalescing(max_fps: float | None = 60.0) -> None:
+        """
+        Merges update requests (`update_all()` and `update()`) that arrive
+        faster than `max_fps`, e.g., from a simulation loop running faster
+        than the monitor refresh rate. A request within one refresh interval
+        of the previous render only stores its `callback_idx` and returns
+        immediately, without drawing. The latest stored index is rendered by
+        the next request after the interval, or by a timer when the Qt event
+        loop runs, so the final state is always drawn.
+
+        Args:
+            max_fps (float|None): The maximum number of renders per second. If
+                None, coalescing is disabled and pending updates are rendered.
+        """
+        coalescer = TabbedPlotWindow._update_all_coalescer
+        windows = list(TabbedPlotWindow._registry.values())
+        if max_fps is None:
+            TabbedPlotWindow._max_update_fps = None
+            TabbedPlotWindow._update_all_coalescer = None
+            if coalescer is not None:
+                coalescer.flush()
+                coalescer.deleteLater()
+            for window in windows:
+                if window._update_coalescer is not None:
+                    window._update_coalescer.flush()
+                    window._update_coalescer.deleteLater()
+                    window._update_coalescer = None
+            return
+        TabbedPlotWindow._ensure_app()  # for the timers
+        if coalescer is None:
+            coalescer = UpdateCoalescer(max_fps, TabbedPlotWindow._update_windows)
+            TabbedPlotWindow._update_all_coalescer = coalescer
+        else:
+            coalescer.set_max_fps(max_fps)
+        TabbedPlotWindow._max_update_fps = max_fps
 
     @staticmethod
     def animate_all(
@@ -590,7 +1276,10 @@ class TabbedPlotWindow:
         print_timing: bool = False,
         use_player: bool = False,
         hold: bool = True,
-    ) -> None:
+        realtime: bool = False,
+        trace_file: str | None = None,
+        prefetch: int = 0,
+    ) -> AnimationResult:
         """
         Animates all created windows by repeatedly calling `update_all()` in a
         loop for the given number of frames. This is a convenience function for
@@ -611,9 +1300,10 @@ class TabbedPlotWindow:
                 fast (i.e., half the time step between frames), meaning that a
                 10 sec simulation should take 5 sec to animate.
             print_timing (bool): If True, prints timing information for each frame,
-                inluding the running animation time and wall time. Also prints hints
-                after the animation is done on how to improve performance if the
-                animation is running slower than real time.
+                inluding the running animation time, wall time, and how late the
+                frame was. Also prints hints after the animation is done on how
+                to improve performance if the animation is running slower than
+                real time.
             use_player (bool): Specifies whether to use an animation player window
                 with media controls (play, pause, step, etc.) to control the
                 animation. If an animation player has already been added to a tab,
@@ -622,6 +1312,26 @@ class TabbedPlotWindow:
             hold (bool): Specify whether to keep the windows open (blocking code)
                 at the last frame when the animation is complete. Essentially
                 whether to call `show_all()` at the end or not.
+            realtime (bool): If True, the frame to draw is computed from the
+                wall-clock time (`elapsed * speed_scale / ts`) and frames are
+                dropped whenever drawing falls behind, so the animation always
+                takes `frames * ts / speed_scale` seconds. Ignored when using
+                the animation player.
+            trace_file (str|None): If given, a timeline of the animation (spans
+                per frame, window, and tab callback/draw plus the requested vs.
+                actual frame deadlines) is written to this file in the Chrome
+                trace-event format, or as JSON lines if it ends with ".jsonl".
+                Open it in chrome://tracing or https://ui.perfetto.dev.
+            prefetch (int): When using the animation player, the number of
+                frames before and after the current frame to render in the
+                background while paused, so stepping through frames is instant.
+                Enables the frame cache (see `enable_frame_cache()`) if it is
+                not enabled yet. Each prefetched frame calls the animation
+                callbacks twice: once to render it and once to restore the
+                displayed frame.
+        Returns:
+            result (AnimationResult): Timing statistics of the animation, e.g.,
+                how many frames were drawn and dropped.
         """
         if frames < 1 or step < 1:
             raise ValueError("Frames and step must be positive integers.")
@@ -630,65 +1340,128 @@ class TabbedPlotWindow:
         if step / frames > 0.01:
             print("Warning: `step` is larger than 1% of `frames`.")
 
-        delay = ts * step / speed_scale
+        if trace_file is not None:
+            with TraceRecorder(trace_file):
+                result = TabbedPlotWindow.animate_all(
+                    frames,
+                    ts,
+                    step,
+                    speed_scale,
+                    print_timing,
+                    use_player,
+                    hold=False,
+                    realtime=realtime,
+                    prefetch=prefetch,
+                )
+            if hold:
+                TabbedPlotWindow.show_all()
+            return result
 
         if use_player:
+            app = TabbedPlotWindow._ensure_app()
             player = AnimationPlayer.instance() or AnimationPlayer()
             player.setFocus(QtCore.Qt.FocusReason.ActiveWindowFocusReason)
 
             def callback(frame: int):
                 TabbedPlotWindow.update_all(0.0, frame)
 
-            player.setup(frames, ts, step, callback)
-            TabbedPlotWindow._app.processEvents()
-
+            prefetch_callback = None
+            if prefetch > 0:
+                if frame_cache.active_cache() is None:
+                    frame_cache.enable()
+                prefetch_callback = TabbedPlotWindow._prefetch_all
+            player.setup(frames, ts, step, callback, prefetch_callback, prefetch)
+            app.processEvents()
+
+            result = AnimationResult(sim_time=frames * ts)
+            scheduler = FrameScheduler(ts * step / speed_scale)
+            start = time.perf_counter()
             while player.isVisible() and TabbedPlotWindow._count > 0:
-                start = time.perf_counter()
                 stepped = player.step_frame()
-                if not stepped:
-                    TabbedPlotWindow._app.processEvents()
-                update_time = time.perf_counter() - start
+                if stepped:
+                    result.frames_drawn += 1
+                else:
+                    app.processEvents()
                 if TabbedPlotWindow._count > 0:
-                    remaining_delay = max(delay - update_time, 0.0)
-                    time.sleep(remaining_delay)
-            return
+                    scheduler.wait()
+            result.real_time = time.perf_counter() - start
+            result.late_frames = scheduler.late_frames
+            result.max_lateness = scheduler.max_lateness
+            return result
+
+        loop = _AnimationLoop(frames, ts, step, speed_scale, realtime, print_timing)
+        while loop.draw_next():
+            if TabbedPlotWindow._count > 0:
+                loop.catch_up(loop.scheduler.wait())
+            loop.print_progress()
+        result = loop.finish()
 
-        start = time.perf_counter()
-        for i in range(0, frames, step):
-            TabbedPlotWindow.update_all(delay, i)
-
-            if not print_timing:
-                continue
+        if hold:
+            TabbedPlotWindow.show_all()
+        return result
 
-            elapsed = time.perf_counter() - start
-            print(
-                f"animation time: {i*ts:.2f}s",
-                f"real time: {elapsed:.2f}s",
-                sep=" | ",
-                end="\r",
-            )
-        # Ensure the final frame is drawn
-        TabbedPlotWindow.update_all(0.0, frames - 1)
+    @staticmethod
+    async def animate_all_async(
+        frames: int,
+        ts: float,
+        step: int = 1,
+        speed_scale: float = 1.0,
+        print_timing: bool = False,
+        hold: bool = False,
+        realtime: bool = False,
+        trace_file: str | None = None,
+    ) -> AnimationResult:
+        """
+        Same as `animate_all()`, but awaits between frames instead of blocking,
+        so it can run as an asyncio task next to other coroutines (e.g., ones
+        receiving the data being plotted). Qt events are processed while
+        waiting for each frame deadline. Cancelling the task stops the
+        animation at the current frame by raising `asyncio.CancelledError`.
+        The animation player (`use_player`) and its `prefetch` option are not
+        supported, since the player runs its own blocking loop.
 
-        if print_timing:
-            print()  # newline after final frame printout
+        Args:
+            frames (int): The number of frames to animate.
+            ts (float): The time step between frames in seconds.
+            step (int): The step size between frames.
+            speed_scale (float): A scaling factor for the speed of the animation.
+            print_timing (bool): If True, prints timing information for each
+                frame and a summary at the end (see `animate_all()`).
+            hold (bool): If True, keeps processing Qt events (awaiting) after the
+                last frame until all windows are closed.
+            realtime (bool): If True, frames are dropped whenever drawing falls
+                behind the wall clock (see `animate_all()`).
+            trace_file (str|None): If given, a timeline of the animation is
+                written to this file (see `animate_all()`).
+        Returns:
+            result (AnimationResult): Timing statistics of the animation, e.g.,
+                how many frames were drawn and dropped.
+        """
+        if frames < 1 or step < 1:
+            raise ValueError("Frames and step must be positive integers.")
+        if ts <= 0 or speed_scale <= 0:
+            raise ValueError("Time step and speed scale must be positive values.")
 
-        real_time = time.perf_counter() - start
-        sim_time = frames * ts
-        actual_speed_scale = sim_time / real_time
-        buffer_percent = 10.0
-        percent_error = (speed_scale - actual_speed_scale) / speed_scale * 100.0
-        if percent_error > buffer_percent:
-            print("Your computer is not keeping up with the requested speeds!")
-            print(f"Tried to run at {speed_scale:.1f}x speed,", end=" ")
-            print(f"but actual speed was {actual_speed_scale:.1f}x.")
-            if speed_scale > 1.0:
-                print("Try decreasing 'speed_scale' or increasing 'step'")
-            else:
-                print("Try increasing 'step'")
+        if trace_file is not None:
+            with TraceRecorder(trace_file):
+                result = await TabbedPlotWindow.animate_all_async(
+                    frames, ts, step, speed_scale, print_timing, realtime=realtime
+                )
+        else:
+            loop = _AnimationLoop(
+                frames, ts, step, speed_scale, realtime, print_timing
+            )
+            while loop.draw_next():
+                if TabbedPlotWindow._count > 0:
+                    loop.catch_up(await loop.scheduler.wait_async())
+                else:
+                    await wait_until_async(0.0)  # yield to other tasks
+                loop.print_progress()
+            result = loop.finish()
 
-        if hold:
-            TabbedPlotWindow.show_all()
+        while hold and TabbedPlotWindow._count > 0:
+            await wait_until_async(time.perf_counter() + 0.01, poll_interval=0.01)
+        return result
 
     @staticmethod
     def close_all_windows() -> None:
@@ -701,6 +1474,150 @@ class TabbedPlotWindow:
             window = TabbedPlotWindow._registry[key]
             window.qt.close()
 
+    @staticmethod
+    def _prefetch_all(callback_idx: int) -> bool:
+        """
+        Renders a frame of the active tabs in all visible windows into the
+        frame cache without changing the displayed frames (see
+        `FigureWidget.prefetch_frame`, which calls each callback twice).
+
+        Returns:
+            rendered (bool): True if any frame was rendered.
+        """
+        rendered = False
+        for window in list(TabbedPlotWindow._registry.values()):
+            if not window.qt.isVisible():
+                continue
+            for tabs in window.tab_groups:
+                rendered |= tabs.prefetch_active_tab(callback_idx)
+        return rendered
+
+    @staticmethod
+    def register_frame_hook(event: str, hook: frame_hooks.FrameHook) -> None:
+        """
+        Registers a hook that is called at a stage of every frame update, e.g.,
+        to start/stop a profiler around the hot path. Hooks are called as
+        `hook(window_id, tab_id, callback_idx, row, col)`, where `row` and
+        `col` locate the tab group of the tab, and the IDs are None when the
+        stage does not belong to a specific window or tab. Registering
+        hooks does not change how tabs are drawn. See `frame_hooks` for the
+        order of the events.
+
+        Args:
+            event (str): The stage of the frame to hook into:
+                - "frame_start"/"frame_end": start/end of `update_all()` (both
+                    IDs are None) or `update()` (the window ID is given).
+                - "window_start"/"window_end": around the update of each
+                    window that has something new to draw (tab ID is None).
+                - "callback_start"/"callback_end": around each tab's
+                    animation callback.
+                - "draw_start"/"draw_end": around drawing each figure tab,
+                    including flushing GUI events (when a redraw scheduled
+                    with `draw_idle()` is rendered).
+            hook (Callable[[str|None, str|None, int, int|None, int|None], None]):
+                The function to call.
+        """
+        frame_hooks.register_hook(event, hook)
+
+    @staticmethod
+    def remove_frame_hook(event: str, hook: frame_hooks.FrameHook) -> None:
+        """
+        Removes a hook registered with `register_frame_hook()`.
+
+        Args:
+            event (str): The stage of the frame the hook was registered for.
+            hook (Callable[..., None]): The hook to remove.
+        """
+        frame_hooks.remove_hook(event, hook)
+
+    @staticmethod
+    def enable_frame_timing(capacity: int = 1000) -> frame_timing.FrameTimer:
+        """
+        Starts recording how long every tab update takes, split into the
+        animation callback, drawing the canvas, and flushing GUI events. Only
+        the most recent `capacity` updates of each tab are kept. Use the
+        returned timer to get summary statistics per window or per tab. Timing
+        does not change how tabs are drawn: canvases redrawn with `draw_idle()`
+        are rendered while flushing events, so their rendering time is counted
+        in the "flush" phase.
+
+        Args:
+            capacity (int): The maximum number of updates kept per tab.
+        Returns:
+            timer (FrameTimer): The timer holding the recorded samples. If
+                timing is already enabled, the existing timer is returned.
+        """
+        return frame_timing.enable(capacity)
+
+    @staticmethod
+    def disable_frame_timing() -> None:
+        """
+        Stops recording tab update timings.
+        """
+        frame_timing.disable()
+
+    @staticmethod
+    def enable_frame_cache(max_megabytes: float = 256) -> frame_cache.FrameCache:
+        """
+        Starts caching the rendered frames of figure tabs, so revisiting a
+        frame (e.g., scrubbing the animation player slider back and forth) is a
+        copy of pixels instead of a redraw. The animation callback is still
+        called for every frame. The least recently used frames are evicted
+        when the cache exceeds its memory budget, and the frames of a tab are
+        invalidated whenever it is redrawn otherwise, e.g., by zooming or
+        panning. Only use this if your figures depend only on the frame index.
+
+        Args:
+            max_megabytes (float): The memory budget of the cache in megabytes.
+        Returns:
+            cache (FrameCache): The cache holding the rendered frames. If
+                caching is already enabled, the existing cache is returned with
+                the new budget.
+        """
+        return frame_cache.enable(max_megabytes)
+
+    @staticmethod
+    def disable_frame_cache() -> None:
+        """
+        Stops caching rendered frames and releases the cached frames.
+        """
+        frame_cache.disable()
+
+    @staticmethod
+    def find_tab(
+        name: str | int, window_id: str | int | None = None
+    ) -> FigureWidget | CustomWidget:
+        """
+        Returns the widget of a tab in any window without scanning the windows
+        and tab groups, using an index that is kept up to date as tabs are
+        added and windows are closed.
+
+        Args:
+            name (str|int): The qualified name of the tab,
+                "window/row/col/tab", or its ID if it is unique (within the
+                window, if given).
+            window_id (str|int|None): Only look for the tab in this window.
+        Returns:
+            widget (FigureWidget|CustomWidget): The widget of the tab.
+        """
+        if window_id is not None:
+            window_id = str(window_id)
+        return tab_index.find(str(name), window_id).widget
+
+    @staticmethod
+    def tabs(tab_id: str | int | None = None) -> list[tab_index.TabLocation]:
+        """
+        Returns the locations (window, row, column, and tab ID) of the tabs in
+        all windows, in the order they were created.
+
+        Args:
+            tab_id (str|int|None): Only return the tabs with this ID.
+        Returns:
+            locations (list[TabLocation]): The locations of the tabs. The
+                `widget` attribute of a location is the widget of the tab.
+        """
+        return tab_index.tabs(None if tab_id is None else str(tab_id))
+
     @staticmethod
     def get_screen_size() -> tuple[int, int]:
         """
@@ -712,10 +1629,10 @@ class TabbedPlotWindow:
             (width, height) (tuple[int,int]): The width and height of the screen
                 in pixels.
         """
-        assert isinstance(TabbedPlotWindow._app, QtWidgets.QApplication)
-        screen = TabbedPlotWindow._app.screenAt(QtGui.QCursor.pos())
+        app = TabbedPlotWindow._ensure_app()
+        screen = app.screenAt(QtGui.QCursor.pos())
         if screen is None:
             # Fallback to primary screen if no screen is found at cursor position
-            screen = TabbedPlotWindow._app.primaryScreen()
+            screen = app.primaryScreen()
         size = screen.size()
         return size.width(), size.height()
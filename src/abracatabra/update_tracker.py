@@ -0,0 +1,91 @@
+"""
+Tracks which windows have something new to draw, so `update_all` only visits
+those windows instead of every registered window on every frame. A window
+needs an update if one of its figures became stale (e.g., new data was set on
+an artist), a tab was added, or, for windows with animation callbacks, the
+callback index changed since the window was last updated.
+"""
+
+_dirty: dict[str, None] = {}  # ordered set of window IDs
+_animated: dict[str, int | None] = {}  # window ID -> last callback index
+_always: dict[str, None] = {}  # windows with changes that can not be detected
+
+
+def mark_dirty(window_id: str) -> None:
+    """
+    Marks a window as having something new to draw.
+
+    Args:
+        window_id (str): The ID of the window.
+    """
+    _dirty[window_id] = None
+
+
+def mark_animated(window_id: str) -> None:
+    """
+    Marks a window as having animation callbacks, so it is updated whenever
+    the callback index changes.
+
+    Args:
+        window_id (str): The ID of the window.
+    """
+    if window_id not in _animated:
+        _animated[window_id] = None
+
+
+def mark_always(window_id: str) -> None:
+    """
+    Marks a window as needing an update on every frame, e.g., because it has
+    animated artists (which do not mark their figure as stale) but no
+    animation callback.
+
+    Args:
+        window_id (str): The ID of the window.
+    """
+    _always[window_id] = None
+
+
+def work_list(callback_idx: int) -> list[str]:
+    """
+    Returns the IDs of the windows that need an update for this frame, and
+    clears their dirty marks.
+
+    Args:
+        callback_idx (int): The callback index of the frame.
+    Returns:
+        window_ids (list[str]): The windows to update.
+    """
+    work = dict(_always)
+    for window_id, last_idx in _animated.items():
+        if last_idx != callback_idx:
+            work[window_id] = None
+    work.update(_dirty)
+    _dirty.clear()
+    return list(work)
+
+
+def updated(window_id: str, callback_idx: int) -> None:
+    """
+    Records that a window was updated with the given callback index. Changes
+    made while updating it (e.g., by its animation callbacks) have been drawn,
+    so the window is no longer dirty.
+
+    Args:
+        window_id (str): The ID of the window.
+        callback_idx (int): The callback index the window was updated with.
+    """
+    _dirty.pop(window_id, None)
+    if window_id in _animated:
+        _animated[window_id] = callback_idx
+
+
+def forget(window_id: str) -> None:
+    """
+    Removes a window, e.g., after it was closed.
+
+    Args:
+        window_id (str): The ID of the window.
+    """
+    _dirty.pop(window_id, None)
+    _animated.pop(window_id, None)
+    _always.pop(window_id, None)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from abracatabra import TabbedPlotWindow
+
+
+def test_animated_artists_in_subfigure():
+    window = TabbedPlotWindow(window_id="subfigure blit", size=(400, 300))
+    fig = window.add_figure_tab("arm", include_toolbar=False, blit=True)
+    left, right = fig.subfigures(1, 2)
+    left.add_subplot().plot([0, 1], [0, 1], "k--")
+    ax = right.add_subplot()
+    ax.axis((-1, 1, -1, 1))
+    (arm,) = ax.plot([0, 1], [0, 0], linewidth=5, color="blue")
+    window.register_animated_artists([arm], "arm")
+    assert arm.get_animated()
+
+    canvas = window.tab_groups[0, 0].get_tab("arm").canvas
+    TabbedPlotWindow.update_all(0.1)
+    before = np.array(canvas.buffer_rgba())
+    arm.set_data([0, 0], [0, 1])
+    TabbedPlotWindow.update_all(0.01)
+    after = np.array(canvas.buffer_rgba())
+    assert not np.array_equal(before, after)  # the arm was blitted
+
+    other = TabbedPlotWindow(window_id="subfigure other", size=(300, 200))
+    (line,) = other.add_figure_tab("plot").add_subplot().plot([0, 1])
+    with pytest.raises(ValueError):
+        window.register_animated_artists([line], "arm")
+    other.qt.close()
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_animated_artists_in_subfigure()
@@ -0,0 +1,114 @@
+import os
+import matplotlib.image
+import numpy as np
+import abracatabra
+from abracatabra import animation_export
+
+
+def build_window() -> None:
+    window = abracatabra.TabbedPlotWindow(
+        window_id="export", ncols=2, size=(600, 300), open_window=False
+    )
+    x = np.linspace(0, 1, 100)
+    fig = window.add_figure_tab("sin", col=0)
+    (line,) = fig.add_subplot().plot(x, x)
+    window.register_animation_callback(
+        lambda frame: line.set_ydata(np.sin(x + frame)), "sin", col=0
+    )
+    fig = window.add_figure_tab("static", col=1)
+    fig.add_subplot().plot(x, x**2)
+
+
+def test_export_png_sequence(tmp_path):
+    build_window()
+    window = abracatabra.TabbedPlotWindow("export")
+
+    count = abracatabra.export_animation(
+        tmp_path / "frame_{:03d}.png", frames=20, ts=0.1, step=4, window_id="export"
+    )
+
+    assert count == 6  # frames 0, 4, 8, 12, 16 and the final frame 19
+    files = sorted(tmp_path.glob("frame_*.png"))
+    assert len(files) == count
+    first = matplotlib.image.imread(files[0])
+    last = matplotlib.image.imread(files[-1])
+    assert first.shape == last.shape
+    assert not np.array_equal(first, last)
+    assert not window.qt.isVisible()
+
+    window.qt.close()
+
+
+def test_export_parallel_matches_serial(tmp_path):
+    build_window()
+    window = abracatabra.TabbedPlotWindow("export")
+    serial = tmp_path / "serial" / "frame_{:03d}.png"
+    parallel = tmp_path / "parallel" / "frame_{:03d}.png"
+
+    abracatabra.export_animation(serial, frames=10, ts=0.1, window_id="export")
+    count = abracatabra.export_animation(
+        parallel,
+        frames=10,
+        ts=0.1,
+        window_id="export",
+        workers=2,
+        builder=build_window,
+        chunk_size=3,
+    )
+
+    assert count == 10
+    for i in range(count):
+        expected = matplotlib.image.imread(str(serial).format(i))
+        actual = matplotlib.image.imread(str(parallel).format(i))
+        assert np.array_equal(expected, actual)
+
+    window.qt.close()
+
+
+def test_export_parallel_keeps_parent_environment():
+    build_window()
+    window = abracatabra.TabbedPlotWindow("export")
+    previous = os.environ.get("QT_QPA_PLATFORM")
+    os.environ["QT_QPA_PLATFORM"] = "minimal"  # the app already exists
+    try:
+        frames = animation_export._render_parallel([0, 1], "export", build_window, 1, 1)
+        assert next(frames).ndim == 3  # rendered offscreen by the worker
+        assert os.environ["QT_QPA_PLATFORM"] == "minimal"
+        frames.close()
+    finally:
+        if previous is None:
+            del os.environ["QT_QPA_PLATFORM"]
+        else:
+            os.environ["QT_QPA_PLATFORM"] = previous
+    window.qt.close()
+
+
+def test_render_window_builds_lazy_tabs():
+    window = abracatabra.TabbedPlotWindow(
+        window_id="export lazy", size=(300, 200), open_window=False
+    )
+    built = []
+
+    def build(fig):
+        built.append(fig)
+        (line,) = fig.add_subplot().plot([0, 1], [0, 1])
+        return lambda i: line.set_ydata([0, i])
+
+    tabs = window.tab_groups[0, 0]
+    blocked = tabs.blockSignals(True)  # not built when it becomes the active tab
+    window.add_lazy_figure_tab("lazy", build)
+    tabs.blockSignals(blocked)
+    assert not built
+    pixels = animation_export.render_window(window, 1)
+    assert len(built) == 1
+    assert pixels.shape[2] == 4 and pixels.std() > 0  # the figure was drawn
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    import tempfile, pathlib
+
+    test_export_png_sequence(pathlib.Path(tempfile.mkdtemp()))
+    test_export_parallel_matches_serial(pathlib.Path(tempfile.mkdtemp()))
+    test_export_parallel_keeps_parent_environment()
+    test_render_window_builds_lazy_tabs()
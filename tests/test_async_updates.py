@@ -0,0 +1,66 @@
+import asyncio
+import time
+import pytest
+import abracatabra
+from abracatabra import TabbedPlotWindow
+
+
+def test_update_all_async_yields_to_other_tasks():
+    window = TabbedPlotWindow(window_id="async_update", size=(300, 200))
+    fig = window.add_figure_tab("plot")
+    line = fig.add_subplot().plot([0, 1], [0, 1])[0]
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        for i in range(5):
+            line.set_ydata([0, i])
+            await abracatabra.update_all_windows_async(0.02, i)
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        return elapsed
+
+    elapsed = asyncio.run(main())
+    assert elapsed >= 0.1
+    assert len(ticks) >= 2  # the other task ran while waiting
+    window.qt.close()
+
+
+def test_animate_all_async_cancel():
+    window = TabbedPlotWindow(window_id="async_animate", size=(300, 200))
+    window.add_figure_tab("plot").add_subplot()
+    drawn = []
+    window.register_animation_callback(lambda i: drawn.append(i), "plot")
+
+    async def main():
+        task = asyncio.create_task(
+            abracatabra.animate_all_windows_async(frames=1000, ts=0.01)
+        )
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert 0 < len(drawn) < 1000
+    assert 999 not in drawn  # stopped before the final frame
+
+    result = asyncio.run(
+        abracatabra.animate_all_windows_async(
+            frames=5, ts=0.01, speed_scale=2.0, print_timing=True
+        )
+    )
+    assert result.frames_drawn == 5
+    assert drawn[-1] == 4
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_update_all_async_yields_to_other_tasks()
+    test_animate_all_async_cancel()
@@ -0,0 +1,32 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+
+
+def test_add_figure_tabs_in_batch():
+    window = TabbedPlotWindow(window_id="bulk", nrows=2, ncols=2, size=(600, 500))
+    TabbedPlotWindow.update_all(0.05)
+    changes = []
+    for tabs in window.tab_groups:
+        tabs.currentChanged.connect(changes.append)
+    specs = [{"tab_id": f"tab {i}", "row": i % 2, "col": i // 2 % 2} for i in range(12)]
+    with window.batch():
+        figures = window.add_figure_tabs(specs)
+        assert changes == []
+        assert not window.qt.updatesEnabled()
+    assert window.qt.updatesEnabled()
+    assert len(figures) == 12
+    assert figures[5] is window.tab_groups[1, 0].get_tab("tab 5").figure
+    assert changes == [0, 0, 0, 0]  # each group's first tab became current
+
+    TabbedPlotWindow.update_all(0.05)
+    for tabs in window.tab_groups:
+        current = tabs.currentWidget()
+        for i in range(tabs.count()):
+            # inactive figures are already sized like the active one
+            size = tabs.widget(i).figure.get_size_inches()
+            assert np.allclose(size, current.figure.get_size_inches())
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_add_figure_tabs_in_batch()
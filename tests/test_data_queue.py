@@ -0,0 +1,47 @@
+import threading
+import time
+import numpy as np
+from abracatabra import TabbedPlotWindow
+from abracatabra.frame_scheduler import wait_until
+
+
+def test_data_queue_from_producer_thread():
+    window = TabbedPlotWindow(window_id="queue", size=(300, 200))
+    ax = window.add_figure_tab("stream").add_subplot()
+    stream = window.add_streaming_line(ax, "stream", capacity=100_000)
+    handler_threads = set()
+    batches = []
+
+    def handler(batch):
+        handler_threads.add(threading.get_ident())
+        batches.append(len(batch))
+        for t, y in batch:
+            stream.extend(t, y)
+
+    queue = window.add_data_queue("stream", handler, maxlen=50)
+
+    def produce():
+        for i in range(2000):
+            t = np.arange(i * 10, (i + 1) * 10, dtype=float)
+            queue.put((t, np.sin(t)))
+
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    producer.join()
+    assert time.perf_counter() - start < 2.0  # never blocked on the GUI
+    wait_until(time.perf_counter() + 0.1)
+
+    assert handler_threads == {threading.get_ident()}  # drained in GUI thread
+    assert sum(batches) + queue.dropped == 2000
+    assert len(queue) == 0
+    # the newest samples always arrive, the oldest are dropped first
+    assert stream.x[-1] == 19_999
+    assert np.all(np.diff(stream.x) > 0)
+    # the samples are on the line without calling update_all()
+    np.testing.assert_array_equal(stream.line.get_xdata(), stream.x)
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_data_queue_from_producer_thread()
@@ -0,0 +1,55 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+from abracatabra.decimation import minmax_decimate
+
+
+def test_minmax_decimate_preserves_extrema():
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 10, 100_000)
+    y = np.sin(x) + rng.normal(0, 0.1, x.size)
+    y[500:700] = np.nan
+
+    xd, yd = minmax_decimate(x, y, 500)
+
+    assert len(xd) <= 2 * 500 + 2
+    assert np.all(np.diff(xd) > 0)
+    assert (xd[0], xd[-1]) == (x[0], x[-1])
+    assert np.nanmax(yd) == np.nanmax(y) and np.nanmin(yd) == np.nanmin(y)
+
+
+def test_decimated_line_follows_data_and_view():
+    window = TabbedPlotWindow(window_id="decimate", size=(400, 300), open_window=False)
+    fig = window.add_figure_tab("signal")
+    ax = fig.add_subplot()
+    x = np.linspace(0, 10, 200_000)
+    (line,) = ax.plot(x, np.sin(x))
+    window.decimate_lines("signal")
+    widget = window.tab_groups[0, 0].get_tab("signal")
+    decimated = widget._decimated_lines[0]
+
+    assert len(line.get_xdata()) < x.size // 10
+    assert len(decimated.x) == x.size
+
+    line.set_ydata(np.cos(x))  # full-resolution data, e.g., from a callback
+    window.update()
+    assert len(line.get_xdata()) < x.size // 10
+    assert np.max(line.get_ydata()) == np.max(np.cos(x))
+
+    ax.set_xlim(4, 4.01)  # zoom in: every visible sample is shown
+    TabbedPlotWindow.update_all(0.2)  # let the debounce timer fire
+    visible = (line.get_xdata() >= 4) & (line.get_xdata() <= 4.01)
+    assert visible.sum() == ((x >= 4) & (x <= 4.01)).sum()
+    assert ax.dataLim.x0 == 0 and ax.dataLim.x1 == 10
+
+    ax.set_xlim(0, 10)
+    decimated.sync()
+    shown = len(line.get_xdata())
+    fig.set_size_inches(2 * fig.get_size_inches())  # more pixels, more samples
+    assert decimated.sync() and shown < len(line.get_xdata()) < x.size // 5
+
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_minmax_decimate_preserves_extrema()
+    test_decimated_line_follows_data_and_view()
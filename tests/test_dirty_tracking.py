@@ -0,0 +1,75 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+
+
+def test_update_all_skips_clean_windows():
+    lines = {}
+    for i in range(6):
+        window = TabbedPlotWindow(window_id=f"dirty {i}", size=(300, 200))
+        ax = window.add_figure_tab("plot").add_subplot()
+        (lines[i],) = ax.plot(np.arange(10))
+    animated = TabbedPlotWindow(window_id="dirty animated", size=(300, 200))
+    ax = animated.add_figure_tab("plot").add_subplot()
+    (line,) = ax.plot(np.arange(10))
+    callback = lambda i: line.set_ydata(np.arange(10) * i)
+    animated.register_animation_callback(callback, "plot")
+    TabbedPlotWindow.update_all(0.05)
+    TabbedPlotWindow.update_all(0.05)  # windows are resized when first shown
+
+    updated = []
+    hook = lambda window_id, *args: updated.append(window_id)
+    TabbedPlotWindow.register_frame_hook("window_start", hook)
+    try:
+        TabbedPlotWindow.update_all(0.0)
+        assert updated == []  # nothing changed
+        lines[2].set_ydata(np.arange(10)[::-1])
+        TabbedPlotWindow.update_all(0.0, 1)
+        assert sorted(updated) == ["dirty 2", "dirty animated"]
+        updated.clear()
+        TabbedPlotWindow.update_all(0.0, 1)
+        assert updated == []  # same frame again
+
+        # hidden windows are only shown again if they have something to draw
+        TabbedPlotWindow._registry["dirty 4"].qt.hide()
+        TabbedPlotWindow.update_all(0.0, 1)
+        assert not TabbedPlotWindow._registry["dirty 4"].qt.isVisible()
+        lines[4].set_ydata(np.zeros(10))
+        TabbedPlotWindow.update_all(0.0, 1)
+        assert updated == ["dirty 4"]
+        assert TabbedPlotWindow._registry["dirty 4"].qt.isVisible()
+    finally:
+        TabbedPlotWindow.remove_frame_hook("window_start", hook)
+    TabbedPlotWindow.close_all_windows()
+
+
+def test_skipped_window_draws_latest_frame_on_tab_switch():
+    window = TabbedPlotWindow(window_id="dirty lazy", size=(300, 200))
+    window.add_figure_tab("static").add_subplot()
+    frames = []
+
+    def build(fig):
+        fig.add_subplot()
+        return frames.append
+
+    window.add_lazy_figure_tab("lazy", build)
+    TabbedPlotWindow.update_all(0.05)
+    TabbedPlotWindow.update_all(0.05)  # windows are resized when first shown
+
+    updated = []
+    hook = lambda window_id, *args: updated.append(window_id)
+    TabbedPlotWindow.register_frame_hook("window_start", hook)
+    try:
+        for i in range(1, 51):
+            TabbedPlotWindow.update_all(0.0, i)
+    finally:
+        TabbedPlotWindow.remove_frame_hook("window_start", hook)
+    assert "dirty lazy" not in updated  # nothing to draw in the active tab
+
+    window.tab_groups[0, 0].setCurrentIndex(1)
+    assert frames == [50]
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_update_all_skips_clean_windows()
+    test_skipped_window_draws_latest_frame_on_tab_switch()
@@ -0,0 +1,80 @@
+import numpy as np
+import abracatabra
+from abracatabra import TabbedPlotWindow
+
+
+def test_scrubbing_reuses_cached_frames():
+    window = TabbedPlotWindow(window_id="cache", size=(400, 300), open_window=False)
+    x = np.linspace(0, 1, 1000)
+    fig = window.add_figure_tab("sin")
+    ax = fig.add_subplot()
+    ax.set_ylim(-1.1, 1.1)
+    (line,) = ax.plot(x, np.sin(x))
+    window.register_animation_callback(lambda i: line.set_ydata(np.sin(x + i)), "sin")
+    widget = window.tab_groups[0, 0].get_tab("sin")
+    window.update(0)  # show the window and let it settle before caching
+    TabbedPlotWindow.update_all(0.1, 0)
+    cache = TabbedPlotWindow.enable_frame_cache(max_megabytes=64)
+    try:
+        frames = {}
+        for i in [1, 2, 3]:
+            window.update(i)
+            frames[i] = np.array(widget.canvas.buffer_rgba())
+        assert len(cache) == 3 and cache.misses == 3
+
+        for i in [2, 1, 3]:  # scrub back and forth
+            window.update(i)
+            assert np.array_equal(np.array(widget.canvas.buffer_rgba()), frames[i])
+        assert cache.hits == 3
+        np.testing.assert_allclose(line.get_ydata(), np.sin(x + 3))
+
+        ax.set_xlim(0, 0.5)  # e.g., zooming redraws the figure
+        widget.canvas.draw()
+        assert len(cache) == 0
+
+        frame_bytes = frames[1].nbytes
+        cache.set_budget(2 * frame_bytes)
+        for i in [4, 5, 6]:
+            window.update(i)
+        assert len(cache) == 2 and cache.nbytes == 2 * frame_bytes
+    finally:
+        TabbedPlotWindow.disable_frame_cache()
+        window.qt.close()
+    assert abracatabra.FrameCache is type(cache)
+
+
+def test_same_tab_id_in_two_groups():
+    window = TabbedPlotWindow(
+        window_id="cache_groups", ncols=2, size=(600, 300), open_window=False
+    )
+    widgets = {}
+    for col, color in enumerate(["red", "blue"]):
+        fig = window.add_figure_tab("a", col=col)
+        (line,) = fig.add_subplot().plot([0, 1], [0, 1], color=color, lw=20)
+        window.register_animation_callback(
+            lambda i, line=line: line.set_ydata([0, i]), "a", col=col
+        )
+        widgets[color] = window.tab_groups[0, col].get_tab("a")
+    window.update(0)
+    TabbedPlotWindow.update_all(0.1, 0)
+    cache = TabbedPlotWindow.enable_frame_cache(max_megabytes=64)
+    try:
+        window.update(1)
+        assert len(cache) == 2 and cache.misses == 2
+        for color, channel in [("red", 0), ("blue", 2)]:
+            pixels = np.array(widgets[color].canvas.buffer_rgba())
+            other = 2 - channel
+            # the line is drawn in the color of its own tab
+            assert np.any((pixels[..., channel] > 200) & (pixels[..., other] < 50))
+            assert not np.any((pixels[..., other] > 200) & (pixels[..., channel] < 50))
+
+        widgets["red"].canvas.draw()  # e.g., zooming the left group
+        assert len(cache) == 1  # the right group keeps its frames
+    finally:
+        TabbedPlotWindow.disable_frame_cache()
+        window.qt.close()
+
+
+if __name__ == "__main__":
+    test_scrubbing_reuses_cached_frames()
+    test_same_tab_id_in_two_groups()
@@ -0,0 +1,81 @@
+from abracatabra import TabbedPlotWindow
+from abracatabra import frame_hooks
+
+
+def test_frame_hook_order_and_removal():
+    window = TabbedPlotWindow(window_id="hooks", size=(300, 200))
+    fig = window.add_figure_tab("plot")
+    (line,) = fig.add_subplot().plot([0, 1], [0, 1])
+    window.register_animation_callback(lambda i: line.set_ydata([0, i]), "plot")
+    TabbedPlotWindow.update_all(0.1, 0)  # show the window and let it settle
+
+    events = []
+    hooks = {}
+    for event in frame_hooks.EVENTS:
+        hooks[event] = lambda *args, event=event: events.append((event, *args))
+        TabbedPlotWindow.register_frame_hook(event, hooks[event])
+    try:
+        TabbedPlotWindow.update_all(0.0, 1)
+        mine = [e for e in events if e[1] in (None, "hooks")]
+        assert mine == [
+            ("frame_start", None, None, 1, None, None),
+            ("window_start", "hooks", None, 1, None, None),
+            ("callback_start", "hooks", "plot", 1, 0, 0),
+            ("callback_end", "hooks", "plot", 1, 0, 0),
+            ("draw_start", "hooks", "plot", 1, 0, 0),
+            ("draw_end", "hooks", "plot", 1, 0, 0),
+            ("window_end", "hooks", None, 1, None, None),
+            ("frame_end", None, None, 1, None, None),
+        ]
+
+        events.clear()
+        window.update(2)
+        assert events[0] == ("frame_start", "hooks", None, 2, None, None)
+        assert events[-1] == ("frame_end", "hooks", None, 2, None, None)
+
+        for event in frame_hooks.EVENTS[1:]:
+            TabbedPlotWindow.remove_frame_hook(event, hooks[event])
+        assert frame_hooks.enabled  # "frame_start" is still registered
+        events.clear()
+        TabbedPlotWindow.update_all(0.0, 3)
+        assert [e[0] for e in events] == ["frame_start"]
+
+        TabbedPlotWindow.remove_frame_hook("frame_start", hooks["frame_start"])
+        assert not frame_hooks.enabled
+        events.clear()
+        TabbedPlotWindow.update_all(0.0, 4)
+        assert events == []
+    finally:
+        frame_hooks.clear_hooks()
+    window.qt.close()
+
+
+def test_frame_hooks_keep_idle_draw_path():
+    window = TabbedPlotWindow(window_id="hooks_idle", size=(300, 200))
+    fig = window.add_figure_tab("plot")
+    (line,) = fig.add_subplot().plot([0, 1], [0, 1])
+    window.register_animation_callback(lambda i: line.set_ydata([0, i]), "plot")
+    TabbedPlotWindow.update_all(0.1, 0)
+    canvas = window.tab_groups[0, 0].get_tab("plot").canvas
+    calls = []
+    draw, draw_idle = canvas.draw, canvas.draw_idle
+    canvas.draw = lambda: (calls.append("draw"), draw())
+    canvas.draw_idle = lambda: (calls.append("draw_idle"), draw_idle())
+
+    TabbedPlotWindow.update_all(0.0, 1)
+    unhooked = list(calls)
+    calls.clear()
+    hook = lambda w, t, i, row, col: None
+    TabbedPlotWindow.register_frame_hook("draw_start", hook)
+    try:
+        TabbedPlotWindow.update_all(0.0, 2)
+    finally:
+        TabbedPlotWindow.remove_frame_hook("draw_start", hook)
+    assert unhooked[0] == "draw_idle"
+    assert calls == unhooked  # observing does not change what is observed
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_frame_hook_order_and_removal()
+    test_frame_hooks_keep_idle_draw_path()
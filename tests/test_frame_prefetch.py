@@ -0,0 +1,53 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+from abracatabra import update_tracker
+from abracatabra.animation_player import AnimationPlayer
+
+
+def test_player_prefetches_neighboring_frames():
+    window = TabbedPlotWindow(window_id="prefetch", size=(400, 300))
+    x = np.linspace(0, 1, 1000)
+    fig = window.add_figure_tab("sin")
+    ax = fig.add_subplot()
+    ax.set_ylim(-1.1, 1.1)
+    (line,) = ax.plot(x, np.sin(x))
+    window.register_animation_callback(lambda i: line.set_ydata(np.sin(x + i)), "sin")
+    widget = window.tab_groups[0, 0].get_tab("sin")
+    TabbedPlotWindow.update_all(0.1, 0)  # show the window and let it settle
+    cache = TabbedPlotWindow.enable_frame_cache()
+    player = AnimationPlayer.instance() or AnimationPlayer()
+    try:
+        player.setup(
+            frames=20,
+            ts=0.1,
+            step=1,
+            update_callback=lambda i: TabbedPlotWindow.update_all(0.0, i),
+            prefetch_callback=TabbedPlotWindow._prefetch_all,
+            prefetch_radius=2,
+        )
+        player.prefetch_delay_ms = 0
+        player.slider.setValue(5)
+        displayed = np.array(widget.canvas.buffer_rgba())
+
+        TabbedPlotWindow.update_all(0.2, 5)  # idle time
+        width, height = widget.canvas.get_width_height(physical=True)
+        ids = ("prefetch", 0, 0, "sin")
+        size = (width, height, widget.figure.dpi)
+        for i in [3, 4, 6, 7]:
+            assert (*ids, i, *size) in cache
+        assert np.array_equal(np.array(widget.canvas.buffer_rgba()), displayed)
+        np.testing.assert_allclose(line.get_ydata(), np.sin(x + 5))
+        assert "prefetch" not in update_tracker.work_list(5)  # nothing new to draw
+
+        hits = cache.hits
+        player.next_button.click()
+        assert cache.hits == hits + 1
+        np.testing.assert_allclose(line.get_ydata(), np.sin(x + 6))
+    finally:
+        TabbedPlotWindow.disable_frame_cache()
+        player.close()
+        window.qt.close()
+
+
+if __name__ == "__main__":
+    test_player_prefetches_neighboring_frames()
@@ -0,0 +1,91 @@
+import types
+import pytest
+from abracatabra import FrameScheduler
+from abracatabra import frame_scheduler
+
+
+class FakeClock:
+    """
+    A controlled clock: time only advances when sleeping or doing "work".
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def work(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    fake_time = types.SimpleNamespace(
+        perf_counter=clock.perf_counter, sleep=clock.sleep
+    )
+    monkeypatch.setattr(frame_scheduler, "time", fake_time)
+    return clock
+
+
+def test_deadlines_follow_target_clock(clock):
+    scheduler = FrameScheduler(0.1)
+    scheduler.start()
+    clock.work(0.03)
+    assert scheduler.wait() == pytest.approx(0.0, abs=1e-9)
+    assert clock.now == pytest.approx(0.1)
+    clock.work(0.15)  # 0.05 s late, less than one period
+    assert scheduler.wait() == pytest.approx(0.05)
+    clock.work(0.02)  # made up in the next frame
+    assert scheduler.wait() == pytest.approx(0.0, abs=1e-9)
+    assert clock.now == pytest.approx(0.3)
+    assert scheduler.frame_count == 3
+    assert scheduler.late_frames == 1
+    assert scheduler.max_lateness == pytest.approx(0.05)
+    assert scheduler.lateness == pytest.approx(0.0, abs=1e-9)
+
+
+def test_resync_when_more_than_one_period_late(clock):
+    scheduler = FrameScheduler(0.1)
+    scheduler.start()
+    clock.work(0.25)  # 0.15 s late
+    assert scheduler.wait() == pytest.approx(0.15)
+    # the clock restarts from now instead of rushing frames to catch up
+    assert scheduler.wait() == pytest.approx(0.0, abs=1e-9)
+    assert clock.now == pytest.approx(0.35)
+    assert scheduler.late_frames == 1
+
+
+def test_skip_without_resync(clock):
+    scheduler = FrameScheduler(0.1, resync=False)
+    scheduler.skip(2)  # not started yet, nothing to skip
+    scheduler.start()
+    clock.work(0.25)
+    lateness = scheduler.wait()
+    assert lateness == pytest.approx(0.15)
+    # deadlines stay tied to the start time; drop the frames that are past
+    scheduler.skip(int(lateness // scheduler.period))
+    scheduler.skip(0)
+    scheduler.wait()
+    assert clock.now == pytest.approx(0.3)
+    assert scheduler.late_frames == 1
+    assert scheduler.max_lateness == pytest.approx(0.15)
+
+
+def test_late_tolerance(clock):
+    scheduler = FrameScheduler(0.1, late_tolerance=0.01)
+    scheduler.start()
+    clock.work(0.105)
+    assert scheduler.wait() == pytest.approx(0.005)
+    assert scheduler.late_frames == 0
+    assert scheduler.max_lateness == pytest.approx(0.005)
+    with pytest.raises(ValueError):
+        FrameScheduler(-1.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
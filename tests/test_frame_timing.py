@@ -0,0 +1,86 @@
+import numpy as np
+import abracatabra
+from abracatabra import TabbedPlotWindow
+from matplotlib.backends.qt_compat import QtWidgets
+
+
+def test_frame_timing_per_tab_group():
+    window = TabbedPlotWindow(window_id="timing", ncols=2, size=(600, 300))
+    lines = []
+    for col in range(2):
+        fig = window.add_figure_tab("a", col=col)
+        (line,) = fig.add_subplot().plot(np.arange(1000), np.zeros(1000))
+        lines.append(line)
+        window.register_animation_callback(
+            lambda i, line=line: line.set_ydata(np.full(1000, i)), "a", col=col
+        )
+    TabbedPlotWindow.update_all(0.1, 0)  # show the window and let it settle
+
+    timer = TabbedPlotWindow.enable_frame_timing(capacity=3)
+    try:
+        for i in range(1, 6):
+            TabbedPlotWindow.update_all(0.0, i)
+        summary = timer.tab_summary("timing")
+        assert set(summary) == {"timing/0/0/a", "timing/0/1/a"}
+        for stats in summary.values():
+            assert stats["total"].count == 3  # capacity
+            assert stats["total"].mean >= stats["flush"].mean > 0
+        assert timer.window_summary()["timing"]["total"].count == 6
+        assert "timing/0/1/a" in timer.report()
+    finally:
+        TabbedPlotWindow.disable_frame_timing()
+    assert abracatabra.FrameTimer is type(timer)
+    window.qt.close()
+
+
+def test_frame_timing_keeps_idle_draw_path():
+    window = TabbedPlotWindow(window_id="timing_idle", size=(300, 200))
+    fig = window.add_figure_tab("plot")
+    (line,) = fig.add_subplot().plot([0, 1], [0, 1])
+    window.register_animation_callback(lambda i: line.set_ydata([0, i]), "plot")
+    TabbedPlotWindow.update_all(0.1, 0)
+    canvas = window.tab_groups[0, 0].get_tab("plot").canvas
+    calls = []
+    draw, draw_idle = canvas.draw, canvas.draw_idle
+    canvas.draw = lambda: (calls.append("draw"), draw())
+    canvas.draw_idle = lambda: (calls.append("draw_idle"), draw_idle())
+
+    TabbedPlotWindow.update_all(0.0, 1)
+    untimed = list(calls)
+    calls.clear()
+    TabbedPlotWindow.enable_frame_timing()
+    try:
+        TabbedPlotWindow.update_all(0.0, 2)
+    finally:
+        TabbedPlotWindow.disable_frame_timing()
+    assert untimed[0] == "draw_idle"
+    assert calls == untimed  # timing does not change how the canvas is drawn
+    window.qt.close()
+
+
+def test_frame_timing_with_hooks_on_custom_tab():
+    window = TabbedPlotWindow(window_id="timing_custom", size=(300, 200))
+    label = QtWidgets.QLabel("frame 0")
+    window.add_custom_tab(label, "label")
+    window.register_animation_callback(lambda i: label.setText(f"frame {i}"), "label")
+    TabbedPlotWindow.update_all(0.1, 0)
+
+    events = []
+    hook = lambda *args: events.append(args)
+    timer = TabbedPlotWindow.enable_frame_timing()
+    TabbedPlotWindow.register_frame_hook("callback_end", hook)
+    try:
+        TabbedPlotWindow.update_all(0.0, 1)
+    finally:
+        TabbedPlotWindow.remove_frame_hook("callback_end", hook)
+        TabbedPlotWindow.disable_frame_timing()
+    assert label.text() == "frame 1"
+    assert ("timing_custom", "label", 1, 0, 0) in events
+    assert timer.tab_summary("timing_custom")["timing_custom/0/0/label"]
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_frame_timing_per_tab_group()
+    test_frame_timing_keeps_idle_draw_path()
+    test_frame_timing_with_hooks_on_custom_tab()
@@ -0,0 +1,56 @@
+import json
+import numpy as np
+import abracatabra
+from abracatabra import TabbedPlotWindow
+
+
+def test_animation_trace_export(tmp_path):
+    window = abracatabra.TabbedPlotWindow(window_id="trace", size=(400, 300))
+    fig = window.add_figure_tab("sin")
+    ax = fig.add_subplot()
+    x = np.linspace(0, 1, 100)
+    (line,) = ax.plot(x, x)
+    window.register_animation_callback(
+        lambda frame: line.set_ydata(np.sin(x + frame)), "sin"
+    )
+
+    path = tmp_path / "trace.json"
+    abracatabra.animate_all_windows(10, 0.01, hold=False, trace_file=str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    names = {e["cat"] for e in spans}
+    assert {"frame", "window", "callback", "draw"} <= names
+    assert any(e["name"] == "deadline" for e in events)
+    assert all(e["dur"] >= 0 for e in spans)
+
+    window.qt.close()
+
+
+def test_trace_same_tab_id_in_two_groups(tmp_path):
+    window = TabbedPlotWindow(window_id="trace_groups", ncols=2, size=(600, 300))
+    for col in range(2):
+        fig = window.add_figure_tab("plot", col=col)
+        (line,) = fig.add_subplot().plot([0, 1], [0, 1])
+        window.register_animation_callback(
+            lambda i, line=line: line.set_ydata([0, i]), "plot", col=col
+        )
+
+    path = tmp_path / "trace.json"
+    abracatabra.animate_all_windows(3, 0.01, hold=False, trace_file=str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert {"tab 0/0/plot", "tab 0/1/plot"} <= names
+    callbacks = [e for e in events if e.get("cat") == "callback"]
+    tids = [e["tid"] for e in callbacks]
+    assert len(set(tids)) == 2
+    assert tids.count(tids[0]) == len(tids) // 2  # one span per tab per frame
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    import tempfile, pathlib
+
+    test_animation_trace_export(pathlib.Path(tempfile.mkdtemp()))
+    test_trace_same_tab_id_in_two_groups(pathlib.Path(tempfile.mkdtemp()))
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_create_app():
+    code = (
+        "import sys, matplotlib\n"
+        "fonttype = matplotlib.rcParams['pdf.fonttype']\n"
+        "import abracatabra\n"
+        "from matplotlib.backends.qt_compat import QtWidgets\n"
+        "assert QtWidgets.QApplication.instance() is None\n"
+        "assert abracatabra.TabbedPlotWindow._app is None\n"
+        "assert matplotlib.rcParams['pdf.fonttype'] == fonttype\n"
+        "window = abracatabra.TabbedPlotWindow(open_window=False)\n"
+        "assert QtWidgets.QApplication.instance() is not None\n"
+        "assert matplotlib.rcParams['pdf.fonttype'] == 42\n"
+        "assert not window.qt.windowIcon().isNull()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    test_import_does_not_create_app()
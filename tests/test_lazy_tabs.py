@@ -0,0 +1,39 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+from abracatabra.figure_widget import FigureWidget
+
+
+def test_lazy_tabs_are_built_when_shown():
+    window = TabbedPlotWindow(window_id="lazy", size=(400, 300))
+    built = []
+    x = np.linspace(0, 1, 50)
+
+    def make_builder(name):
+        def build(fig):
+            built.append(name)
+            (line,) = fig.add_subplot().plot(x, x)
+            return lambda i: line.set_ydata(x * i)
+
+        return build
+
+    for i in range(20):
+        window.add_lazy_figure_tab(f"tab {i}", make_builder(f"tab {i}"))
+    tabs = window.tab_groups[0, 0]
+    assert built == ["tab 0"]  # the first tab is current, so it is built
+
+    TabbedPlotWindow.update_all(0.0, 3)
+    tabs.setCurrentIndex(5)
+    assert built == ["tab 0", "tab 5"]
+    widget = tabs.currentWidget()
+    assert isinstance(widget, FigureWidget) and tabs.tabText(5) == "tab 5"
+    np.testing.assert_allclose(widget.figure.axes[0].lines[0].get_ydata(), x * 3)
+
+    assert isinstance(tabs.get_tab("tab 7"), FigureWidget)  # access builds
+    assert tabs.currentIndex() == 5 and len(built) == 3
+    assert tabs.count() == 20
+
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_lazy_tabs_are_built_when_shown()
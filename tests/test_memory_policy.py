@@ -0,0 +1,40 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+
+
+def test_memory_policy_releases_hidden_tabs():
+    window = TabbedPlotWindow(window_id="memory", size=(400, 300))
+    tabs = window.tab_groups[0, 0]
+    for i in range(4):
+        fig = window.add_figure_tab(f"tab {i}")
+        fig.add_subplot().plot(np.random.default_rng(i).normal(size=100))
+    TabbedPlotWindow.update_all(0.1)
+    for i in range(4):  # draw every tab once
+        tabs.setCurrentIndex(i)
+        TabbedPlotWindow.update_all(0.05)
+    widgets = [tabs.get_tab(f"tab {i}") for i in range(4)]
+    per_tab = widgets[3].renderer_nbytes()
+    assert per_tab > 0 and all(w.renderer_nbytes() == per_tab for w in widgets)
+
+    cache = TabbedPlotWindow.enable_frame_cache()
+    for i in range(4):  # cache a frame of every tab
+        cache.put(("memory", 0, 0, f"tab {i}", 0, 1, 1, 100.0), None, 4)
+    policy = window.set_memory_policy(max_megabytes=2.5 * per_tab / 1024**2)
+    assert policy is not None
+    released = policy.apply()
+    assert released == 2 * per_tab  # the two tabs hidden the longest
+    assert [w.renderer_nbytes() for w in widgets] == [0, 0, per_tab, per_tab]
+    assert len(cache) == 2 and cache.nbytes == 8  # frames of released tabs
+    TabbedPlotWindow.disable_frame_cache()
+
+    tabs.setCurrentIndex(0)  # released tabs are redrawn when shown again
+    TabbedPlotWindow.update_all(0.1)
+    assert widgets[0].renderer_nbytes() == per_tab
+    assert not widgets[0]._preview.isVisible()
+
+    assert window.set_memory_policy() is None
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_memory_policy_releases_hidden_tabs()
@@ -0,0 +1,37 @@
+import time
+from typing import Callable
+from abracatabra import TabbedPlotWindow
+from abracatabra.frame_scheduler import wait_until
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """
+    Processes events until the condition is true or the timeout expires.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        wait_until(time.perf_counter() + 0.01)
+    return condition()
+
+
+def test_minimized_window_catches_up_when_restored():
+    window = TabbedPlotWindow(window_id="obscured", size=(300, 200))
+    window.add_figure_tab("plot").add_subplot()
+    frames = []
+    window.register_animation_callback(frames.append, "plot")
+    TabbedPlotWindow.update_all(0.0, 1)
+    # a new window may be skipped until it is exposed, then it catches up
+    assert wait_for(lambda: frames == [1])
+
+    window.qt.showMinimized()
+    TabbedPlotWindow.update_all(0.05, 2)
+    TabbedPlotWindow.update_all(0.05, 3)
+    assert frames == [1]  # skipped while minimized
+
+    window.qt.showNormal()
+    assert wait_for(lambda: frames == [1, 3])  # caught up with the latest only
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_minimized_window_catches_up_when_restored()
@@ -0,0 +1,38 @@
+import math
+import time
+import numpy as np
+import abracatabra
+
+
+def test_realtime_animation_drops_frames():
+    window = abracatabra.TabbedPlotWindow(window_id="realtime", size=(400, 300))
+    fig = window.add_figure_tab("slow")
+    ax = fig.add_subplot()
+    x = np.linspace(0, 1, 100)
+    (line,) = ax.plot(x, x)
+    draw_time = 0.03
+
+    def slow_update(frame: int):
+        time.sleep(draw_time)  # much slower than the time step
+        line.set_ydata(np.sin(x + frame))
+
+    window.register_animation_callback(slow_update, "slow")
+
+    frames, ts = 50, 0.01
+    for step in [1, 2]:
+        result = abracatabra.animate_all_windows(
+            frames, ts, step, hold=False, realtime=True
+        )
+        draws = math.ceil(frames / step)
+        assert result.frames_dropped > 0
+        # every draw is either drawn or dropped, regardless of `step`
+        assert result.frames_drawn + result.frames_dropped == draws
+        assert result.drop_ratio == result.frames_dropped / draws
+    # compared with the draws actually made, so it holds on a loaded machine
+    assert result.real_time < result.frames_drawn * draw_time + frames * ts * 2
+
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_realtime_animation_drops_frames()
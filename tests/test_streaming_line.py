@@ -0,0 +1,34 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+
+
+def test_streaming_line_keeps_latest_samples():
+    window = TabbedPlotWindow(window_id="stream", size=(400, 300), open_window=False)
+    fig = window.add_figure_tab("imu")
+    ax = fig.add_subplot()
+    stream = window.add_streaming_line(ax, "imu", capacity=100, color="C1")
+    buffer = stream._data
+
+    t = np.arange(1000) * 1e-3
+    stream.append(t[0], 0.0)
+    for i in range(1, 1000, 37):  # batches that wrap around the buffer
+        batch = t[i : i + 37]
+        stream.extend(batch, np.sin(batch))
+    stream.append(1.0, 5.0)
+
+    expected_t = np.append(t[-99:], 1.0)
+    assert len(stream) == 100
+    assert stream._data is buffer  # never reallocated
+    np.testing.assert_array_equal(stream.x, expected_t)
+    np.testing.assert_array_equal(stream.y, np.append(np.sin(t[-99:]), 5.0))
+
+    window.update()
+    np.testing.assert_array_equal(stream.line.get_xdata(), expected_t)
+    assert ax.get_xlim() == (expected_t[0], 1.0)
+    assert not stream.sync()  # nothing new since the last update
+
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_streaming_line_keeps_latest_samples()
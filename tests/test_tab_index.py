@@ -0,0 +1,34 @@
+import pytest
+from abracatabra import TabbedPlotWindow
+
+
+def test_find_tab_across_windows():
+    left = TabbedPlotWindow(window_id="index left", ncols=2, open_window=False)
+    right = TabbedPlotWindow(window_id="index right", nrows=[1, 2], open_window=False)
+    left.add_figure_tab("speed", col=1)
+    left.add_figure_tab("shared")
+    right.add_figure_tab("shared", row=1, col=1)
+    right.add_lazy_figure_tab("lazy", lambda fig: None)
+
+    speed = TabbedPlotWindow.find_tab("speed")
+    assert speed is left.tab_groups[0, 1].get_tab("speed")
+    with pytest.raises(ValueError, match="ambiguous"):
+        TabbedPlotWindow.find_tab("shared")
+    shared = TabbedPlotWindow.find_tab("index right/1/1/shared")
+    assert shared is right.tab_groups[1, 1].get_tab("shared")
+    assert TabbedPlotWindow.find_tab("shared", "index left") is not shared
+    lazy = TabbedPlotWindow.find_tab("lazy")  # builds the lazy tab
+    assert lazy.figure is right.tab_groups[0, 0].get_tab("lazy").figure
+    keys = [location.key for location in TabbedPlotWindow.tabs("shared")]
+    assert keys == ["index left/0/0/shared", "index right/1/1/shared"]
+
+    right.qt.close()
+    assert TabbedPlotWindow.find_tab("shared") is left.tab_groups[0, 0]["shared"]
+    with pytest.raises(ValueError, match="does not exist"):
+        TabbedPlotWindow.find_tab("lazy")
+    left.qt.close()
+    assert TabbedPlotWindow.tabs("speed") == []
+
+
+if __name__ == "__main__":
+    test_find_tab_across_windows()
@@ -0,0 +1,36 @@
+import numpy as np
+from abracatabra import TabbedPlotWindow
+
+
+def test_tight_layout_does_not_switch_tabs():
+    window = TabbedPlotWindow(window_id="tight", size=(500, 400))
+    tabs = window.tab_groups[0, 0]
+    for i in range(4):
+        fig = window.add_figure_tab(f"tab {i}", include_toolbar=i % 2 == 0)
+        ax = fig.add_subplot()
+        ax.plot(np.arange(10))
+        ax.set_ylabel("a long label\nover two lines")
+    TabbedPlotWindow.update_all(0.05)
+    changes = []
+    tabs.currentChanged.connect(changes.append)
+    window.apply_tight_layout()
+    assert changes == [] and tabs.currentIndex() == 0
+
+    layouts = []
+    for i in range(4):
+        fig = tabs.get_tab(f"tab {i}").figure
+        layouts.append((fig.get_size_inches().copy(), fig.subplotpars.left))
+    for i in range(1, 4):
+        tabs.setCurrentIndex(i)
+        TabbedPlotWindow.update_all(0.05)
+        widget = tabs.get_tab(f"tab {i}")
+        fig = widget.figure
+        # the inactive figure was laid out at the size it is shown at
+        assert np.allclose(fig.get_size_inches(), layouts[i][0])
+        fig.tight_layout()
+        assert np.isclose(fig.subplotpars.left, layouts[i][1])
+    window.qt.close()
+
+
+if __name__ == "__main__":
+    test_tight_layout_does_not_switch_tabs()
@@ -0,0 +1,62 @@
+import time
+from abracatabra import TabbedPlotWindow
+from abracatabra.frame_scheduler import wait_until
+
+
+def test_update_all_coalesces_fast_requests():
+    window = TabbedPlotWindow(window_id="coalesce", size=(300, 200))
+    window.add_figure_tab("plot").add_subplot()
+    frames = []
+    window.register_animation_callback(frames.append, "plot")
+    TabbedPlotWindow.update_all(0.05)
+
+    TabbedPlotWindow.set_update_coalescing(max_fps=10)
+    try:
+        start = time.perf_counter()
+        for i in range(1, 51):
+            TabbedPlotWindow.update_all(0.0, i)
+        assert time.perf_counter() - start < 0.1  # not throttled by drawing
+        assert frames == [1]  # the rest arrived within one refresh interval
+        wait_until(time.perf_counter() + 0.2)  # the pending update is rendered
+        assert frames == [1, 50]
+
+        window.update(51)
+        window.update(52)
+        TabbedPlotWindow.set_update_coalescing(None)  # renders pending updates
+        assert frames == [1, 50, 51, 52]
+    finally:
+        TabbedPlotWindow.set_update_coalescing(None)
+    TabbedPlotWindow.update_all(0.0, 53)
+    assert frames[-1] == 53
+    window.qt.close()
+
+
+def test_pending_update_does_not_reopen_closed_window():
+    window = TabbedPlotWindow(window_id="coalesce_close", size=(300, 200))
+    window.add_figure_tab("plot").add_subplot()
+    frames = []
+    window.register_animation_callback(frames.append, "plot")
+    TabbedPlotWindow.update_all(0.05)
+    count = TabbedPlotWindow._count
+
+    TabbedPlotWindow.set_update_coalescing(max_fps=5)
+    try:
+        window.update(1)
+        window.update(2)  # pending until the end of the refresh interval
+        window.qt.close()
+        wait_until(time.perf_counter() + 0.4)
+        assert frames == [1]
+        assert not window.qt.isVisible()
+        assert TabbedPlotWindow._count == count - 1
+
+        window.update(3)  # updating a closed window does nothing
+        wait_until(time.perf_counter() + 0.4)
+        assert frames == [1]
+        assert not window.qt.isVisible()
+    finally:
+        TabbedPlotWindow.set_update_coalescing(None)
+
+
+if __name__ == "__main__":
+    test_update_all_coalesces_fast_requests()
+    test_pending_update_does_not_reopen_closed_window()